@@ -0,0 +1,221 @@
+# Gera os arquivos de dados do app com conteúdo sintético (e reprodutível pela semente),
+# para medir as páginas com volumes maiores que os de produção.
+#
+# Uso:
+#   python benchmark/gerar_dados.py PASTA [--escala pequena|media|grande] [--semente 42]
+#                                         [--estagiarios N] [--registros N] ...
+#
+# Os arquivos têm os mesmos nomes e colunas que o app lê (ver servicos.py): Base.xlsx,
+# gestor.xlsx, somar_ideias.xlsx, registros.csv, feedback_gestor_programa.csv,
+# treinamentos.csv e progresso_trilha.npy.
+import argparse
+import os
+import shutil
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from servicos import ( # noqa: E402 (o app não é um pacote instalado)
+    BASE_FILE, COLUNAS_FEEDBACK, COLUNAS_REGISTROS, COLUNAS_TREINAMENTOS, CSV_FEEDBACK, CSV_FILE,
+    ETAPAS_TRILHA, GESTOR_FILE, PLANILHAS_CACHE_DIR, ProgressoTrilha, REGISTROS_ATUAL,
+    REGISTROS_COMPACTADOS, SOMAR_FILE, SQLITE_FILE, TREINAMENTOS_FILE, TRILHA_BITS, TRILHA_FILE,
+    map_status_to_percent
+)
+
+# --- Escalas ---
+ESCALAS = {
+    "pequena": dict(estagiarios=100, registros=10_000, gestores=1_000, feedbacks=300, ideias=200, treinamentos=100),
+    "media": dict(estagiarios=1_000, registros=100_000, gestores=5_000, feedbacks=3_000, ideias=2_000, treinamentos=500),
+    "grande": dict(estagiarios=10_000, registros=1_000_000, gestores=20_000, feedbacks=30_000, ideias=20_000, treinamentos=2_000),
+}
+
+PRIMEIRA_MATRICULA_ESTAGIARIO = 3_000_000
+PRIMEIRA_MATRICULA_GESTOR = 1_000
+UNIDADES = ["Narandiba", "Paraguaçu Paulista"]
+SETORES = [
+    "RECRUTAMENTO SELECAO", "GEOPROCESSAMENTO", "INOVACAO", "COLHEITA MECANIZADA",
+    "PLANEJAMENTO CONTROLE PRODUCAO", "CONTROLADORIA", "MANUTENCAO INDUSTRIAL", "QUALIDADE",
+    "SEGURANCA DO TRABALHO", "TECNOLOGIA DA INFORMACAO", "LOGISTICA", "MEIO AMBIENTE",
+]
+DIRETORIAS = ["DIRETORIA GENTE E GESTAO", "DIRETORIA AGRICOLA", "DIRETORIA INDUSTRIAL", "DIRETORIA FINANCEIRA"]
+PRIMEIROS_NOMES = [
+    "ANA", "BRUNO", "CARLA", "DIEGO", "EDUARDA", "FELIPE", "GABRIELA", "HENRIQUE", "ISABELA", "JOAO",
+    "JULIA", "LEONARDO", "MARIANA", "NICOLAS", "OTAVIO", "PAULA", "RAFAEL", "SABRINA", "TIAGO", "VITORIA",
+    "ALINE", "CAIO", "DEBORAH", "ERICK", "FERNANDA", "GUSTAVO", "HELOISA", "IGOR", "JENYFFER", "LUCAS",
+]
+SOBRENOMES = [
+    "SILVA", "SANTOS", "OLIVEIRA", "SOUZA", "RODRIGUES", "FERREIRA", "ALVES", "PEREIRA", "LIMA", "GOMES",
+    "COSTA", "RIBEIRO", "MARTINS", "CARVALHO", "ALMEIDA", "LOPES", "SOARES", "FERNANDES", "VIEIRA", "BARBOSA",
+    "ROCHA", "DIAS", "NASCIMENTO", "ANDRADE", "MOREIRA", "NUNES", "MARQUES", "MACHADO", "MENDES", "FREITAS",
+    "CARDOSO", "FRANCELINO", "LACERDA", "NOGUEIRA", "CRUZ", "ARAUJO", "MONTEIRO", "MOURA", "CAVALCANTI", "TEIXEIRA",
+]
+AVALIACOES = ["Excelente", "Bom", "Regular", "Ruim"]
+STATUS_PROJETO = ["Iniciado", "Pendente", "Concluído"]
+STATUS_IDEIA = ["IMPLEMENTADA", "EM EXECUÇÃO", "EM ANÁLISE", "REJEITADA"]
+
+# Arquivos derivados que o app gera a partir dos dados (ficariam desatualizados)
+ARQUIVOS_DERIVADOS = [
+    REGISTROS_COMPACTADOS, REGISTROS_ATUAL, TRILHA_FILE, SQLITE_FILE,
+    f"{SQLITE_FILE}-wal", f"{SQLITE_FILE}-shm",
+]
+
+def _nomes(rng, quantidade, truncar=40):
+    """Nomes completos distintos (PRIMEIRO + dois sobrenomes + um índice quando faltam combinações)."""
+    combinacoes = len(PRIMEIROS_NOMES) * len(SOBRENOMES) ** 2
+    escolhidos = rng.permutation(max(quantidade, combinacoes))[:quantidade]
+    primeiro, resto = np.divmod(escolhidos % combinacoes, len(SOBRENOMES) ** 2)
+    meio, ultimo = np.divmod(resto, len(SOBRENOMES))
+    nomes = (pd.Series(np.array(PRIMEIROS_NOMES)[primeiro]) + " " + np.array(SOBRENOMES)[meio]
+             + " " + np.array(SOBRENOMES)[ultimo])
+    repetidos = escolhidos >= combinacoes
+    nomes[repetidos] = nomes[repetidos] + " " + (escolhidos[repetidos] // combinacoes).astype(str)
+    return nomes.str[:truncar] # Como na Base, que corta os nomes em 40 caracteres
+
+def _datas_texto(dias, formato="%d/%m/%Y"):
+    """Datas (datetime64[D]) como texto, formatando cada dia distinto uma só vez."""
+    unicos, posicoes = np.unique(dias, return_inverse=True)
+    return pd.DatetimeIndex(unicos).strftime(formato).to_numpy()[posicoes]
+
+def gerar_base(rng, quantidade, hoje):
+    admissao = hoje - rng.integers(0, 365, quantidade).astype('timedelta64[D]')
+    return pd.DataFrame({
+        'MATRICULA': PRIMEIRA_MATRICULA_ESTAGIARIO + np.arange(quantidade) * 100,
+        'COLABORADOR': _nomes(rng, quantidade),
+        'ADMISSAO': admissao.astype('datetime64[ns]'),
+        'DESCRIÇÃO LOCAL': rng.choice(SETORES, quantidade),
+        'DIRETORIA': rng.choice(DIRETORIAS, quantidade),
+        'UNIDADE': rng.choice(UNIDADES, quantidade),
+        'TERMINO CONTRATO': (admissao + rng.choice([365, 730], quantidade).astype('timedelta64[D]')).astype('datetime64[ns]'),
+    })
+
+def gerar_gestores(rng, quantidade):
+    nomes = _nomes(rng, quantidade, truncar=60)
+    email = nomes.str.split().str[0].str.lower() + (PRIMEIRA_MATRICULA_GESTOR + np.arange(quantidade)).astype(str) + "@cocal.com.br"
+    return pd.DataFrame({
+        'MATRICULA': PRIMEIRA_MATRICULA_GESTOR + np.arange(quantidade),
+        'COLABORADOR': nomes,
+        'DESCRIÇÃO CARGO': rng.choice(["COORDENADOR", "ENCARREGADO", "GERENTE", "SUPERVISOR", "ANALISTA"], quantidade),
+        'DESCRIÇÃO LOCAL': rng.choice(SETORES, quantidade),
+        'EMAIL COMERCIAL': email.where(rng.random(quantidade) < 0.7), # Nem todo funcionário tem e-mail
+        'UNIDADE': "UNIDADE " + pd.Series(rng.choice(UNIDADES, quantidade)).str.upper()
+                   .str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii'),
+    })
+
+def gerar_registros(rng, quantidade, base, hoje):
+    """Log de snapshots em ordem de data: cada projeto aparece, em média, em 4 registros."""
+    projetos_por_estagiario = max(1, quantidade // (len(base) * 4))
+    estagiario = rng.integers(0, len(base), quantidade)
+    dias = np.sort(hoje - rng.integers(0, 365, quantidade).astype('timedelta64[D]'))
+    inicio = dias - rng.integers(0, 60, quantidade).astype('timedelta64[D]')
+    previsao = dias + rng.integers(0, 120, quantidade).astype('timedelta64[D]')
+    status = rng.choice(STATUS_PROJETO, quantidade)
+    setor = base['DESCRIÇÃO LOCAL'].to_numpy()[estagiario]
+    return pd.DataFrame({
+        'Data_Registro': _datas_texto(dias),
+        'Colaborador': base['COLABORADOR'].to_numpy()[estagiario],
+        'Setor': setor,
+        'Categoria_Atividade': setor,
+        'Nome_Projeto': pd.Series(rng.integers(0, projetos_por_estagiario, quantidade)).map("Projeto {}".format),
+        'Data_Inicio_Projeto': _datas_texto(inicio),
+        'Previsao_Conclusao': _datas_texto(previsao),
+        'Status': status,
+        'Percentual_Concluido': pd.Series(status).map(map_status_to_percent),
+        'Observacoes': rng.choice(["", "Aguardando retorno do gestor", "Em andamento", "Revisar dados"], quantidade),
+    })[COLUNAS_REGISTROS]
+
+def gerar_feedbacks(rng, quantidade, base, gestores, hoje):
+    instantes = (np.datetime64(hoje, 's') - rng.integers(0, 365 * 86400, quantidade).astype('timedelta64[s]'))
+    df = pd.DataFrame({
+        'Data_Hora': pd.DatetimeIndex(np.sort(instantes)).strftime("%Y-%m-%d %H:%M:%S"),
+        'Gestor': rng.choice(gestores['COLABORADOR'].to_numpy(), quantidade),
+        'Estagiario': rng.choice(base['COLABORADOR'].to_numpy(), quantidade),
+    })
+    for competencia in ['Iniciativa', 'Aprendizagem', 'Qualidade', 'Relacoes']:
+        df[competencia] = rng.choice(AVALIACOES, quantidade, p=[0.4, 0.35, 0.2, 0.05])
+    df['Feedback_Livre'] = rng.choice(["", "Muito dedicado", "Precisa melhorar a comunicação", "Ótimo trabalho"], quantidade)
+    return df[COLUNAS_FEEDBACK]
+
+def gerar_somar(rng, quantidade, base):
+    # A maior parte das ideias é de estagiários; as demais, de outros funcionários
+    do_estagiario = rng.random(quantidade) < 0.8
+    indice = rng.integers(0, len(base), quantidade)
+    nomes = np.where(do_estagiario, base['COLABORADOR'].to_numpy()[indice], _nomes(rng, quantidade).to_numpy())
+    matriculas = np.where(do_estagiario, base['MATRICULA'].to_numpy()[indice], 5_000_000 + np.arange(quantidade))
+    return pd.DataFrame({
+        'STATUS IDEIA': rng.choice(STATUS_IDEIA, quantidade),
+        'MATRICULARESPONSAVEL': matriculas,
+        'NOME RESPONSAVEL': nomes,
+        'DESCRICAO AREA': rng.choice(SETORES, quantidade),
+        'IDEIAS ENVIADAS': rng.integers(1, 4, quantidade),
+    })
+
+def gerar_treinamentos(rng, quantidade, hoje):
+    """Metade passados e metade nos próximos 6 meses, em horário comercial."""
+    dias = hoje + rng.integers(-180, 180, quantidade).astype('timedelta64[D]')
+    inicio = rng.integers(7, 17, quantidade) * 60 + rng.choice([0, 30], quantidade)
+    duracao = rng.choice([60, 90, 120, 240], quantidade)
+    horario = lambda minutos: pd.Series(minutos // 60).map("{:02d}".format) + ":" + pd.Series(minutos % 60).map("{:02d}:00".format)
+    presencial = rng.random(quantidade) < 0.6
+    return pd.DataFrame({
+        'Nome_Treinamento': rng.choice(["CONHECIMENTO NA FUNÇÃO", "SEGURANÇA", "SOMAR IDEIAS", "INTEGRAÇÃO", "CULTURA COCAL"], quantidade),
+        'Data': _datas_texto(dias),
+        'Inicio': horario(inicio),
+        'Termino': horario(np.minimum(inicio + duracao, 23 * 60)),
+        'Modalidade': np.where(presencial, "Presencial", "Online"),
+        'Local_Link': np.where(presencial, rng.choice(["AGRICOLA", "GENTE E GESTAO", "AUDITORIO", "SALA 2"], quantidade),
+                               pd.Series(np.arange(quantidade)).map("https://meet.google.com/cocal-{}".format)),
+        'Unidade': rng.choice(UNIDADES, quantidade),
+    })[COLUNAS_TREINAMENTOS]
+
+def gerar_trilha(rng, base, hoje):
+    """Cada estagiário concluiu as etapas dos meses já passados, com algumas pendências."""
+    meses = ((hoje - base['ADMISSAO'].to_numpy().astype('datetime64[D]')).astype(int) // 30).clip(0, len(ETAPAS_TRILHA))
+    concluidas = (np.arange(len(ETAPAS_TRILHA)) < meses[:, None]) & (rng.random((len(base), len(ETAPAS_TRILHA))) < 0.85)
+    tabela = pd.DataFrame(concluidas, columns=ETAPAS_TRILHA)
+    tabela.insert(0, 'Matricula', base['MATRICULA'].astype(str))
+    return ProgressoTrilha.de_tabela(tabela)
+
+def gerar(pasta, estagiarios, registros, gestores, feedbacks, ideias, treinamentos, semente=42, hoje=None, mostrar=print):
+    """Grava os sete arquivos de dados em 'pasta' e apaga os derivados que o app geraria deles."""
+    rng = np.random.default_rng(semente)
+    hoje = np.datetime64(hoje or pd.Timestamp.now().date(), 'D')
+    os.makedirs(pasta, exist_ok=True)
+    for derivado in ARQUIVOS_DERIVADOS:
+        if os.path.exists(os.path.join(pasta, derivado)):
+            os.remove(os.path.join(pasta, derivado))
+    shutil.rmtree(os.path.join(pasta, PLANILHAS_CACHE_DIR), ignore_errors=True)
+
+    def gravar(arquivo, gerar_e_salvar):
+        inicio = perf_counter()
+        gerar_e_salvar(os.path.join(pasta, arquivo))
+        mostrar(f"  {arquivo}: {perf_counter() - inicio:.1f} s")
+
+    base = gerar_base(rng, estagiarios, hoje)
+    tabela_gestores = gerar_gestores(rng, gestores)
+    gravar(BASE_FILE, lambda caminho: base.to_excel(caminho, index=False))
+    gravar(GESTOR_FILE, lambda caminho: tabela_gestores.to_excel(caminho, index=False))
+    gravar(SOMAR_FILE, lambda caminho: gerar_somar(rng, ideias, base).to_excel(caminho, index=False))
+    gravar(CSV_FILE, lambda caminho: gerar_registros(rng, registros, base, hoje).to_csv(caminho, index=False, encoding='utf-8'))
+    gravar(CSV_FEEDBACK, lambda caminho: gerar_feedbacks(rng, feedbacks, base, tabela_gestores, hoje).to_csv(caminho, index=False, encoding='utf-8'))
+    gravar(TREINAMENTOS_FILE, lambda caminho: gerar_treinamentos(rng, treinamentos, hoje).to_csv(caminho, index=False, encoding='utf-8'))
+    gravar(TRILHA_BITS, lambda caminho: gerar_trilha(rng, base, hoje).gravar(caminho))
+    return base, tabela_gestores
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos para o benchmark das páginas.")
+    parser.add_argument("pasta", help="Pasta onde os arquivos de dados serão gravados")
+    parser.add_argument("--escala", choices=ESCALAS, default="pequena")
+    parser.add_argument("--semente", type=int, default=42)
+    for nome in ESCALAS["pequena"]:
+        parser.add_argument(f"--{nome}", type=int, help=f"Substitui a quantidade de {nome} da escala")
+    args = parser.parse_args()
+
+    tamanhos = {nome: getattr(args, nome) or padrao for nome, padrao in ESCALAS[args.escala].items()}
+    print(f"Gerando dados ({args.escala}, semente {args.semente}) em {args.pasta}: {tamanhos}")
+    gerar(args.pasta, semente=args.semente, **tamanhos)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# Mede cada página do app com o AppTest do Streamlit sobre dados sintéticos em várias escalas.
+#
+# Uso:
+#   python benchmark/medir_paginas.py [--escalas pequena media grande] [--paginas "Home" ...]
+#                                     [--repeticoes 3] [--backend arquivos|sqlite]
+#                                     [--saida resultados.csv] [--referencia anterior.csv --tolerancia 0.25]
+#
+# Para cada escala, o app (app.py, servicos.py, paginas/, .streamlit/ e imagens) é copiado
+# para uma pasta temporária junto com os dados de gerar_dados.py. Cada página roda num
+# processo próprio: a primeira execução ("fria") encontra os caches do processo vazios,
+# as seguintes ("quentes", em sessões novas) já os encontram prontos. Com --referencia, o
+# script termina com código 1 se alguma página ficar mais lenta ou usar mais memória que
+# a medição anterior além da tolerância (para rodar antes de cada implantação).
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from statistics import median
+from time import perf_counter
+
+import pandas as pd
+
+try:
+    import resource # Pico de memória do processo (Linux/macOS)
+except ImportError:
+    resource = None # Windows: sem medição de memória
+
+PASTA_APP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from gerar_dados import ESCALAS, PRIMEIRA_MATRICULA_ESTAGIARIO, gerar # noqa: E402
+
+ARQUIVOS_APP = ["app.py", "servicos.py", "paginas", ".streamlit", "fundo.jpg", "fundocelular.jpg"]
+SENHAS = {"SENHA_GESTOR": "benchmark", "SENHA_ADMIN": "benchmark"}
+GESTOR = {"MATRICULA": "1000", "COLABORADOR": "GESTOR BENCHMARK", "UNIDADE": "UNIDADE NARANDIBA"}
+
+# Estado de sessão de quem já passou pelo login de cada página
+SESSAO_DAS_PAGINAS = {
+    "Home": {},
+    "Página do Estagiário": {"matricula_digitada": str(PRIMEIRA_MATRICULA_ESTAGIARIO)},
+    "Treinamentos": {},
+    "Painel de Indicadores": {"gestor_autenticado": True, "dados_gestor": GESTOR},
+    "Avaliação do Gestor": {"gestor_autenticado": True, "dados_gestor": GESTOR},
+    "Administração": {"admin_autenticado": True},
+}
+MEDIDAS = ['fria_s', 'quente_s', 'pico_mb']
+
+def _pico_memoria_mb():
+    if resource is None:
+        return float('nan')
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 1024 / 1024 if sys.platform == 'darwin' else pico / 1024 # bytes no macOS, KB no Linux
+
+def _executar_pagina(pagina, arquivo, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.abspath("app.py"), default_timeout=timeout) # app copiado para a pasta atual
+    for chave, valor in SENHAS.items():
+        at.secrets[chave] = valor
+    at.switch_page(arquivo)
+    for chave, valor in SESSAO_DAS_PAGINAS[pagina].items():
+        at.session_state[chave] = valor
+    inicio = perf_counter()
+    at.run()
+    segundos = perf_counter() - inicio
+    erros = [str(e.value) for e in at.exception] # st.error faz parte das páginas (ex.: etapas vencidas)
+    return segundos, erros
+
+def medir_pagina(pasta, pagina, repeticoes, timeout):
+    """Roda no processo filho (já dentro de 'pasta') e devolve as medidas da página."""
+    os.chdir(pasta)
+    sys.path.insert(0, pasta)
+    from servicos import PAGINAS
+
+    memoria_inicial = _pico_memoria_mb() # Python + Streamlit + pandas já importados
+    fria, erros = _executar_pagina(pagina, PAGINAS[pagina], timeout)
+    quentes = [_executar_pagina(pagina, PAGINAS[pagina], timeout)[0] for _ in range(repeticoes)]
+    return {
+        'fria_s': fria,
+        'quente_s': median(quentes) if quentes else float('nan'),
+        'pico_mb': _pico_memoria_mb() - memoria_inicial,
+        'rss_mb': _pico_memoria_mb(),
+        'erros': " | ".join(erros)[:300],
+    }
+
+def preparar_pasta(escala, semente, pasta_base):
+    pasta = os.path.join(pasta_base, escala)
+    os.makedirs(pasta, exist_ok=True)
+    for arquivo in ARQUIVOS_APP:
+        origem = os.path.join(PASTA_APP, arquivo)
+        if os.path.isdir(origem):
+            shutil.copytree(origem, os.path.join(pasta, arquivo), dirs_exist_ok=True,
+                            ignore=shutil.ignore_patterns("__pycache__"))
+        elif os.path.exists(origem):
+            shutil.copy2(origem, pasta)
+    gerar(pasta, semente=semente, mostrar=lambda texto: print(texto, flush=True), **ESCALAS[escala])
+    return pasta
+
+def medir(escalas, paginas, repeticoes, backend, semente, timeout, pasta_base):
+    resultados = []
+    ambiente = dict(os.environ, BACKEND_DADOS=backend)
+    for escala in escalas:
+        print(f"== Escala {escala}: {ESCALAS[escala]}", flush=True)
+        pasta = preparar_pasta(escala, semente, pasta_base)
+        for pagina in paginas:
+            processo = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--medir", pagina, "--pasta", pasta,
+                 "--repeticoes", str(repeticoes), "--timeout", str(timeout)],
+                capture_output=True, text=True, env=ambiente,
+            )
+            linhas = [linha for linha in processo.stdout.splitlines() if linha.startswith("{")]
+            if processo.returncode != 0 or not linhas:
+                medidas = {medida: float('nan') for medida in MEDIDAS}
+                medidas['erros'] = (processo.stderr.strip().splitlines() or ["sem saída"])[-1][:300]
+            else:
+                medidas = json.loads(linhas[-1])
+            resultados.append({'escala': escala, 'backend': backend, 'pagina': pagina, **medidas})
+            print(f"  {pagina}: fria {medidas['fria_s']:.2f} s, quente {medidas['quente_s']:.2f} s, "
+                  f"pico +{medidas['pico_mb']:.0f} MB{' ERRO: ' + medidas['erros'] if medidas['erros'] else ''}", flush=True)
+    return pd.DataFrame(resultados)
+
+def comparar(resultados, referencia, tolerancia):
+    """Linhas em que alguma medida passou da referência em mais que 'tolerancia' (fração)."""
+    juntos = resultados.merge(referencia, on=['escala', 'backend', 'pagina'], suffixes=('', '_ref'))
+    regressoes = []
+    for _, linha in juntos.iterrows():
+        for medida in MEDIDAS:
+            atual, anterior = linha[medida], linha[f'{medida}_ref']
+            if pd.notna(atual) and pd.notna(anterior) and anterior > 0 and atual > anterior * (1 + tolerancia):
+                regressoes.append(f"{linha['escala']} / {linha['pagina']}: {medida} {anterior:.2f} -> {atual:.2f} "
+                                  f"(+{(atual / anterior - 1) * 100:.0f}%)")
+    return regressoes
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das páginas com dados sintéticos (AppTest).")
+    parser.add_argument("--escalas", nargs="+", choices=ESCALAS, default=["pequena"])
+    parser.add_argument("--paginas", nargs="+", choices=SESSAO_DAS_PAGINAS, default=list(SESSAO_DAS_PAGINAS))
+    parser.add_argument("--repeticoes", type=int, default=3, help="Execuções quentes por página (vale a mediana)")
+    parser.add_argument("--backend", choices=["arquivos", "sqlite"], default="arquivos")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=600, help="Tempo máximo de uma execução da página (s)")
+    parser.add_argument("--pasta", help="Pasta de trabalho (padrão: temporária, apagada no fim)")
+    parser.add_argument("--saida", help="Grava os resultados em CSV")
+    parser.add_argument("--referencia", help="CSV de uma medição anterior para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Aumento aceito em relação à referência (0.25 = 25%%)")
+    parser.add_argument("--medir", help=argparse.SUPPRESS) # Uso interno: processo filho de uma página
+    args = parser.parse_args()
+
+    if args.medir:
+        print(json.dumps(medir_pagina(args.pasta, args.medir, args.repeticoes, args.timeout)))
+        return
+
+    pasta_base = args.pasta or tempfile.mkdtemp(prefix="benchmark_estagio_")
+    try:
+        resultados = medir(args.escalas, args.paginas, args.repeticoes, args.backend, args.semente, args.timeout, pasta_base)
+    finally:
+        if not args.pasta:
+            shutil.rmtree(pasta_base, ignore_errors=True)
+
+    print()
+    print(resultados.to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+    if args.saida:
+        resultados.to_csv(args.saida, index=False)
+    if args.referencia:
+        referencia = pd.read_csv(args.referencia, keep_default_na=False, na_values=[''])
+        sem_referencia = resultados.merge(referencia, on=['escala', 'backend', 'pagina'], how='left', indicator=True)
+        for _, linha in sem_referencia[sem_referencia['_merge'] == 'left_only'].iterrows():
+            print(f"Sem referência para {linha['escala']} / {linha['backend']} / {linha['pagina']}.")
+        regressoes = comparar(resultados, referencia, args.tolerancia)
+        if regressoes:
+            print(f"\nRegressões acima de {args.tolerancia:.0%}:")
+            for regressao in regressoes:
+                print(f"  {regressao}")
+            sys.exit(1)
+        print(f"\nSem regressões acima de {args.tolerancia:.0%} em relação a {args.referencia}.")
+    if resultados['erros'].astype(bool).any():
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+# ========= ADMIN (ATUALIZADO COM GESTÃO DE TRILHA) =========
+import streamlit as st
+import pandas as pd
+from datetime import datetime, time
+from time import perf_counter
+
+from servicos import (
+    ACCESS_PASSWORD, alteracoes_do_editor, anexar_treinamento, cache_de_graficos, chave_do_editor, COLUNAS_REGISTROS,
+    COLUNAS_TREINAMENTOS, COLUNAS_TRILHA, ConflitoDeEdicao, conflitos_da_edicao_treinamentos,
+    conflitos_do_novo_treinamento, consultar_pagina_admin, CSV_FEEDBACK, CSV_FILE, DadosDaPagina,
+    delete_all_data, descartar_edicoes, exportar_trilha_csv, FILTROS_ADMIN, LINHAS_POR_PAGINA_ADMIN,
+    marcar_etapa_trilha, mudar_pagina, pagina_do_editor, prazos_da_trilha, registrar_tempo_carga,
+    salvar_alteracoes_admin, tempos_de_carga, TRILHA_FILE, TRILHA_MESES
+)
+
+dados = DadosDaPagina("Administração") # Dados carregados sob demanda por esta página
+
+UNIDADES_TREINAMENTO = ["Narandiba", "Paraguaçu Paulista", "NRD", "PPT"]
+
+# --- FILTROS E PAGINAÇÃO DOS EDITORES ---
+# Cada editor mostra só uma página das linhas filtradas; o filtro e o corte da página
+# são feitos em consultar_pagina_admin (no banco, com SQLite).
+def filtros_da_secao(chave, tabela):
+    """Widgets de filtro de uma seção (estagiário, unidade, período, status)."""
+    disponiveis = FILTROS_ADMIN[tabela]
+    filtros = {}
+    col_estagiario, col_unidade, col_periodo, col_status = st.columns(4)
+    if "estagiario" in disponiveis:
+        estagiarios = sorted(dados.base['COLABORADOR'].dropna().unique().tolist())
+        escolha = col_estagiario.selectbox("Estagiário", ["Todos"] + estagiarios, key=f"filtro_estagiario_{chave}")
+        filtros["estagiario"] = None if escolha == "Todos" else escolha
+    unidades = sorted(set(dados.base['UNIDADE'].dropna()) | set(UNIDADES_TREINAMENTO))
+    escolha = col_unidade.selectbox("Unidade", ["Todas"] + unidades, key=f"filtro_unidade_{chave}")
+    filtros["unidade"] = None if escolha == "Todas" else escolha
+    if "data" in disponiveis:
+        periodo = col_periodo.date_input("Período", value=(), format="DD/MM/YYYY", key=f"filtro_periodo_{chave}")
+        filtros["data_inicio"] = periodo[0] if len(periodo) > 0 else None
+        filtros["data_fim"] = periodo[1] if len(periodo) > 1 else None
+    if "status" in disponiveis:
+        escolha = col_status.selectbox("Status", ["Todos", "Iniciado", "Pendente", "Concluído"], key=f"filtro_status_{chave}")
+        filtros["status"] = None if escolha == "Todos" else escolha
+    return filtros
+
+def pagina_da_secao(chave, tabela, filtros):
+    """Linhas da página atual (cópia, indexada pelo id) e o seletor de página."""
+    chave_pagina = f"pagina_{chave}"
+
+    def consultar():
+        pagina = st.session_state.get(chave_pagina, 1)
+        inicio = perf_counter()
+        df, total = consultar_pagina_admin(tabela, filtros, pagina)
+        paginas = max(1, -(-total // LINHAS_POR_PAGINA_ADMIN))
+        if pagina > paginas: # Os filtros diminuíram o total de páginas
+            pagina = st.session_state[chave_pagina] = paginas
+            df, total = consultar_pagina_admin(tabela, filtros, pagina)
+        registrar_tempo_carga("Administração", f"{tabela} (página)", perf_counter() - inicio)
+        return df, total, pagina, paginas
+
+    # Com edições pendentes a página fica fixa (o delta do editor é posicional)
+    df, total, pagina, paginas = pagina_do_editor(chave, (filtros, st.session_state.get(chave_pagina, 1)), consultar)
+
+    col_pagina, col_total = st.columns([1, 3])
+    col_pagina.number_input("Página", min_value=1, max_value=paginas, step=1, key=chave_pagina)
+    col_total.caption(f"{total} linha(s) encontrada(s) • página {pagina} de {paginas} • {LINHAS_POR_PAGINA_ADMIN} por página")
+    return df.copy()
+
+def avisar_conflitos(titulo, conflitos):
+    st.error(f"⚠️ {titulo}\n" + "\n".join(f"- {conflito}" for conflito in conflitos))
+
+def gravar_editor(chave, tabela, original, editada, colunas, mensagem, validar=None):
+    """Grava só o delta do editor; se outra sessão mudou as mesmas linhas, nada é gravado.
+
+    'validar(alteracoes)' pode devolver problemas que impedem a gravação (as edições continuam no editor).
+    """
+    alteracoes = alteracoes_do_editor(chave, original, editada, colunas)
+    problemas = validar(alteracoes) if validar else []
+    if problemas:
+        avisar_conflitos("Nada foi gravado. Corrija os horários ou marque a opção para salvar mesmo assim:", problemas)
+        return
+    try:
+        salvar_alteracoes_admin(tabela, alteracoes)
+    except ConflitoDeEdicao as e:
+        descartar_edicoes(chave)
+        st.error(f"⚠️ {e} Nada foi gravado: refaça suas alterações sobre os dados atualizados.")
+        st.button("🔄 Recarregar dados", key=f"recarregar_{chave}")
+        return
+    descartar_edicoes(chave)
+    st.success(mensagem)
+    st.rerun()
+
+if st.button("🏠 Voltar para Home"):
+    mudar_pagina("Home")
+
+st.title("🔒 Administração de Dados")
+st.markdown("---")
+
+# --- ATUALIZADO: Login com st.form ---
+if "admin_autenticado" not in st.session_state:
+    st.session_state.admin_autenticado = False
+
+if not st.session_state.admin_autenticado:
+    with st.form(key="admin_login_form"):
+        password_input = st.text_input("Digite a senha de administrador:", type="password")
+        admin_entrar = st.form_submit_button("Entrar")
+
+    if admin_entrar:
+        if password_input == ACCESS_PASSWORD:
+            st.session_state.admin_autenticado = True
+            st.rerun()
+        else:
+            st.error("Senha incorreta. Acesso Negado.")
+
+if st.session_state.admin_autenticado:
+    st.success("Acesso Concedido!")
+
+    # --- SEÇÃO DE GESTÃO DE TREINAMENTOS (ATUALIZADA) ---
+    st.markdown("## 🗓️ Gestão de Treinamentos")
+    with st.expander("Cadastrar Novo Treinamento"):
+        with st.form("form_novo_treinamento"):
+            st.subheader("Preencha os dados do treinamento:")
+            col1, col2 = st.columns(2)
+            with col1:
+                nome_treinamento = st.text_input("Nome do Treinamento")
+                # CORRIGIDO: Adicionado format="DD/MM/YYYY"
+                data_treinamento = st.date_input("Data do Treinamento", datetime.now(), format="DD/MM/YYYY")
+                modalidade = st.selectbox("Modalidade", ["Presencial", "Online"])
+            with col2:
+                # ATUALIZADO: Adicionado campo Unidade
+                unidade_treinamento = st.selectbox("Unidade", UNIDADES_TREINAMENTO) # Adicionado NRD/PPT
+                local_link = st.text_input("Local (para Presencial) ou Link (para Online)")
+                hora_inicio = st.time_input("Horário de Início", time(9, 0))
+                hora_termino = st.time_input("Horário de Término", time(10, 0))
+
+            ignorar_conflitos = st.checkbox("Salvar mesmo com conflito de horário (mesma unidade ou mesmo local)")
+            enviar_treinamento = st.form_submit_button("💾 Salvar Treinamento")
+
+            if enviar_treinamento:
+                if not nome_treinamento:
+                    st.warning("Por favor, preencha o Nome do Treinamento.")
+                else:
+                    nova_linha_treinamento = pd.DataFrame([{
+                        'Nome_Treinamento': nome_treinamento,
+                        'Data': data_treinamento.strftime('%d/%m/%Y'),
+                        'Inicio': hora_inicio.strftime('%H:%M:%S'),
+                        'Termino': hora_termino.strftime('%H:%M:%S'),
+                        'Modalidade': modalidade,
+                        'Local_Link': local_link,
+                        'Unidade': unidade_treinamento # Salvar novo campo
+                    }])
+                    conflitos = [] if ignorar_conflitos else conflitos_do_novo_treinamento(nova_linha_treinamento)
+                    if conflitos:
+                        avisar_conflitos("Treinamento não salvo: conflito de horário.", conflitos)
+                    else:
+                        anexar_treinamento(nova_linha_treinamento)
+                        st.success(f"✅ Treinamento '{nome_treinamento}' salvo!")
+                        st.rerun()
+
+    st.info("Aqui você pode editar ou apagar treinamentos já cadastrados.")
+
+    filtros_trein = filtros_da_secao("treinamentos", "treinamentos")
+    df_treinamentos_admin = pagina_da_secao("edit_treinamentos_df", "treinamentos", filtros_trein)
+    df_treinamentos_admin.insert(0, 'Deletar', False)
+
+    edited_df_treinamentos = st.data_editor(
+        df_treinamentos_admin.reset_index(drop=True), # Índice 0..n-1: o id da linha não aparece na tela
+        key=chave_do_editor("edit_treinamentos_df"),
+        use_container_width=True,
+        column_config={
+            "Deletar": st.column_config.CheckboxColumn("Deletar?"),
+            "Data": st.column_config.DateColumn("Data", format="DD/MM/YYYY"),
+            "Inicio": st.column_config.TimeColumn("Início", format="HH:mm"),
+            "Termino": st.column_config.TimeColumn("Término", format="HH:mm"),
+            "Modalidade": st.column_config.SelectboxColumn("Modalidade", options=["Presencial", "Online"]),
+            "Local_Link": st.column_config.TextColumn("Local / Link"),
+            # ATUALIZADO: Adicionada config da coluna Unidade
+            "Unidade": st.column_config.SelectboxColumn("Unidade", options=UNIDADES_TREINAMENTO, required=True)
+        },
+        hide_index=True,
+        num_rows="dynamic"
+    )
+
+    ignorar_conflitos_edicao = st.checkbox("Salvar mesmo com conflito de horário", key="ignorar_conflitos_treinamentos")
+    if st.button("Salvar Alterações nos Treinamentos"):
+        try:
+            # O calendário inteiro, já com as edições, é conferido antes de gravar
+            gravar_editor("edit_treinamentos_df", "treinamentos", df_treinamentos_admin, edited_df_treinamentos,
+                          COLUNAS_TREINAMENTOS, "✅ Treinamentos atualizados com sucesso!",
+                          validar=None if ignorar_conflitos_edicao else conflitos_da_edicao_treinamentos)
+        except Exception as e:
+            st.error(f"Erro ao salvar treinamentos: {e}")
+
+    st.markdown("---") # Divisor
+
+    # --- SEÇÃO DE GESTÃO DA TRILHA ---
+    st.markdown("## 🧭 Gestão da Trilha de Desenvolvimento")
+
+    # --- AÇÕES EM LOTE ---
+    st.subheader("Ações em Lote")
+    st.markdown("Use esta seção para marcar ou desmarcar uma etapa para **todos** os estagiários de uma vez.")
+
+    trilha_mapa_reverso = {v: k for k, v in TRILHA_MESES.items()}
+
+    col1, col2, col3 = st.columns([2, 1, 1]) # ATUALIZADO PARA 3 COLUNAS
+
+    with col1:
+        mes_selecionado = st.selectbox("Selecione a etapa para a ação em lote:", options=TRILHA_MESES.values())
+
+    def marcar_lote_csv():
+        try:
+            mes_key = trilha_mapa_reverso[mes_selecionado] 
+            marcar_etapa_trilha(mes_key, True) # Set to TRUE
+            st.success(f"Etapa '{mes_selecionado}' marcada como CONCLUÍDA para todos!")
+        except Exception as e:
+            st.error(f"Erro ao salvar ação em lote: {e}")
+
+    # --- NOVA FUNÇÃO "DESMARCAR TODOS" ---
+    def desmarcar_lote_csv():
+        try:
+            mes_key = trilha_mapa_reverso[mes_selecionado] 
+            marcar_etapa_trilha(mes_key, False) # Set to FALSE
+            st.success(f"Etapa '{mes_selecionado}' marcada como PENDENTE para todos!")
+        except Exception as e:
+            st.error(f"Erro ao salvar ação em lote: {e}")
+
+    with col2:
+        st.button("Marcar Todos (Concluído)", on_click=marcar_lote_csv, use_container_width=True, type="primary")
+
+    with col3:
+        st.button("Desmarcar Todos (Pendente)", on_click=desmarcar_lote_csv, use_container_width=True, type="secondary") # NOVO BOTÃO
+
+    st.divider()
+    # --- FIM AÇÕES EM LOTE ---
+
+    # --- PRAZOS DA TRILHA (TODOS OS ESTAGIÁRIOS) ---
+    st.subheader("Prazos da Trilha")
+    dias_prazo = st.number_input("Mostrar também as etapas que vencem nos próximos (dias):", min_value=0, max_value=365, value=30, step=5)
+    config_prazos = {
+        "COLABORADOR": "Estagiário", "UNIDADE": "Unidade",
+        "Prazo": st.column_config.DateColumn("Prazo", format="DD/MM/YYYY"),
+    }
+    try:
+        df_atrasadas, df_a_vencer = prazos_da_trilha(int(dias_prazo))
+        if df_atrasadas.empty:
+            st.success("Nenhuma etapa da trilha está com o prazo vencido. 🎉")
+        else:
+            st.warning(f"{len(df_atrasadas)} etapa(s) pendente(s) com prazo vencido em {df_atrasadas['Matricula'].nunique()} estagiário(s).")
+            df_atrasadas['Etapa'] = df_atrasadas['Mes'].map(TRILHA_MESES)
+            st.dataframe(df_atrasadas[['COLABORADOR', 'UNIDADE', 'Etapa', 'Prazo']],
+                         use_container_width=True, hide_index=True, column_config=config_prazos)
+        
+        st.markdown(f"**A vencer nos próximos {int(dias_prazo)} dia(s):** {len(df_a_vencer)} etapa(s)")
+        if not df_a_vencer.empty:
+            df_a_vencer['Etapa'] = df_a_vencer['Mes'].map(TRILHA_MESES)
+            st.dataframe(df_a_vencer[['COLABORADOR', 'UNIDADE', 'Etapa', 'Prazo']],
+                         use_container_width=True, hide_index=True, column_config=config_prazos)
+    except Exception as e:
+        st.error(f"Erro ao calcular os prazos da trilha: {e}")
+
+    st.divider()
+
+
+    st.info("Aqui você pode marcar as etapas concluídas individualmente.")
+
+    try:
+        filtros_trilha = filtros_da_secao("trilha", "trilha")
+        df_trilha_display = pagina_da_secao("edit_trilha_df", "trilha", filtros_trilha)
+
+        edited_df_trilha = st.data_editor(
+            df_trilha_display,
+            key=chave_do_editor("edit_trilha_df"),
+            use_container_width=True,
+            disabled=['COLABORADOR', 'UNIDADE'],
+            column_config={
+                "COLABORADOR": "Estagiário",
+                "UNIDADE": "Unidade",
+                "Mes_1": st.column_config.CheckboxColumn(TRILHA_MESES['Mes_1']),
+                "Mes_2": st.column_config.CheckboxColumn(TRILHA_MESES['Mes_2']),
+                "Mes_3": st.column_config.CheckboxColumn(TRILHA_MESES['Mes_3']),
+                "Mes_4": st.column_config.CheckboxColumn(TRILHA_MESES['Mes_4']),
+                "Mes_5": st.column_config.CheckboxColumn(TRILHA_MESES['Mes_5']),
+                "Mes_6": st.column_config.CheckboxColumn(TRILHA_MESES['Mes_6']),
+            },
+            hide_index=True
+        )
+
+        if st.button("Salvar Progresso das Trilhas"):
+            gravar_editor("edit_trilha_df", "trilha", df_trilha_display, edited_df_trilha,
+                          COLUNAS_TRILHA[1:], "✅ Progresso das trilhas foi salvo!")
+        # O CSV só é gerado quando alguém clica (o progresso fica gravado como máscara de bits)
+        st.download_button("⬇️ Exportar Progresso (CSV)", data=exportar_trilha_csv, file_name=TRILHA_FILE,
+                           mime="text/csv", on_click="ignore")
+
+    except Exception as e:
+        st.error(f"Erro ao carregar o editor de trilhas: {e}")
+
+    st.markdown("---") # Divisor
+
+    # --- SEÇÃO DE EDIÇÃO DE FEEDBACKS ---
+    st.markdown("## ✏️ Editar / Apagar Feedbacks dos Gestores")
+    st.info(f"Aqui você pode editar ou apagar linhas do arquivo '{CSV_FEEDBACK}'.")
+
+    try:
+        filtros_feed = filtros_da_secao("feedback", "feedback")
+        df_feed = pagina_da_secao("edit_feedback_df", "feedback", filtros_feed)
+    except Exception as e:
+        st.error(f"Erro ao carregar o editor de feedbacks: {e}")
+        df_feed = pd.DataFrame()
+
+    if not df_feed.empty:
+        try:
+            df_feed.insert(0, 'Deletar', False)
+            cols_feed = [col for col in df_feed.columns if col != 'Deletar']
+
+            edited_df_feed = st.data_editor(
+                df_feed.reset_index(drop=True),
+                key=chave_do_editor("edit_feedback_df"),
+                use_container_width=True,
+                disabled=['Data_Hora', 'Gestor', 'Estagiario'],
+                column_config={"Deletar": st.column_config.CheckboxColumn("Deletar?",default=False)},
+                hide_index=True,
+                num_rows="dynamic"
+            )
+
+            if st.button("Salvar Feedbacks e Apagar Selecionados"):
+                try:
+                    gravar_editor("edit_feedback_df", "feedback", df_feed, edited_df_feed,
+                                  cols_feed, "✅ Feedbacks atualizados com sucesso!")
+                except Exception as e:
+                    st.error(f"Erro ao salvar o arquivo de feedbacks: {e}")
+
+        except Exception as e:
+            st.error(f"Erro ao carregar o editor de feedbacks: {e}")
+    else:
+        st.warning("Nenhum feedback para editar com os filtros atuais.")
+
+
+    # --- SEÇÃO: EDIÇÃO DE ATIVIDADES ---
+    st.markdown("---")
+    st.markdown("## ✏️ Editar / Apagar Atividades dos Estagiários")
+    st.info(f"Aqui você pode editar ou apagar linhas do arquivo de atividades '{CSV_FILE}'.")
+
+    try:
+        filtros_ativ = filtros_da_secao("atividades", "registros")
+        df_atividades = pagina_da_secao("edit_atividades_df", "registros", filtros_ativ) # Datas já convertidas
+    except Exception as e:
+        st.error(f"Erro ao carregar o editor de atividades: {e}")
+        df_atividades = pd.DataFrame()
+
+    if not df_atividades.empty:
+        try:
+            df_atividades.insert(0, 'Deletar', False)
+
+            edited_df_atividades = st.data_editor(
+                df_atividades.reset_index(drop=True),
+                key=chave_do_editor("edit_atividades_df"),
+                use_container_width=True,
+                column_config={
+                    "Deletar": st.column_config.CheckboxColumn("Deletar?", default=False),
+                    "Data_Registro": st.column_config.DateColumn("Registro", format="DD/MM/YYYY", disabled=True),
+                    "Colaborador": st.column_config.Column(disabled=True),
+                    "Setor": st.column_config.Column(disabled=True),
+                    "Data_Inicio_Projeto": st.column_config.DateColumn("Início", format="DD/MM/YYYY"),
+                    "Previsao_Conclusao": st.column_config.DateColumn("Previsão", format="DD/MM/YYYY"),
+                    "Percentual_Concluido": st.column_config.NumberColumn("%", format="%d%%"), 
+                    "Status": st.column_config.SelectboxColumn("Status", options=["Iniciado", "Pendente", "Concluído"]) 
+                },
+                hide_index=True,
+                num_rows="dynamic" 
+            )
+
+            if st.button("Salvar Atividades e Apagar Selecionadas"):
+                try:
+                    # Edições do estado atual viram novos snapshots; remoções e correções do histórico reescrevem a compactação
+                    gravar_editor("edit_atividades_df", "registros", df_atividades, edited_df_atividades,
+                                  COLUNAS_REGISTROS, "✅ Registros de atividades atualizados com sucesso!")
+                except Exception as e:
+                    st.error(f"Erro ao salvar o arquivo de atividades: {e}")
+
+        except Exception as e:
+            st.error(f"Erro ao carregar o editor de atividades: {e}")
+    else:
+        st.warning(f"Nenhuma atividade em '{CSV_FILE}' com os filtros atuais.")
+
+
+    # --- SEÇÃO: TEMPOS DE CARREGAMENTO ---
+    st.markdown("---")
+    with st.expander("⏱️ Tempos de carregamento dos dados por página"):
+        st.caption("Medidos desde o início do servidor. Cargas vindas do cache aparecem com poucos milissegundos.")
+        st.dataframe(tempos_de_carga(), use_container_width=True, hide_index=True,
+                     column_config={col: st.column_config.NumberColumn(format="%.1f")
+                                    for col in ['Média (ms)', 'Máximo (ms)', 'Última (ms)']})
+        graficos = cache_de_graficos().resumo()
+        st.caption(f"Cache de gráficos do Painel de Indicadores: {graficos['graficos']} gráfico(s), "
+                   f"{graficos['tamanho'] / 1024:.0f} KB de {graficos['limite'] / 1024 / 1024:.0f} MB, "
+                   f"{graficos['acertos']} acerto(s) e {graficos['faltas']} montagem(ns).")
+
+    # --- SEÇÃO DE APAGAR TUDO (ZONA DE PERIGO) ---
+    st.markdown("---")
+    st.markdown("## 🗑️ Zona de Perigo - Apagar *Todos* os Registros")
+    st.warning("⚠️ Esta ação não pode ser desfeita e apaga *todos* os registros de atividades de uma vez.")
+
+    st.button("APAGAR TODOS OS REGISTROS DE ATIVIDADES", 
+              on_click=delete_all_data, 
+              type="primary", 
+              use_container_width=True,
+              key="delete_all_atividades_btn")
+
+# Este else pertence ao 'if password_input == ACCESS_PASSWORD:'
+elif password_input:
+    st.error("Senha incorreta. Acesso Negado.")
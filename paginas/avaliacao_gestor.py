@@ -0,0 +1,81 @@
+# ========= NOVA PÁGINA: AVALIAÇÃO DO GESTOR =========
+import streamlit as st
+from datetime import datetime
+
+from servicos import (
+    anexar_feedback, DadosDaPagina, login_gestor, mudar_pagina
+)
+
+dados = DadosDaPagina("Avaliação do Gestor") # Dados carregados sob demanda por esta página
+
+if st.button("🏠 Voltar para Home"):
+    mudar_pagina("Home")
+
+st.title("💬 Avaliação do Gestor")
+st.markdown("---")
+
+if "gestor_autenticado" not in st.session_state:
+    st.session_state.gestor_autenticado = False
+if "dados_gestor" not in st.session_state:
+    st.session_state.dados_gestor = None
+
+if not st.session_state.gestor_autenticado:
+    login_gestor("gestor_login_avaliacao_form")
+
+if st.session_state.gestor_autenticado:
+    gestor = st.session_state.dados_gestor
+    unidade_gestor = gestor.get('UNIDADE', '') 
+    st.markdown(f"👤 **Gestor:** {gestor.get('COLABORADOR', '')} **({unidade_gestor})**")
+    st.divider()
+
+    try:
+        base_estagiarios = dados.base.copy() # Usar a base já lida
+        estagiarios = sorted(base_estagiarios["COLABORADOR"].dropna().unique().tolist())
+    except Exception as e:
+        st.warning(f"Não foi possível carregar base de estagiários: {e}")
+        estagiarios = []
+
+    with st.form("form_feedback"):
+        st.subheader("Selecione o estagiário avaliado:")
+        estagiario_fb = st.selectbox("Estagiário:", estagiarios, key="fb_estagiario")
+
+        st.markdown("### 1️⃣ Iniciativa e Proatividade")
+        iniciativa = st.radio(
+            "O estagiário demonstra iniciativa para buscar tarefas, sugerir melhorias e resolver problemas de forma autônoma?",
+            ["Excelente", "Bom", "Regular", "Ruim"],
+            horizontal=True, key="fb_1")
+        st.markdown("### 2️⃣ Capacidade de Aprendizagem e Adaptação")
+        aprendizagem = st.radio(
+            "Com que rapidez o estagiário absorve novos conhecimentos e se adapta a mudanças na rotina?",
+            ["Excelente", "Bom", "Regular", "Ruim"],
+            horizontal=True, key="fb_2")
+        st.markdown("### 3️⃣ Qualidade e Entrega das Atividades")
+        qualidade = st.radio(
+            "Qual o nível de precisão, atenção aos detalhes e cumprimento dos prazos nas tarefas atribuídas?",
+            ["Excelente", "Bom", "Regular", "Ruim"],
+            horizontal=True, key="fb_3")
+        st.markdown("### 4️⃣ Relações Interpessoais e Feedback")
+        relacoes = st.radio(
+            "O estagiário se comunica de forma clara, trabalha bem em equipe e aplica feedbacks recebidos?",
+            ["Excelente", "Bom", "Regular", "Ruim"],
+            horizontal=True, key="fb_4")
+        st.markdown("### 5️⃣ Registre seu feedback sobre o estagiário:")
+        sugestao = st.text_area("Escreva aqui o feedback livre:", key="fb_sugestao")
+        enviar = st.form_submit_button("💾 Enviar Feedback")
+
+        if enviar:
+            if not estagiario_fb:
+                st.warning("Por favor, selecione um estagiário.")
+            else:
+                data_hora = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                anexar_feedback({
+                    'Data_Hora': data_hora,
+                    'Gestor': gestor.get('COLABORADOR',''),
+                    'Estagiario': estagiario_fb,
+                    'Iniciativa': iniciativa,
+                    'Aprendizagem': aprendizagem,
+                    'Qualidade': qualidade,
+                    'Relacoes': relacoes,
+                    'Feedback_Livre': sugestao
+                })
+                st.success("✅ Feedback registrado com sucesso!")
@@ -0,0 +1,340 @@
+# ========= PÁGINA DO ESTAGIÁRIO (REGISTRO + TRILHA + FEEDBACKS) =========
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from datetime import datetime
+
+from servicos import (
+    alteracoes_do_editor, anexar_registros, atualizar_projetos, BASE_FILE, botoes_agenda_ics, buscar_estagiario,
+    carregar_feedback, carregar_treinamentos, chave_do_editor, ConflitoDeEdicao, DadosDaPagina,
+    descartar_edicoes, diretorio_estagiarios, map_status_to_percent, mudar_pagina, pagina_do_editor, projetos_do_estagiario,
+    trilha_do_estagiario, TRILHA_MESES
+)
+
+dados = DadosDaPagina("Página do Estagiário") # Dados carregados sob demanda por esta página
+
+# --- SEÇÕES DA PÁGINA ---
+# Cada seção numerada é um st.fragment: um clique ou edição dentro dela só reexecuta
+# a própria seção. Os dados vêm dos serviços cacheados, então a execução completa
+# (só pedida depois de gravar algo que outra seção mostra) também é barata.
+
+@st.fragment
+def secao_proximos_treinamentos(unidade):
+    st.subheader(f"🔔 Próximos Treinamentos ({unidade})")
+
+    hoje = datetime.now().date()
+    # Filtra treinamentos futuros E pela unidade do estagiário
+    df_treinamentos_filtrados = carregar_treinamentos(unidade=unidade, a_partir_de=hoje) # Já em ordem de data
+
+    if df_treinamentos_filtrados.empty:
+        st.info(f"Nenhum treinamento agendado para sua unidade ({unidade}) no momento.")
+    else:
+        st.warning("Você tem treinamentos agendados! Veja abaixo:")
+
+        for idx, row in df_treinamentos_filtrados.iterrows():
+            with st.container(border=True):
+                st.subheader(f"📍 {row['Nome_Treinamento']}")
+                st.caption(f"**🗓️ Data:** {row['Data'].strftime('%d/%m/%Y')}")
+                st.caption(f"**⏰ Horário:** {row['Inicio'].strftime('%H:%M')} - {row['Termino'].strftime('%H:%M')}")
+                st.caption(f"**💻 Modalidade:** {row['Modalidade']}")
+
+                if row['Modalidade'] == "Presencial":
+                    st.caption(f"**📍 Local:** {row['Local_Link']}")
+                else:
+                    if str(row['Local_Link']).startswith('http'):
+                        st.link_button("Acessar Link", row['Local_Link'])
+                    else:
+                        st.caption(f"**🔗 Link:** {row['Local_Link']}")
+
+    botoes_agenda_ics(unidade, key="agenda_ics_estagiario")
+
+@st.fragment
+def secao_novo_projeto(nome, setor_estagiario, lista_setores):
+    st.subheader("1. Registrar um Novo Projeto")
+    with st.expander("Clique aqui para abrir o formulário de novo projeto"):
+        with st.form(key="novo_projeto_form"):
+            st.write("Preencha todos os dados para criar um novo projeto no seu nome.")
+            col1, col2 = st.columns(2)
+            with col1:
+                data_registro = st.date_input("Data do Registro (Hoje)", datetime.now(), format="DD/MM/YYYY")
+
+                try:
+                    index_setor = lista_setores.index(setor_estagiario)
+                except ValueError:
+                    index_setor = len(lista_setores) - 1 # "Outros"
+
+                categoria = st.selectbox("Descrição do Local (Setor)", lista_setores, index=index_setor)
+                data_inicio_proj = st.date_input("Data de Início do Projeto", datetime.now(), format="DD/MM/YYYY")
+
+            with col2:
+                status = st.selectbox("Status", ["Iniciado", "Pendente", "Concluído"], index=0)
+                nome_projeto = st.text_input("Nome do Projeto / Atividade Específica", placeholder="Ex: Controle de Processos de Segurança")
+                previsao_conclusao = st.date_input("Previsão de Conclusão", datetime.now(), format="DD/MM/YYYY")
+
+            obs = st.text_area("Observações Iniciais")
+
+            enviar = st.form_submit_button("Registrar Novo Projeto", type="primary")
+
+        if enviar:
+            if not nome_projeto:
+                st.warning("Por favor, preencha o 'Nome do Projeto'.")
+            else:
+                percentual = map_status_to_percent(status)
+
+                nova_linha = pd.DataFrame([{
+                    'Data_Registro': data_registro.strftime('%d/%m/%Y'),
+                    'Colaborador': nome,
+                    'Setor': setor_estagiario,
+                    'Categoria_Atividade': categoria,
+                    'Nome_Projeto': nome_projeto,
+                    'Data_Inicio_Projeto': data_inicio_proj.strftime('%d/%m/%Y'),
+                    'Previsao_Conclusao': previsao_conclusao.strftime('%d/%m/%Y'),
+                    'Status': status,
+                    'Percentual_Concluido': percentual,
+                    'Observacoes': obs
+                }])
+
+                anexar_registros(nova_linha)
+                st.success(f"✅ Novo projeto '{nome_projeto}' registrado com sucesso!")
+                st.rerun() # Página inteira: o editor e o desempenho mostram o novo projeto
+
+@st.fragment
+def secao_meus_projetos(nome):
+    st.subheader("2. Atualizar Meus Projetos")
+    st.info("Aqui você pode editar o Status, Previsão e Observações dos seus projetos existentes.")
+
+    # Com edições pendentes o editor continua sobre os projetos lidos quando a edição começou
+    df_projetos_unicos = pagina_do_editor("editor_projetos", nome, lambda: projetos_do_estagiario(nome))
+
+    if df_projetos_unicos.empty:
+        st.warning("Você ainda não tem projetos registrados. Use o formulário acima para criar o primeiro.")
+        return
+
+    try:
+        edited_df = st.data_editor(
+            df_projetos_unicos,
+            key=chave_do_editor("editor_projetos"),
+            use_container_width=True,
+            column_config={
+                "Nome_Projeto": st.column_config.Column("Nome do Projeto", disabled=True),
+                "Data_Inicio_Projeto": st.column_config.DateColumn("Início", format="DD/MM/YYYY", disabled=True),
+
+                "Status": st.column_config.SelectboxColumn(
+                    "Status", options=["Iniciado", "Pendente", "Concluído"], required=True
+                ),
+                "Previsao_Conclusao": st.column_config.DateColumn(
+                    "Previsão Conclusão", format="DD/MM/YYYY"
+                ),
+                "Observacoes": st.column_config.TextColumn("Observações"),
+
+                "Percentual_Concluido": None,
+                "Categoria_Atividade": None,
+                "Setor": None,
+                "Colaborador": None,
+                "Data_Registro": None
+            }
+        )
+
+        if st.button("Salvar Alterações", type="primary"):
+            # Só as células editadas (delta do editor) viram um novo snapshot no log
+            cols_editaveis = ['Status', 'Previsao_Conclusao', 'Observacoes']
+            alteracoes = alteracoes_do_editor("editor_projetos", df_projetos_unicos, edited_df, cols_editaveis)
+            try:
+                atualizar_projetos(nome, df_projetos_unicos, alteracoes)
+            except ConflitoDeEdicao as e:
+                descartar_edicoes("editor_projetos")
+                st.error(f"⚠️ {e} Nada foi gravado: refaça suas alterações sobre os dados atualizados.")
+                st.button("🔄 Recarregar projetos")
+            else:
+                descartar_edicoes("editor_projetos")
+                st.success("✅ Projetos atualizados com sucesso!")
+                if alteracoes['alteradas']:
+                    st.rerun() # Página inteira: o desempenho também usa os projetos
+
+    except Exception as e:
+        st.error(f"Ocorreu um erro ao carregar seu editor de projetos: {e}")
+        st.error("Se o problema persistir, apague o 'registros.csv' na página de Administração.")
+
+@st.fragment
+def secao_meu_desempenho(nome):
+    st.subheader("3. Meu Desempenho (Projetos)")
+
+    df_meus_projetos_unicos = projetos_do_estagiario(nome)
+
+    if not df_meus_projetos_unicos.empty:
+        # Métricas
+        hoje = pd.to_datetime(datetime.now().date())
+        df_meus_ativos = df_meus_projetos_unicos[df_meus_projetos_unicos['Status'].isin(['Iniciado', 'Pendente'])]
+        df_meus_concluidos = df_meus_projetos_unicos[df_meus_projetos_unicos['Status'] == 'Concluído']
+        df_meus_atrasados = df_meus_ativos[df_meus_ativos['Previsao_Conclusao'] < hoje]
+
+        col1_m, col2_m, col3_m = st.columns(3)
+        col1_m.metric("Meus Projetos Ativos", len(df_meus_ativos))
+        col2_m.metric("Meus Projetos Concluídos", len(df_meus_concluidos))
+        col3_m.metric("Meus Projetos Atrasados", len(df_meus_atrasados))
+
+        # Gráfico de Pizza Pessoal
+        df_status_counts = df_meus_projetos_unicos['Status'].value_counts().reset_index()
+        df_status_counts.columns = ['Status', 'Contagem']
+        mapa_cores_status = {
+            'Concluído': '#76B82A', 'Iniciado': '#30515F', 'Pendente': '#B2B2B2'
+        }
+        fig_pie_meus_status = px.pie(df_status_counts, names='Status', values='Contagem',
+                                     title="Status dos Meus Projetos",
+                                     color='Status',
+                                     color_discrete_map=mapa_cores_status)
+        st.plotly_chart(fig_pie_meus_status, use_container_width=True)
+
+    else:
+        st.info("Assim que você registrar seu primeiro projeto, seus indicadores aparecerão aqui.")
+
+@st.fragment
+def secao_trilha(matricula):
+    st.subheader("4. Minha Trilha de Desenvolvimento")
+
+    try:
+        # Prazos e situação das etapas já calculados para todos os estagiários (cache do dia)
+        resumo, etapas = trilha_do_estagiario(dados.prazos_trilha, matricula)
+
+        if resumo is None or pd.isna(resumo['ADMISSAO']) or pd.isna(resumo['TERMINO CONTRATO']):
+            st.error("Sua data de admissão ou término não foi encontrada ou está em formato incorreto.")
+        else:
+            # --- NOVO BLOCO DE MÉTRICAS DE CONTRATO ---
+            col1_data, col2_data, col3_data = st.columns(3)
+            col1_data.metric("Data de Início", resumo['ADMISSAO'].strftime('%d/%m/%Y'))
+            col2_data.metric("Data de Término", resumo['TERMINO CONTRATO'].strftime('%d/%m/%Y'))
+            if resumo['Dias_Restantes'] > 0:
+                col3_data.metric("Dias Restantes de Contrato", f"{resumo['Dias_Restantes']} dias")
+            else:
+                col3_data.metric("Contrato Encerrado", "🏁")
+
+            if not resumo['Tem_Progresso']:
+                st.warning("Seu progresso na trilha ainda não foi iniciado pelo RH.")
+            else:
+                percentual_completo = int(resumo['Percentual'])
+
+                if percentual_completo == 100:
+                    st.progress(percentual_completo, text="Trilha Concluída! 🎉")
+                else:
+                    st.progress(percentual_completo, text=f"{percentual_completo}% Concluído")
+
+                st.markdown("---")
+
+                for etapa in etapas.itertuples():
+                    mes_descricao = TRILHA_MESES[etapa.Mes]
+                    prazo = etapa.Prazo.strftime('%d/%m/%Y')
+
+                    if etapa.Situacao == "Concluída":
+                        st.success(f"**{mes_descricao}** (Concluído!)", icon="✅")
+                    elif etapa.Situacao == "Atrasada":
+                        st.error(f"🚨 **{mes_descricao}** (Prazo: {prazo} - PENDENTE)", icon="🚨")
+                    elif etapa.Situacao == "Atual":
+                        st.info(f"⏳ **{mes_descricao}** (Prazo: {prazo} - ETAPA ATUAL)", icon="⏳")
+                    else:
+                        st.caption(f"🔘 {mes_descricao} (Prazo: {prazo})")
+
+    except Exception as e:
+        st.error(f"Ocorreu um erro ao calcular sua trilha: {e}")
+
+@st.fragment
+def secao_feedbacks(nome):
+    st.subheader("5. Meus Feedbacks Recebidos")
+
+    df_meus_feedbacks = carregar_feedback(estagiario=nome)
+
+    if df_meus_feedbacks.empty:
+        st.info("Você ainda não recebeu nenhum feedback oficial do seu gestor.")
+    else:
+        st.write("Aqui estão os feedbacks que você recebeu (do mais recente para o mais antigo):")
+        df_meus_feedbacks['Data_Hora'] = pd.to_datetime(df_meus_feedbacks['Data_Hora'])
+        df_meus_feedbacks = df_meus_feedbacks.sort_values(by="Data_Hora", ascending=False)
+
+        for idx, row in df_meus_feedbacks.iterrows():
+            with st.container(border=True):
+                st.write(f"**Feedback de:** {row['Gestor']} em {row['Data_Hora'].strftime('%d/%m/%Y')}")
+
+                cols_fb_existentes = ['Iniciativa', 'Aprendizagem', 'Qualidade', 'Relacoes']
+                if all(col in row for col in cols_fb_existentes):
+                    st.markdown(f"""
+                    * **Iniciativa:** {row['Iniciativa']}
+                    * **Aprendizagem:** {row['Aprendizagem']}
+                    * **Qualidade:** {row['Qualidade']}
+                    * **Relações:** {row['Relacoes']}
+                    """)
+
+                if pd.notna(row['Feedback_Livre']) and row['Feedback_Livre'].strip():
+                    st.write("**Feedback Adicional:**")
+                    st.info(f"{row['Feedback_Livre']}")
+
+if st.button("🏠 Voltar para Home"):
+    mudar_pagina("Home")
+
+st.title("👨‍🎓 Página do Estagiário")
+
+# --- DIRETÓRIO DE ESTAGIÁRIOS: CONSULTA POR MATRÍCULA, SEM COPIAR A BASE ---
+estagiarios = diretorio_estagiarios()
+
+if not estagiarios['registros']:
+     st.error(f"Não foi possível carregar {BASE_FILE}. A página não pode funcionar.")
+else:
+    lista_setores = estagiarios['setores'] + ["Outros"]
+
+    st.write("Digite sua matrícula para continuar:")
+
+    # --- ATUALIZADO: Login com st.form ---
+    with st.form(key="estagiario_login_form"):
+        matricula = st.text_input("Matrícula", key="matricula_input")
+        confirmar = st.form_submit_button("Confirmar matrícula")
+
+    if confirmar:
+        if matricula:
+            st.session_state["matricula_digitada"] = matricula
+            st.rerun() # Força o recarregamento da página com a matrícula
+        else:
+            st.warning("Por favor, digite uma matrícula antes de confirmar.")
+
+    if st.session_state.get("matricula_digitada"):
+        matricula = st.session_state["matricula_digitada"]
+        estagiario = buscar_estagiario(matricula)
+
+        if estagiario is not None:
+            nome = estagiario["COLABORADOR"]
+            setor_estagiario = estagiario["DESCRIÇÃO LOCAL"]
+
+            # --- ATUALIZAÇÃO IMPORTANTE ---
+            # Garantir que a coluna UNIDADE existe
+            if "UNIDADE" not in estagiario:
+                st.error("A coluna 'UNIDADE' não foi encontrada no Base.xlsx. Não consigo filtrar os treinamentos.")
+                unidade = "N/A" # Definir um padrão para evitar que o app quebre
+            else:
+                unidade = estagiario["UNIDADE"] # <--- PEGAMOS A UNIDADE AQUI
+
+            st.success(f"Bem-vindo(a), **{nome.split()[0]}** ({setor_estagiario} - {unidade}) 👋")
+
+            # --- 6. 🔔 MEUS PRÓXIMOS TREINAMENTOS (NOVO) ---
+            secao_proximos_treinamentos(unidade)
+            st.divider()
+
+            # --- 1. FORMULÁRIO PARA CRIAR NOVOS PROJETOS ---
+            secao_novo_projeto(nome, setor_estagiario, lista_setores)
+            st.divider()
+
+            # --- 2. EDITOR DE PROJETOS EXISTENTES ---
+            secao_meus_projetos(nome)
+            st.divider()
+
+            # --- 3. DASHBOARD PESSOAL (NOVO) ---
+            secao_meu_desempenho(nome)
+            st.divider()
+
+            # --- 4. TRILHA DE DESENVOLVIMENTO (MOVIDA PARA CÁ) ---
+            secao_trilha(estagiario["MATRICULA"]) # Como está na Base (a digitada pode ter zeros à esquerda)
+            st.divider()
+
+            # --- 5. MEUS FEEDBACKS RECEBIDOS (NOVO) ---
+            secao_feedbacks(nome)
+
+        else:
+            st.error("⚠️ Matrícula não encontrada na base. Verifique e tente novamente.")
+    elif confirmar and not matricula:
+        st.warning("Por favor, digite uma matrícula antes de confirmar.")
@@ -0,0 +1,31 @@
+# ========= HOME (LAYOUT ÚNICO E SIMPLIFICADO) =========
+import streamlit as st
+
+from servicos import get_home_page_css, mudar_pagina
+
+try:
+    css = get_home_page_css("fundo.jpg", "fundocelular.jpg")
+    st.markdown(css, unsafe_allow_html=True)
+except Exception as e:
+    st.error(f"Ocorreu um erro ao carregar o fundo: {e}")
+
+
+st.markdown('<div class="button-container">', unsafe_allow_html=True) 
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    if st.button("📋 Página do Estagiário", use_container_width=True, key="reg_desktop"):
+        mudar_pagina("Página do Estagiário")
+    # st.button("Trilha de Desenvolvimento", use_container_width=True, key="trilha_desktop", on_click=mudar_pagina, args=("Página do Estagiário",)) 
+with col2:
+    if st.button("📊 Painel de Indicadores", use_container_width=True, key="gestor_desktop"):
+        mudar_pagina("Painel de Indicadores")
+    if st.button("💬 Avaliação do Gestor", use_container_width=True, key="feed_desktop"):
+        mudar_pagina("Avaliação do Gestor")
+with col3:
+    if st.button("🗓️ Treinamentos", use_container_width=True, key="treina_desktop"):
+        mudar_pagina("Treinamentos")
+    if st.button("🔒 Administração", use_container_width=True, key="admin_desktop"):
+        mudar_pagina("Administração")
+
+st.markdown('</div>', unsafe_allow_html=True)
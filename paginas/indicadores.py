@@ -0,0 +1,238 @@
+# ========= NOVA PÁGINA: PAINEL DE INDICADORES =========
+import streamlit as st
+import plotly.express as px
+from datetime import datetime
+
+from servicos import (
+    carregar_registros, DadosDaPagina, DATE_COLS_REGISTROS, distribuicao_avaliacoes,
+    estado_atual_registros, feedbacks_avaliados, grafico_em_cache, login_gestor, medias_por_competencia,
+    mudar_pagina, pontuacao_feedbacks, projetos_do_estagiario, ranking_desempenho, somar_formato_longo,
+    somar_por_estagiario, versao_feedback, versao_registros, versao_somar
+)
+
+dados = DadosDaPagina("Painel de Indicadores") # Dados carregados sob demanda por esta página
+
+# --- GRÁFICOS ---
+# Montados só quando não estão no cache de gráficos (ver grafico_em_cache), que é
+# consultado pela versão dos dados e pelo filtro de estagiário.
+def grafico_distribuicao(pontuacao, estagiario):
+    mapa_cores = {
+         'Excelente': '#76B82A', 'Bom': '#30515F',
+         'Regular': '#B2B2B2', 'Ruim': '#B2B2B2'
+    }
+
+    df_pizza_total = distribuicao_avaliacoes(pontuacao, estagiario)
+    if df_pizza_total.empty:
+        return None
+    return px.pie(df_pizza_total, names='Avaliação', values='Contagem', 
+                  color='Avaliação', 
+                  color_discrete_map=mapa_cores) 
+
+def grafico_status_projetos(estagiario):
+    if estagiario is not None:
+        df_projetos_unicos = projetos_do_estagiario(estagiario)
+    else:
+        df_projetos_unicos = estado_atual_registros()
+
+    df_status_counts = df_projetos_unicos['Status'].value_counts().reset_index()
+    df_status_counts.columns = ['Status', 'Contagem']
+
+    mapa_cores_status = {
+        'Concluído': '#76B82A', 'Iniciado': '#30515F', 'Pendente': '#B2B2B2'
+    }
+
+    return px.pie(df_status_counts, names='Status', values='Contagem', 
+                  color='Status',
+                  color_discrete_map=mapa_cores_status)
+
+def grafico_medias(pontuacao, estagiario):
+    df_medias = medias_por_competencia(pontuacao, estagiario)
+
+    fig_bar = px.bar(df_medias, x='Competência', y='Média', 
+                     title="Média por Competência (4=Excelente, 1=Ruim)",
+                     text=df_medias['Média'].apply(lambda x: f'{x:.2f}'),
+                     range_y=[0, 4],
+                     color='Média', 
+                     color_continuous_scale=[[0, '#30515F'], [1, '#76B82A']], 
+                     range_color=[0, 4] 
+                    )
+
+    fig_bar.update_layout(bargap=0.5)
+    fig_bar.update_layout(coloraxis_showscale=False)
+    return fig_bar
+
+def grafico_somar(df_somar_grouped):
+    mapa_cores_somar = {
+        'IMPLEMENTADA': '#76B82A',
+        'EM EXECUÇÃO': '#30515F',
+        'EM ANÁLISE': '#B2B2B2',
+        'REJEITADA': '#E00000' # Um vermelho para rejeitada
+    }
+
+    # Formato longo (responsável, status, quantidade) para o gráfico de barras empilhadas
+    return px.bar(df_somar_grouped, 
+                  x='NOME RESPONSAVEL', 
+                  y='IDEIAS ENVIADAS', 
+                  color='STATUS IDEIA',
+                  title='Ideias Enviadas por Estagiário e Status',
+                  color_discrete_map=mapa_cores_somar,
+                  labels={'NOME RESPONSAVEL': 'Estagiário', 'IDEIAS ENVIADAS': 'Quantidade de Ideias'})
+
+# --- FILTROS DO PAINEL DE INDICADORES ---
+st.sidebar.title("Filtros")
+data_inicio = st.sidebar.date_input("Data Início", datetime.now().date().replace(day=1), format="DD/MM/YYYY", key="filtro_data_inicio")
+data_fim = st.sidebar.date_input("Data Fim", datetime.now().date(), format="DD/MM/YYYY", key="filtro_data_fim")
+
+if not dados.base.empty:
+    lista_estagiarios = sorted(dados.base["COLABORADOR"].dropna().unique().tolist())
+    lista_estagiarios.insert(0, "Todos")
+    filtro_estagiario_sidebar = st.sidebar.selectbox("Estagiário", lista_estagiarios, key="filtro_estagiario")
+else:
+    st.sidebar.warning("Não foi possível carregar lista de estagiários (base.xlsx).")
+    filtro_estagiario_sidebar = "Todos"
+
+
+if st.button("🏠 Voltar para Home"):
+    mudar_pagina("Home")
+st.title("📊 Painel de Indicadores do Programa")
+st.markdown("---")
+
+# --- 1. LÓGICA DE LOGIN DO GESTOR (ATUALIZADA COM st.form) ---
+if "gestor_autenticado" not in st.session_state:
+    st.session_state.gestor_autenticado = False
+if "dados_gestor" not in st.session_state:
+    st.session_state.dados_gestor = None
+
+if not st.session_state.gestor_autenticado:
+    login_gestor("gestor_login_indicadores_form")
+
+# --- 2. SE O GESTOR ESTIVER LOGADO ---
+if st.session_state.gestor_autenticado:
+
+    # --- SEÇÃO DE DASHBOARD ---
+    st.subheader("Análise de Feedbacks (Gestores)")
+    df_feedback = dados.feedback
+
+    pontuacao = None
+    estagiario_filtro = None if filtro_estagiario_sidebar == "Todos" else filtro_estagiario_sidebar
+
+    if not df_feedback.empty:
+        df_display_feedback = df_feedback.copy()
+        colunas_para_renomear = {'Data_Hora': 'DATA', 'Gestor': 'GESTOR'}
+        df_display_feedback.rename(columns=colunas_para_renomear, inplace=True)
+
+        if filtro_estagiario_sidebar != "Todos" and "Estagiario" in df_display_feedback.columns:
+            df_display_feedback = df_display_feedback[df_display_feedback["Estagiario"] == filtro_estagiario_sidebar]
+
+        colunas_para_ocultar = ['Feedback_Livre', 'sugestao_melhoria']
+        for col in colunas_para_ocultar:
+            if col in df_display_feedback.columns:
+                df_display_feedback = df_display_feedback.drop(columns=[col])
+
+        st.write("**Tabela de Feedbacks Recebidos**")
+        st.dataframe(df_display_feedback, use_container_width=True)
+
+        st.markdown("---")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Distribuição das Avaliações (Feedback)**")
+
+            pontuacao = pontuacao_feedbacks()
+
+            if not pontuacao['competencias'] or feedbacks_avaliados(pontuacao, estagiario_filtro) == 0:
+                st.warning("Nenhum dado de competência (Ex: 'Iniciativa' ou 'estrutura_suporte') foi encontrado no feedback.")
+                pontuacao = None
+            else:
+                fig_pie = grafico_em_cache("distribuicao", versao_feedback(), estagiario_filtro,
+                                           lambda: grafico_distribuicao(pontuacao, estagiario_filtro))
+                if fig_pie is not None:
+                    st.plotly_chart(fig_pie, use_container_width=True)
+                else:
+                    st.info("Sem dados para o gráfico de pizza de feedback.")
+
+        with col2:
+            st.markdown("**Status dos Projetos (Estagiários)**")
+
+            if not dados.registros.empty:
+                fig_pie_status = grafico_em_cache("status_projetos", versao_registros(), estagiario_filtro,
+                                                  lambda: grafico_status_projetos(estagiario_filtro))
+                st.plotly_chart(fig_pie_status, use_container_width=True)
+            else:
+                st.info("Nenhum projeto registrado.")
+
+        if pontuacao is not None:
+            if pontuacao['com_nota']: 
+                st.markdown(f"**Média por Competência ({filtro_estagiario_sidebar})**")
+                fig_bar = grafico_em_cache("medias_competencia", versao_feedback(), estagiario_filtro,
+                                           lambda: grafico_medias(pontuacao, estagiario_filtro))
+                st.plotly_chart(fig_bar, use_container_width=True)
+            else:
+                st.info("O gráfico de média por competência só funciona com os novos formulários de feedback (Iniciativa, Qualidade, etc.)")
+    else:
+        st.info("Nenhum feedback registrado até o momento.")
+
+    # --- SEÇÃO DE RELATÓRIO DE ATIVIDADES ---
+    st.markdown("---")
+    st.subheader("Relatório de Atividades dos Estagiários")
+
+    if not dados.registros.empty:
+        try:
+            df_filtrada = carregar_registros(
+                data_inicio, data_fim,
+                colaborador=None if filtro_estagiario_sidebar == "Todos" else filtro_estagiario_sidebar
+            ).copy()
+
+            for col in DATE_COLS_REGISTROS:
+                if col in df_filtrada.columns:
+                    df_filtrada[col] = df_filtrada[col].dt.strftime('%d/%m/%Y').replace('NaT', '')
+
+            st.dataframe(df_filtrada, use_container_width=True)
+            st.info(f"Exibindo {len(df_filtrada)} de {len(dados.registros)} registros totais.")
+        except Exception as e:
+            st.error(f"Erro ao processar e filtrar os dados de atividades: {e}")
+            st.dataframe(dados.registros)
+    else:
+        st.info("Nenhuma atividade registrada para os filtros selecionados.")
+
+
+    # --- SEÇÃO: RANKING DE DESEMPENHO ---
+    st.markdown("---")
+    st.subheader("🏆 Ranking de Desempenho dos Estagiários")
+
+    try:
+        # Feedbacks e projetos ligados ao estagiário pelo índice de nomes (soma por código)
+        df_ranking = ranking_desempenho(pontuacao, estagiario_filtro)
+
+        st.dataframe(df_ranking, use_container_width=True,
+                     column_config={
+                         "Nota Média (de 4.0)": st.column_config.NumberColumn(format="%.2f ⭐"),
+                         "Projetos Atrasados": st.column_config.NumberColumn(format="%d ⚠️")
+                     })
+
+    except Exception as e:
+        st.error(f"Ocorreu um erro ao gerar o ranking de desempenho: {e}")
+
+    # --- SEÇÃO: INDICADOR SOMAR IDEIAS ---
+    st.markdown("---")
+    st.subheader("💡 Indicador do Programa Somar Ideias")
+
+    if dados.somar.empty:
+        st.info("O indicador do Somar Ideias não pôde ser carregado. Verifique o arquivo 'somar_ideias.xlsx'.")
+    else:
+        try:
+            # Recorte do cubo: estagiários da Base (quem não enviou aparece com zero) e filtro da sidebar
+            df_somar_estagiarios = somar_por_estagiario(estagiario_filtro)
+            df_somar_final = df_somar_estagiarios.reset_index()
+
+            st.write("**Tabela Resumo - Somar Ideias**")
+            st.dataframe(df_somar_final, use_container_width=True)
+
+            # Gráfico de Barras do Somar
+            st.write("**Gráfico - Total de Ideias por Estagiário**")
+            fig_somar = grafico_em_cache("somar", versao_somar(), estagiario_filtro,
+                                         lambda: grafico_somar(somar_formato_longo(df_somar_estagiarios)))
+            st.plotly_chart(fig_somar, use_container_width=True)
+
+        except Exception as e:
+            st.error(f"Ocorreu um erro ao processar os dados do Somar Ideias: {e}")
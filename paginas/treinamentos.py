@@ -0,0 +1,63 @@
+# ========= NOVA PÁGINA: TREINAMENTOS =========
+import streamlit as st
+from datetime import datetime
+
+from servicos import (
+    DadosDaPagina, botoes_agenda_ics, mudar_pagina
+)
+
+dados = DadosDaPagina("Treinamentos") # Dados carregados sob demanda por esta página
+
+if st.button("🏠 Voltar para Home"):
+    mudar_pagina("Home")
+st.title("🗓️ Agenda de Treinamentos")
+st.markdown("---")
+
+calendario = dados.calendario # Ordenado por data e por unidade (cacheado por versão)
+
+if calendario.por_data.empty:
+    st.info("Nenhum treinamento cadastrado no momento.")
+else:
+    # Agenda .ics por unidade (gerada e cacheada pelo app, assinável no celular)
+    with st.expander("📅 Levar a agenda da sua unidade para o calendário do celular"):
+        unidade_agenda = st.selectbox("Unidade", calendario.unidades(), key="unidade_agenda_ics")
+        botoes_agenda_ics(unidade_agenda, key="baixar_agenda_ics")
+
+    # Filtrar apenas treinamentos futuros, já agrupados por dia
+    hoje = datetime.now().date()
+    agenda = calendario.agenda(a_partir_de=hoje)
+
+    if not agenda:
+        st.info("Nenhum treinamento futuro agendado no momento.")
+    else:
+        st.subheader("Próximos Eventos:")
+
+        # Agrupar por data para um visual de agenda
+        for data, treinamentos_do_dia in agenda:
+            # Mostrar a data como um cabeçalho
+            st.markdown(f"### {data.strftime('%d/%m/%Y')}")
+
+            # Criar colunas para os cartões
+            cols = st.columns(3) 
+            col_idx = 0
+
+            for idx, row in treinamentos_do_dia.iterrows():
+                with cols[col_idx % 3]: # Loop de 0 a 2
+                    with st.container(border=True):
+                        st.subheader(f"📍 {row['Nome_Treinamento']}")
+
+                        # Usar st.caption para texto menor e ícones
+                        st.caption(f"**⏰ Horário:** {row['Inicio'].strftime('%H:%M')} - {row['Termino'].strftime('%H:%M')}")
+                        st.caption(f"**🏢 Unidade:** {row['Unidade']}")
+                        st.caption(f"**💻 Modalidade:** {row['Modalidade']}")
+
+                        if row['Modalidade'] == "Presencial":
+                            st.caption(f"**📍 Local:** {row['Local_Link']}")
+                        else:
+                            # Se for Online, tenta criar um link clicável
+                            if str(row['Local_Link']).startswith('http'):
+                                st.link_button("Acessar Link do Treinamento", row['Local_Link'])
+                            else:
+                                st.caption(f"**🔗 Link:** {row['Local_Link']}")
+                col_idx += 1
+            st.markdown("---") # Divisor entre os dias
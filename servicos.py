@@ -0,0 +1,2783 @@
+# Serviços compartilhados pelas páginas: leitura/gravação dos dados, caches e login.
+# É importado uma única vez por processo; as páginas ficam em paginas/.
+import streamlit as st
+import pandas as pd
+import numpy as np
+import base64
+import io
+import os
+import threading
+import hashlib
+import json
+import logging
+from datetime import datetime, time, timezone
+from time import perf_counter
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from urllib.parse import urlsplit
+import pyarrow as pa
+import pyarrow.parquet as pq
+try:
+    import fcntl # Travas entre processos (Linux/macOS)
+except ImportError:
+    fcntl = None # Windows: fica só a trava entre threads do mesmo processo
+
+# --- Nomes dos Arquivos ---
+CSV_FILE = "registros.csv"
+BASE_FILE = "Base.xlsx"
+GESTOR_FILE = "gestor.xlsx"
+CSV_FEEDBACK = "feedback_gestor_programa.csv"
+TRILHA_FILE = "progresso_trilha.csv" # Exportação do progresso das trilhas (e formato antigo, importado uma vez)
+TRILHA_BITS = "progresso_trilha.npy" # Progresso das trilhas: uma máscara de bits por Matricula
+REGISTROS_COMPACTADOS = "registros.parquet" # Histórico compactado dos registros (colunar)
+REGISTROS_ATUAL = "registros_atual.parquet" # Visão materializada: último snapshot de cada projeto
+SOMAR_FILE = "somar_ideias.xlsx" 
+PLANILHAS_CACHE_DIR = "cache_planilhas" # Cópias em Parquet das planilhas .xlsx (geradas pelo app)
+TREINAMENTOS_FILE = "treinamentos.csv" 
+
+# --- Senhas ---
+# O aviso é exibido pelo app.py a cada execução (este módulo só roda uma vez por processo)
+AVISO_SENHAS = ""
+try:
+    SENHA_GESTOR = st.secrets["SENHA_GESTOR"]
+    ACCESS_PASSWORD = st.secrets["SENHA_ADMIN"]
+except FileNotFoundError:
+    AVISO_SENHAS = "Arquivo 'secrets.toml' não encontrado. Usando senhas de fallback."
+    SENHA_GESTOR = "cocal@2025" 
+    ACCESS_PASSWORD = "cocal"
+except KeyError:
+    AVISO_SENHAS = "Senhas não configuradas no 'secrets.toml'. Usando senhas de fallback."
+    SENHA_GESTOR = "cocal@2025"
+    ACCESS_PASSWORD = "cocal"
+
+# --- Páginas (título no menu -> arquivo) ---
+PAGINAS = {
+    "Home": "paginas/home.py",
+    "Página do Estagiário": "paginas/estagiario.py",
+    "Treinamentos": "paginas/treinamentos.py",
+    "Painel de Indicadores": "paginas/indicadores.py",
+    "Avaliação do Gestor": "paginas/avaliacao_gestor.py",
+    "Administração": "paginas/administracao.py",
+}
+
+# --- Backend de Armazenamento ---
+# "arquivos" (padrão): CSV/Parquet na pasta do app.
+# "sqlite": banco local (modo WAL) em SQLITE_FILE, seguro com várias sessões gravando ao mesmo tempo.
+# Pode ser definido no secrets.toml (BACKEND_DADOS = "sqlite") ou na variável de ambiente BACKEND_DADOS.
+try:
+    BACKEND_DADOS = st.secrets.get("BACKEND_DADOS", "arquivos")
+    SQLITE_FILE = st.secrets.get("SQLITE_FILE", "estagio.db")
+except FileNotFoundError:
+    BACKEND_DADOS = "arquivos"
+    SQLITE_FILE = "estagio.db"
+BACKEND_DADOS = os.environ.get("BACKEND_DADOS", BACKEND_DADOS)
+SQLITE_FILE = os.environ.get("SQLITE_FILE", SQLITE_FILE)
+
+# --- Tópicos da Trilha ---
+TRILHA_MESES = {
+    "Mes_1": "Mês 1: Onboarding, Integração (DP, TI, S.T.) e Cultura Cocal.",
+    "Mes_2": "Mês 2: Alinhamento com Gestor, Treinamento Somar Ideias e Engajamento à Cultura.",
+    "Mes_3": "Mês 3: Feedback com Gestor e Treinamento: Conhecimento na Função.",
+    "Mes_4": "Mês 4: Registro da Ideia (Somar) e Treinamento: Segurança.",
+    "Mes_5": "Mês 5: Apresentação da Ideia de Melhoria (RH/Gestor) e Feedback de Desempenho.",
+    "Mes_6": "Mês 6: Alinhamento Final (RH/Gestor) e Análise de Efetivação/Remanejamento."
+}
+COLUNAS_TRILHA = ['Matricula', 'Mes_1', 'Mes_2', 'Mes_3', 'Mes_4', 'Mes_5', 'Mes_6']
+COLUNAS_REGISTROS = [
+    'Data_Registro', 'Colaborador', 'Setor', 
+    'Categoria_Atividade', 'Nome_Projeto', 'Data_Inicio_Projeto', 'Previsao_Conclusao',
+    'Status', 'Percentual_Concluido', 'Observacoes'
+]
+DATE_COLS_REGISTROS = ['Data_Registro', 'Data_Inicio_Projeto', 'Previsao_Conclusao']
+CHAVE_PROJETO = ['Colaborador', 'Nome_Projeto']
+LIMITE_LOG_REGISTROS = 256 * 1024 # Compacta registros.csv quando o log passa desse tamanho (bytes)
+# --- ATUALIZADO: Colunas de Treinamento ---
+COLUNAS_TREINAMENTOS = [
+    'Nome_Treinamento', 'Data', 'Inicio', 'Termino', 'Modalidade', 'Local_Link', 'Unidade'
+]
+DATE_COLS_TREINAMENTOS = ['Data'] 
+TIME_COLS_TREINAMENTOS = ['Inicio', 'Termino'] 
+COLUNAS_FEEDBACK = [
+    'Data_Hora', 'Gestor', 'Estagiario',
+    'Iniciativa', 'Aprendizagem', 'Qualidade',
+    'Relacoes', 'Feedback_Livre'
+]
+
+# --- FUNÇÕES DE APOIO ---
+
+# --- ESCRITA SEGURA DOS ARQUIVOS ---
+# Várias sessões do Streamlit gravam nos mesmos arquivos ao mesmo tempo. Regras:
+# - quem grava segura a trava do arquivo (threading + flock em "<arquivo>.lock");
+# - reescritas completas vão para um temporário, recebem fsync e entram no lugar com
+#   os.replace: quem está lendo vê o arquivo antigo ou o novo, nunca um pela metade,
+#   e por isso a leitura não precisa de trava;
+# - acréscimos entram numa fila e são gravados em lote por quem pegar a trava primeiro.
+class _TravaArquivo:
+    """Trava reentrante de um arquivo: entre threads (RLock) e entre processos (flock)."""
+
+    def __init__(self, caminho):
+        self._caminho_trava = f"{caminho}.lock"
+        self._rlock = threading.RLock()
+        self._nivel = 0
+        self._fd = None
+
+    def __enter__(self):
+        self._rlock.acquire()
+        if self._nivel == 0 and fcntl is not None:
+            try:
+                self._fd = os.open(self._caminho_trava, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except BaseException:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._rlock.release()
+                raise
+        self._nivel += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._nivel -= 1
+        if self._nivel == 0 and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._rlock.release()
+
+_travas_arquivos = {}
+_travas_lock = threading.Lock()
+
+def trava_arquivo(caminho):
+    """Trava de escrita do arquivo (use com 'with'). Pode ser aninhada na mesma thread."""
+    caminho = os.path.abspath(caminho)
+    with _travas_lock:
+        if caminho not in _travas_arquivos:
+            _travas_arquivos[caminho] = _TravaArquivo(caminho)
+        return _travas_arquivos[caminho]
+
+def _fsync_diretorio(caminho):
+    if os.name != 'posix':
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(caminho)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def escrever_atomico(caminho, escrever):
+    """Grava 'caminho' por inteiro: escrever(temporario) -> fsync -> os.replace."""
+    temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with trava_arquivo(caminho):
+        try:
+            escrever(temporario)
+            with open(temporario, 'rb+') as f:
+                os.fsync(f.fileno())
+            os.replace(temporario, caminho)
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+        _fsync_diretorio(caminho)
+
+def salvar_csv_atomico(df, caminho):
+    escrever_atomico(caminho, lambda temporario: df.to_csv(temporario, index=False, encoding='utf-8'))
+
+def _quebra_pendente(caminho):
+    """'\\n' se a última linha do arquivo não terminar em quebra de linha (senão a próxima linha grudaria nela)."""
+    with open(caminho, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return '' if f.read(1) == b'\n' else '\n'
+
+class FilaDeAcrescimos:
+    """Acréscimos em lote ("group commit") aos arquivos CSV.
+
+    Cada sessão põe seu texto na fila e tenta pegar a trava do arquivo. Quem pegar
+    grava de uma vez tudo o que estiver pendente (um write + um fsync) e libera as
+    outras sessões, que ao pegar a trava encontram seu texto já gravado.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pendentes = {}
+
+    def acrescentar(self, caminho, texto, cabecalho=''):
+        """Acrescenta 'texto' ao arquivo; 'cabecalho' é gravado antes se o arquivo estiver vazio."""
+        caminho = os.path.abspath(caminho)
+        pedido = {'texto': texto, 'feito': threading.Event(), 'erro': None}
+        with self._lock:
+            self._pendentes.setdefault(caminho, []).append(pedido)
+        
+        with trava_arquivo(caminho):
+            if not pedido['feito'].is_set():
+                with self._lock:
+                    lote = self._pendentes.pop(caminho, [])
+                try:
+                    vazio = not os.path.exists(caminho) or os.path.getsize(caminho) == 0
+                    prefixo = cabecalho if vazio else _quebra_pendente(caminho)
+                    dados = prefixo + ''.join(p['texto'] for p in lote)
+                    with open(caminho, 'a', newline='', encoding='utf-8') as f:
+                        f.write(dados)
+                        f.flush()
+                        os.fsync(f.fileno())
+                except Exception as e:
+                    for p in lote:
+                        p['erro'] = e
+                    raise
+                finally:
+                    for p in lote:
+                        p['feito'].set()
+        if pedido['erro'] is not None:
+            raise pedido['erro']
+
+@st.cache_resource(show_spinner=False)
+def fila_de_acrescimos():
+    return FilaDeAcrescimos()
+
+def acrescentar_csv(df, caminho, colunas):
+    """Acrescenta as linhas do DataFrame ao CSV (com o cabeçalho 'colunas' se ele estiver vazio)."""
+    if df.empty:
+        return
+    texto = df[colunas].to_csv(index=False, header=False, lineterminator='\n')
+    cabecalho = pd.DataFrame(columns=colunas).to_csv(index=False, lineterminator='\n')
+    fila_de_acrescimos().acrescentar(caminho, texto, cabecalho)
+
+# --- CACHE DOS ARQUIVOS DE DADOS ---
+# Cada arquivo é lido por uma função cacheada que recebe a "assinatura" do arquivo
+# (mtime + tamanho). Se o arquivo mudar no disco, a assinatura muda e o cache é
+# refeito; escritas feitas pelo próprio app chamam invalidar_cache() logo em seguida.
+def assinatura_arquivo(caminho):
+    """Retorna (mtime_ns, tamanho) do arquivo, ou None se ele não existir."""
+    try:
+        stat = os.stat(caminho)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+# --- PLANILHAS EXCEL: CÓPIA EM PARQUET ---
+# Ler .xlsx (openpyxl) é lento. Cada planilha é convertida uma vez para Parquet, já com
+# os tipos certos, em PLANILHAS_CACHE_DIR; as leituras seguintes usam essa cópia
+# (memory-mapped). O hash do .xlsx fica nos metadados do Parquet: se o RH trocar a
+# planilha, a cópia é refeita na próxima leitura.
+DATAS_PLANILHAS = {BASE_FILE: ['ADMISSAO', 'TERMINO CONTRATO']}
+
+def converter_datas(serie):
+    """Texto -> datetime: ISO (AAAA-MM-DD, como o Excel exporta) primeiro, o resto no formato BR (DD/MM/AAAA)."""
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie
+    iso = pd.to_datetime(serie, format='ISO8601', errors='coerce')
+    # Não usar só dayfirst=True: ele troca dia e mês em datas ISO (2025-08-05 viraria 8 de maio)
+    br = pd.to_datetime(serie.where(iso.isna()), format='mixed', dayfirst=True, errors='coerce')
+    return iso.fillna(br)
+
+def _tipar_planilha(df, colunas_data):
+    for col in df.columns:
+        if col in colunas_data:
+            df[col] = converter_datas(df[col])
+        elif df[col].dtype == object: # Colunas com tipos misturados viram texto
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v)).astype('string')
+    return df
+
+def ler_planilha(caminho, **opcoes_excel):
+    """Lê uma planilha .xlsx pela cópia em Parquet, convertendo-a se ela não existir ou estiver velha."""
+    with open(caminho, 'rb') as f:
+        origem = hashlib.sha1(f.read()).hexdigest().encode()
+    copia = os.path.join(PLANILHAS_CACHE_DIR, os.path.basename(caminho) + ".parquet")
+    try:
+        if (pq.read_schema(copia).metadata or {}).get(b'origem_xlsx') == origem:
+            return pd.read_parquet(copia, memory_map=True)
+    except (OSError, pa.ArrowException):
+        pass # Cópia ausente ou corrompida: converte de novo
+    
+    df = _tipar_planilha(pd.read_excel(caminho, **opcoes_excel), DATAS_PLANILHAS.get(caminho, []))
+    try:
+        tabela = pa.Table.from_pandas(df, preserve_index=False)
+        tabela = tabela.replace_schema_metadata({**(tabela.schema.metadata or {}), b'origem_xlsx': origem})
+        os.makedirs(PLANILHAS_CACHE_DIR, exist_ok=True)
+        escrever_atomico(copia, lambda temporario: pq.write_table(tabela, temporario))
+    except (OSError, pa.ArrowException):
+        pass # Sem a cópia a leitura continua funcionando, só fica mais lenta
+    return df
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _ler_base(assinatura):
+    try:
+        # Tudo como texto (matrículas iguais às digitadas); as datas são convertidas na ingestão
+        df = ler_planilha(BASE_FILE, dtype=str) 
+        # Verificar se as colunas essenciais existem
+        cols_essenciais = ['MATRICULA', 'COLABORADOR', 'ADMISSAO', 'TERMINO CONTRATO', 'UNIDADE']
+        if not all(col in df.columns for col in cols_essenciais):
+            st.error(f"Erro Crítico: O arquivo 'Base.xlsx' deve conter as colunas: {', '.join(cols_essenciais)}")
+            return pd.DataFrame(columns=cols_essenciais)
+        return df
+    except Exception as e:
+        st.error(f"Erro CRÍTICO ao ler {BASE_FILE}: {e}")
+        return pd.DataFrame()
+
+def _ler_log_registros(origem=CSV_FILE, colunas=None, levantar=False):
+    """Lê o log de eventos (ou um trecho dele, sem cabeçalho, se `colunas` for informado) já com as datas convertidas.
+
+    Com levantar=True (compactação) nada vai para a tela e um erro de leitura sobe em vez
+    de virar uma tabela vazia: compactar sem essas linhas e trocar o log as perderia.
+    """
+    try:
+        df = pd.read_csv(origem) if colunas is None else pd.read_csv(origem, header=None, names=colunas)
+        if not all(col in df.columns for col in COLUNAS_REGISTROS):
+            if not levantar:
+                st.warning("O arquivo 'registros.csv' está desatualizado. Apague-o na área de Administração.")
+            for col in COLUNAS_REGISTROS:
+                if col not in df.columns:
+                    df[col] = pd.NA
+            df = df[COLUNAS_REGISTROS]
+        
+        for col in DATE_COLS_REGISTROS:
+            df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
+        
+        return df
+    except Exception as e:
+        if levantar:
+            raise
+        st.error(f"Erro ao ler {CSV_FILE}: {e}. Pode ser necessário apagá-lo na área de Administração.")
+        return pd.DataFrame(columns=COLUNAS_REGISTROS)
+
+# Os arquivos colunares guardam nos metadados qual log eles acompanham (o inode dele) e
+# quantos bytes desse log já estão dentro deles. Quem lê abre o log primeiro e só então
+# o parquet: enquanto o log está aberto seu inode não pode ser reaproveitado, então a
+# comparação é segura. Se não bater (uma compactação está trocando os arquivos), a
+# leitura é refeita com a trava do log presa, e nunca vê linhas repetidas ou faltando.
+class _CompactacaoEmAndamento(Exception):
+    pass
+
+def _metadados_compactacao(metadados):
+    """(inode do log, bytes do log já incluídos) gravados no parquet, ou None (parquet antigo)."""
+    metadados = metadados or {}
+    if b'log_id' not in metadados:
+        return None
+    return int(metadados[b'log_id']), int(metadados[b'log_offset'])
+
+def _ler_instantaneo(compactado, travado, levantar):
+    leitura = {'colunar': None, 'metadados': None, 'log': None, 'fim': 0, 'colunas_log': COLUNAS_REGISTROS}
+    if not os.path.exists(CSV_FILE):
+        if os.path.exists(compactado):
+            leitura['colunar'] = pd.read_parquet(compactado)
+        leitura['trecho'] = pd.DataFrame(columns=COLUNAS_REGISTROS)
+        return leitura
+    with open(CSV_FILE, 'rb') as log:
+        leitura['log'] = os.fstat(log.fileno()).st_ino
+        if os.path.exists(compactado):
+            with open(compactado, 'rb') as f:
+                leitura['metadados'] = _metadados_compactacao(pq.read_schema(f).metadata)
+                f.seek(0)
+                leitura['colunar'] = pd.read_parquet(f)
+        inicio = 0
+        if leitura['metadados'] is not None:
+            log_id, offset = leitura['metadados']
+            if log_id == leitura['log']:
+                inicio = offset
+            elif not travado:
+                raise _CompactacaoEmAndamento()
+            # Com a trava presa e ainda diferente, o log foi trocado por fora do app: lê ele inteiro
+        cabecalho = log.readline()
+        if cabecalho.strip():
+            leitura['colunas_log'] = pd.read_csv(io.BytesIO(cabecalho), nrows=0).columns.tolist()
+        log.seek(inicio)
+        dados = log.read()
+    fim = dados.rfind(b'\n') + 1 # Uma linha ainda sendo escrita fica para a próxima leitura
+    leitura['fim'] = inicio + fim
+    if inicio == 0 and fim:
+        leitura['trecho'] = _ler_log_registros(io.BytesIO(dados[:fim]), levantar=levantar)
+    elif fim:
+        leitura['trecho'] = _ler_log_registros(io.BytesIO(dados[:fim]), colunas=leitura['colunas_log'], levantar=levantar)
+    else:
+        leitura['trecho'] = pd.DataFrame(columns=COLUNAS_REGISTROS)
+    return leitura
+
+def _ler_instantaneo_registros(compactado, levantar=False):
+    """Arquivo colunar + trecho do log que ele ainda não tem, ambos do mesmo momento.
+
+    Devolve um dicionário com 'colunar' (ou None), 'trecho', 'log' (inode do log lido),
+    'fim' (byte do log até onde foi lido), 'colunas_log' e 'metadados' do parquet.
+    'levantar' vai para _ler_log_registros.
+    """
+    try:
+        return _ler_instantaneo(compactado, travado=False, levantar=levantar)
+    except _CompactacaoEmAndamento:
+        with trava_arquivo(CSV_FILE):
+            return _ler_instantaneo(compactado, travado=True, levantar=levantar)
+
+def _historico_da_leitura(leitura):
+    partes = [p for p in (leitura['colunar'], leitura['trecho']) if p is not None and not p.empty]
+    if not partes:
+        return pd.DataFrame(columns=COLUNAS_REGISTROS)
+    return pd.concat(partes, ignore_index=True)[COLUNAS_REGISTROS]
+
+def _concatenar_registros(compactado):
+    """Junta o arquivo colunar informado (se existir) com os eventos do log que ele ainda não tem."""
+    return _historico_da_leitura(_ler_instantaneo_registros(compactado))
+
+def _ultimo_snapshot(df):
+    """Último registro (por Data_Registro; empate = o mais recente no log) de cada projeto."""
+    return df.sort_values(by='Data_Registro', ascending=True, kind='stable').drop_duplicates(subset=CHAVE_PROJETO, keep='last')
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _ler_registros(assinatura_log, assinatura_compactado):
+    return _concatenar_registros(REGISTROS_COMPACTADOS)
+
+# --- PROGRESSO DAS TRILHAS: MÁSCARA DE BITS ---
+# Cada estagiário ocupa um uint8 em que o bit i-1 ligado indica a etapa Mes_i concluída.
+# Em disco é um .npy de registros de tamanho fixo (Matricula, bits), que pode ser aberto
+# com np.load(mmap_mode='r') sem interpretar texto. Ações em lote viram uma operação de
+# bits sobre o array inteiro, e a posição de cada Matricula sai de um índice de hash.
+ETAPAS_TRILHA = COLUNAS_TRILHA[1:]
+
+def _desempacotar_etapas(bits):
+    return np.unpackbits(bits[:, None], axis=1, count=len(ETAPAS_TRILHA), bitorder='little').astype(bool)
+
+class ProgressoTrilha:
+    """Progresso de todas as trilhas. Somente leitura (é compartilhado pelo cache): as alterações devolvem um novo objeto."""
+    def __init__(self, matriculas, bits):
+        self.matriculas = np.asarray(matriculas, dtype=str)
+        self.bits = np.asarray(bits, dtype=np.uint8)
+        self._posicoes = pd.Index(self.matriculas) # Matricula -> posição no array
+    
+    @classmethod
+    def vazio(cls, matriculas=()):
+        return cls(matriculas, np.zeros(len(matriculas), dtype=np.uint8))
+    
+    @classmethod
+    def de_tabela(cls, df):
+        """A partir de uma tabela com as COLUNAS_TRILHA (como a do CSV ou a do SQLite)."""
+        df = df.dropna(subset=['Matricula']).drop_duplicates('Matricula', keep='last')
+        concluidas = df.reindex(columns=ETAPAS_TRILHA).fillna(False).astype(bool).to_numpy()
+        return cls(df['Matricula'].astype(str), np.packbits(concluidas, axis=1, bitorder='little').reshape(-1))
+    
+    @classmethod
+    def ler(cls, caminho):
+        registros = np.load(caminho, mmap_mode='r')
+        # Copia para a memória: o arquivo é substituído a cada gravação (e no Windows um mmap aberto impediria isso)
+        return cls(np.array(registros['Matricula']), np.array(registros['bits']))
+    
+    def gravar(self, caminho):
+        registros = np.rec.fromarrays([self.matriculas, self.bits], names='Matricula,bits')
+        def escrever(temporario):
+            with open(temporario, 'wb') as f:
+                np.save(f, registros)
+        escrever_atomico(caminho, escrever)
+    
+    def tem_progresso(self, matriculas):
+        return self._posicoes.get_indexer(matriculas) >= 0
+    
+    def concluidas(self, matriculas):
+        """Matriz len(matriculas) x 6 de etapas concluídas (Matricula sem progresso: tudo pendente)."""
+        posicoes = self._posicoes.get_indexer(matriculas)
+        return _desempacotar_etapas(np.append(self.bits, np.uint8(0))[posicoes]) # -1 cai no 0 do final
+    
+    def incluir(self, matriculas):
+        """Acrescenta (com tudo pendente) as matrículas que ainda não têm progresso."""
+        novas = pd.unique(np.asarray(matriculas, dtype=str)[~self.tem_progresso(matriculas)])
+        if len(novas) == 0:
+            return self
+        return ProgressoTrilha(np.concatenate([self.matriculas, novas]),
+                               np.concatenate([self.bits, np.zeros(len(novas), dtype=np.uint8)]))
+    
+    def marcar(self, etapa, concluida):
+        """Liga (ou desliga) o bit da etapa (1 a 6) de todos os estagiários de uma vez."""
+        mascara = np.uint8(1 << (etapa - 1))
+        return ProgressoTrilha(self.matriculas, self.bits | mascara if concluida else self.bits & ~mascara)
+    
+    def como_tabela(self):
+        df = pd.DataFrame(_desempacotar_etapas(self.bits), columns=ETAPAS_TRILHA)
+        df.insert(0, 'Matricula', self.matriculas)
+        return df
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _ler_progresso_trilha(assinatura):
+    try:
+        return ProgressoTrilha.ler(TRILHA_BITS)
+    except Exception as e:
+        st.error(f"Erro ao ler {TRILHA_BITS}: {e}")
+        return ProgressoTrilha.vazio()
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _ler_trilha(assinatura):
+    return _ler_progresso_trilha(assinatura).como_tabela()
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _ler_somar(assinatura):
+    try:
+        df = ler_planilha(SOMAR_FILE)
+        cols_necessarias = ['STATUS IDEIA', 'NOME RESPONSAVEL', 'IDEIAS ENVIADAS']
+        if not all(col in df.columns for col in cols_necessarias):
+            st.error(f"O arquivo '{SOMAR_FILE}' não contém as colunas necessárias: {cols_necessarias}")
+            return pd.DataFrame()
+        return df
+    except Exception as e:
+        st.error(f"Erro ao ler {SOMAR_FILE}: {e}")
+        return pd.DataFrame()
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _ler_treinamentos(assinatura):
+    try:
+        df = pd.read_csv(TREINAMENTOS_FILE)
+        if not all(col in df.columns for col in COLUNAS_TREINAMENTOS):
+            st.warning(f"O arquivo '{TREINAMENTOS_FILE}' está desatualizado. Apague-o na área de Administração.")
+            for col in COLUNAS_TREINAMENTOS:
+                if col not in df.columns:
+                    df[col] = pd.NA
+            df = df[COLUNAS_TREINAMENTOS] # Garante a ordem e colunas corretas
+        
+        # Converter colunas de data e hora
+        for col in DATE_COLS_TREINAMENTOS:
+            df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
+        # Corrigir conversão de hora
+        for col in TIME_COLS_TREINAMENTOS:
+            df[col] = pd.to_datetime(df[col], format='%H:%M:%S', errors='coerce').dt.time
+        
+        return df
+    except Exception as e:
+        st.error(f"Erro ao ler {TREINAMENTOS_FILE}: {e}")
+        return pd.DataFrame(columns=COLUNAS_TREINAMENTOS)
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _ler_feedback(assinatura):
+    try:
+        return pd.read_csv(CSV_FEEDBACK)
+    except Exception as e:
+        st.error(f"Erro ao ler {CSV_FEEDBACK}: {e}")
+        return pd.DataFrame()
+
+LEITORES_CACHEADOS = {
+    BASE_FILE: _ler_base,
+    CSV_FILE: _ler_registros,
+    TRILHA_BITS: _ler_trilha,
+    SOMAR_FILE: _ler_somar,
+    TREINAMENTOS_FILE: _ler_treinamentos,
+    CSV_FEEDBACK: _ler_feedback,
+}
+
+def invalidar_cache(*arquivos):
+    """Descarta o cache dos arquivos informados (ou de todos, se nenhum for informado)."""
+    for arquivo in (arquivos or LEITORES_CACHEADOS.keys()):
+        LEITORES_CACHEADOS[arquivo].clear()
+    if usando_sqlite():
+        _ler_tabela_sqlite.clear()
+
+# --- BACKEND SQLITE (OPCIONAL) ---
+# Uma tabela por conjunto de dados, com índices nas colunas usadas nos filtros das páginas.
+# Datas ficam em texto ISO (AAAA-MM-DD) para que filtros por período funcionem no SQL.
+# A tabela 'versoes' guarda um contador por tabela, incrementado na mesma transação de
+# cada escrita: ele faz o papel da assinatura (mtime/tamanho) dos arquivos no cache.
+TABELAS_SQLITE = {
+    CSV_FILE: "registros",
+    CSV_FEEDBACK: "feedback",
+    TRILHA_FILE: "trilha",
+    TREINAMENTOS_FILE: "treinamentos",
+    BASE_FILE: "base",
+}
+ESQUEMA_SQLITE = """
+CREATE TABLE IF NOT EXISTS versoes (
+    tabela TEXT PRIMARY KEY, versao INTEGER NOT NULL DEFAULT 0,
+    geracao INTEGER NOT NULL DEFAULT 0, origem TEXT
+);
+CREATE TABLE IF NOT EXISTS registros (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, Data_Registro TEXT, Colaborador TEXT, Setor TEXT,
+    Categoria_Atividade TEXT, Nome_Projeto TEXT, Data_Inicio_Projeto TEXT, Previsao_Conclusao TEXT,
+    Status TEXT, Percentual_Concluido INTEGER, Observacoes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_registros_colaborador ON registros (Colaborador, Nome_Projeto);
+CREATE INDEX IF NOT EXISTS idx_registros_data ON registros (Data_Registro);
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, Data_Hora TEXT, Gestor TEXT, Estagiario TEXT,
+    Iniciativa TEXT, Aprendizagem TEXT, Qualidade TEXT, Relacoes TEXT, Feedback_Livre TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_estagiario ON feedback (Estagiario, Data_Hora);
+CREATE TABLE IF NOT EXISTS trilha (
+    Matricula TEXT PRIMARY KEY, Mes_1 INTEGER NOT NULL DEFAULT 0, Mes_2 INTEGER NOT NULL DEFAULT 0,
+    Mes_3 INTEGER NOT NULL DEFAULT 0, Mes_4 INTEGER NOT NULL DEFAULT 0, Mes_5 INTEGER NOT NULL DEFAULT 0,
+    Mes_6 INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS treinamentos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, Nome_Treinamento TEXT, Data TEXT, Inicio TEXT,
+    Termino TEXT, Modalidade TEXT, Local_Link TEXT, Unidade TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_treinamentos_unidade ON treinamentos (Unidade, Data);
+CREATE INDEX IF NOT EXISTS idx_treinamentos_data ON treinamentos (Data);
+"""
+
+def usando_sqlite():
+    return BACKEND_DADOS == "sqlite"
+
+def conectar_sqlite():
+    # isolation_level=None: as transações são abertas explicitamente em transacao_sqlite()
+    con = sqlite3.connect(SQLITE_FILE, timeout=30, isolation_level=None)
+    con.execute("PRAGMA synchronous = NORMAL") # Seguro em modo WAL
+    return con
+
+@contextmanager
+def transacao_sqlite():
+    """Transação de escrita: BEGIN IMMEDIATE pega o lock de escrita logo no início."""
+    with closing(conectar_sqlite()) as con:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            yield con
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+
+def _q(coluna):
+    return '"' + str(coluna).replace('"', '""') + '"'
+
+def _datas_iso(serie):
+    return converter_datas(serie).dt.strftime('%Y-%m-%d')
+
+def _hora_texto(valor):
+    if isinstance(valor, time):
+        return valor.strftime('%H:%M:%S')
+    return None if pd.isna(valor) or valor == '' else str(valor)
+
+def _para_sqlite(tabela, df):
+    """Converte um DataFrame do app para o formato gravado no SQLite."""
+    df = df.copy() # Pode ter só parte das colunas (gravação de células editadas)
+    if tabela == "registros":
+        for col in DATE_COLS_REGISTROS:
+            if col in df.columns:
+                df[col] = _datas_iso(df[col])
+    elif tabela == "treinamentos":
+        for col in DATE_COLS_TREINAMENTOS:
+            if col in df.columns:
+                df[col] = _datas_iso(df[col])
+        for col in TIME_COLS_TREINAMENTOS:
+            if col in df.columns:
+                df[col] = df[col].apply(_hora_texto)
+    elif tabela == "trilha":
+        if 'Matricula' in df.columns:
+            df['Matricula'] = df['Matricula'].astype(str)
+        for mes in COLUNAS_TRILHA[1:]:
+            if mes in df.columns:
+                df[mes] = df[mes].fillna(False).astype(bool).astype(int)
+    elif tabela == "base":
+        for col in DATAS_PLANILHAS[BASE_FILE]:
+            if col in df.columns:
+                df[col] = _datas_iso(df[col])
+    return df.astype(object).where(df.notna(), None)
+
+def _de_sqlite(tabela, df):
+    """Converte o resultado de uma consulta para os mesmos tipos que os leitores de arquivo devolvem."""
+    if tabela == "registros":
+        for col in DATE_COLS_REGISTROS:
+            df[col] = pd.to_datetime(df[col], format='%Y-%m-%d', errors='coerce')
+    elif tabela == "treinamentos":
+        for col in DATE_COLS_TREINAMENTOS:
+            df[col] = pd.to_datetime(df[col], format='%Y-%m-%d', errors='coerce')
+        for col in TIME_COLS_TREINAMENTOS:
+            df[col] = pd.to_datetime(df[col], format='%H:%M:%S', errors='coerce').dt.time
+    elif tabela == "trilha":
+        for mes in COLUNAS_TRILHA[1:]:
+            df[mes] = df[mes].astype(bool)
+    elif tabela == "base":
+        for col in DATAS_PLANILHAS[BASE_FILE]:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], format='%Y-%m-%d', errors='coerce')
+    return df
+
+def _inserir_linhas(con, tabela, df, modo="INSERT"):
+    if df.empty:
+        return
+    dados = _para_sqlite(tabela, df)
+    colunas_existentes = {linha[1] for linha in con.execute(f"PRAGMA table_info({tabela})")}
+    for col in dados.columns:
+        if col not in colunas_existentes: # Ex.: colunas de formulários antigos de feedback
+            con.execute(f"ALTER TABLE {tabela} ADD COLUMN {_q(col)} TEXT")
+    sql = (f"{modo} INTO {tabela} ({', '.join(_q(c) for c in dados.columns)}) "
+           f"VALUES ({', '.join('?' * len(dados.columns))})")
+    con.executemany(sql, dados.itertuples(index=False, name=None))
+
+def _registrar_escrita(con, tabela, reescrita=False):
+    con.execute("UPDATE versoes SET versao = versao + 1, geracao = geracao + ? WHERE tabela = ?", (int(reescrita), tabela))
+
+def _ler_arquivo_para_migracao(tabela):
+    """Conteúdo atual do arquivo equivalente, importado na primeira execução com SQLite."""
+    if tabela == "registros" and os.path.exists(CSV_FILE):
+        return _concatenar_registros(REGISTROS_COMPACTADOS)
+    if tabela == "feedback" and os.path.exists(CSV_FEEDBACK):
+        return pd.read_csv(CSV_FEEDBACK)
+    if tabela == "trilha" and os.path.exists(TRILHA_BITS):
+        return ProgressoTrilha.ler(TRILHA_BITS).como_tabela()
+    if tabela == "trilha" and os.path.exists(TRILHA_FILE):
+        return pd.read_csv(TRILHA_FILE, dtype={'Matricula': str})
+    if tabela == "treinamentos" and os.path.exists(TREINAMENTOS_FILE):
+        return _ler_treinamentos(assinatura_arquivo(TREINAMENTOS_FILE))
+    return None
+
+@st.cache_resource(show_spinner=False)
+def preparar_sqlite():
+    """Cria o esquema (uma vez por processo) e migra os arquivos existentes na primeira execução."""
+    with closing(conectar_sqlite()) as con:
+        con.execute("PRAGMA journal_mode = WAL")
+        con.executescript(ESQUEMA_SQLITE)
+    for tabela in TABELAS_SQLITE.values():
+        with transacao_sqlite() as con:
+            if con.execute("SELECT 1 FROM versoes WHERE tabela = ?", (tabela,)).fetchone():
+                continue # Já migrada (por este ou por outro processo)
+            con.execute("INSERT INTO versoes (tabela) VALUES (?)", (tabela,))
+            df = _ler_arquivo_para_migracao(tabela)
+            if df is not None:
+                _inserir_linhas(con, tabela, df)
+    return True
+
+def versao_sqlite(tabela):
+    """(versao, geracao) da tabela; 'geracao' só muda quando a tabela inteira é reescrita."""
+    preparar_sqlite()
+    with closing(conectar_sqlite()) as con:
+        linha = con.execute("SELECT versao, geracao FROM versoes WHERE tabela = ?", (tabela,)).fetchone()
+    return tuple(linha) if linha else (0, 0)
+
+def consultar_sqlite(tabela, condicoes=(), parametros=(), ordem="rowid", manter_id=False, limite=None, deslocamento=0):
+    """SELECT com filtros aplicados no próprio banco (usando os índices)."""
+    preparar_sqlite()
+    sql = f"SELECT * FROM {tabela}"
+    if condicoes:
+        sql += " WHERE " + " AND ".join(condicoes)
+    sql += f" ORDER BY {ordem}"
+    if limite is not None:
+        sql += f" LIMIT {int(limite)} OFFSET {int(deslocamento)}"
+    with closing(conectar_sqlite()) as con:
+        df = pd.read_sql_query(sql, con, params=list(parametros))
+    if not manter_id:
+        df = df.drop(columns=['id'], errors='ignore')
+    return _de_sqlite(tabela, df)
+
+def contar_sqlite(tabela, condicoes=(), parametros=()):
+    """COUNT(*) com os mesmos filtros de consultar_sqlite."""
+    preparar_sqlite()
+    sql = f"SELECT COUNT(*) FROM {tabela}"
+    if condicoes:
+        sql += " WHERE " + " AND ".join(condicoes)
+    with closing(conectar_sqlite()) as con:
+        return con.execute(sql, list(parametros)).fetchone()[0]
+
+def gravar_sqlite(tabela, df, substituir=False, modo="INSERT"):
+    """Grava as linhas numa única transação; com substituir=True a tabela inteira é trocada."""
+    preparar_sqlite()
+    with transacao_sqlite() as con:
+        if substituir:
+            con.execute(f"DELETE FROM {tabela}")
+        _inserir_linhas(con, tabela, df, modo)
+        _registrar_escrita(con, tabela, reescrita=substituir)
+    _ler_tabela_sqlite.clear()
+
+@st.cache_data(max_entries=10, show_spinner=False)
+def _ler_tabela_sqlite(tabela, versao):
+    return consultar_sqlite(tabela)
+
+def _sincronizar_base_sqlite():
+    """Reimporta Base.xlsx para a tabela 'base' quando a planilha muda."""
+    preparar_sqlite()
+    assinatura = repr(assinatura_arquivo(BASE_FILE))
+    with closing(conectar_sqlite()) as con:
+        if con.execute("SELECT origem FROM versoes WHERE tabela = 'base'").fetchone()[0] == assinatura:
+            return
+    df = _ler_base(assinatura_arquivo(BASE_FILE))
+    with transacao_sqlite() as con:
+        con.execute("DROP TABLE IF EXISTS base")
+        con.execute(f"CREATE TABLE base ({', '.join(_q(c) + ' TEXT' for c in df.columns) or 'MATRICULA TEXT'})")
+        for col in ('MATRICULA', 'COLABORADOR', 'UNIDADE'):
+            if col in df.columns:
+                con.execute(f"CREATE INDEX idx_base_{col.lower()} ON base ({_q(col)})")
+        _inserir_linhas(con, "base", df)
+        con.execute("UPDATE versoes SET versao = versao + 1, geracao = geracao + 1, origem = ? WHERE tabela = 'base'", (assinatura,))
+    _ler_tabela_sqlite.clear()
+
+# --- NOVA FUNÇÃO CENTRAL PARA LER A BASE ---
+def initialize_base():
+    if usando_sqlite():
+        _sincronizar_base_sqlite()
+        return _ler_tabela_sqlite("base", versao_sqlite("base"))
+    return _ler_base(assinatura_arquivo(BASE_FILE))
+
+def initialize_data(): # Registros de Atividades
+    if usando_sqlite():
+        return _ler_tabela_sqlite("registros", versao_sqlite("registros"))
+    if not os.path.exists(CSV_FILE):
+        df = pd.DataFrame(columns=COLUNAS_REGISTROS)
+        with trava_arquivo(CSV_FILE):
+            if not os.path.exists(CSV_FILE): # Outra sessão pode ter criado enquanto esperávamos
+                salvar_csv_atomico(df, CSV_FILE)
+        invalidar_cache(CSV_FILE)
+        return df
+    return _ler_registros(assinatura_arquivo(CSV_FILE), assinatura_arquivo(REGISTROS_COMPACTADOS))
+
+# --- REGISTROS DE ATIVIDADES: LOG DE EVENTOS + COMPACTAÇÃO ---
+# registros.csv é um log só de acréscimos: criar ou editar um projeto grava um novo
+# snapshot (uma linha por Colaborador + Nome_Projeto), sem reescrever o histórico.
+# Quando o log passa de LIMITE_LOG_REGISTROS, uma thread compacta o histórico em
+# registros.parquet (histórico completo) e registros_atual.parquet (visão materializada
+# com o último snapshot de cada projeto) e troca o log por um novo.
+class VisaoProjetosAtuais:
+    """Último snapshot de cada (Colaborador, Nome_Projeto), mantido incrementalmente.
+
+    Parte de registros_atual.parquet + log e, a cada leitura, aplica só as linhas que
+    entraram no log desde a leitura anterior (a partir do último byte processado).
+    Quando a compactação troca o log (outro inode), a visão é reconstruída. Com o
+    backend SQLite, o "offset" é o último id lido da tabela registros.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._log = None
+        self._offset_log = 0
+        self._colunas_log = COLUNAS_REGISTROS
+        self._indices_colaborador = None
+        self._versao_sqlite = None
+        self._geracao_sqlite = None
+        self._ultimo_id = 0
+        self.tabela = pd.DataFrame(columns=COLUNAS_REGISTROS)
+
+    def _ler_novas_linhas(self):
+        """Lê do log apenas as linhas completas após o último byte processado (None se o log foi trocado)."""
+        with open(CSV_FILE, 'rb') as f:
+            if os.fstat(f.fileno()).st_ino != self._log:
+                return None
+            f.seek(self._offset_log)
+            dados = f.read()
+        fim = dados.rfind(b'\n') + 1 # Uma linha ainda sendo escrita fica para a próxima leitura
+        if fim == 0:
+            return pd.DataFrame(columns=COLUNAS_REGISTROS)
+        novas = _ler_log_registros(io.BytesIO(dados[:fim]), colunas=self._colunas_log)
+        self._offset_log += fim
+        return novas
+
+    def _reconstruir(self):
+        leitura = _ler_instantaneo_registros(REGISTROS_ATUAL)
+        self._log, self._offset_log = leitura['log'], leitura['fim']
+        self._colunas_log = leitura['colunas_log']
+        self._indices_colaborador = None
+        if leitura['colunar'] is not None:
+            self.tabela = leitura['colunar'][COLUNAS_REGISTROS]
+        else:
+            self.tabela = pd.DataFrame(columns=COLUNAS_REGISTROS)
+        self._aplicar(leitura['trecho'])
+
+    def _aplicar(self, novas):
+        if novas.empty:
+            return
+        if self.tabela.empty:
+            self.tabela = _ultimo_snapshot(novas).reset_index(drop=True)
+        else:
+            # Só os projetos tocados pelas novas linhas são recalculados
+            afetados = pd.MultiIndex.from_frame(self.tabela[CHAVE_PROJETO]).isin(pd.MultiIndex.from_frame(novas[CHAVE_PROJETO]))
+            atualizados = _ultimo_snapshot(pd.concat([self.tabela[afetados], novas], ignore_index=True))
+            self.tabela = pd.concat([self.tabela[~afetados], atualizados], ignore_index=True)
+        self._indices_colaborador = None
+
+    def _sincronizar_sqlite(self):
+        versao, geracao = versao_sqlite("registros")
+        if geracao != self._geracao_sqlite:
+            # Tabela reescrita pela Administração: recomeça do zero
+            self._geracao_sqlite = geracao
+            self._versao_sqlite = None
+            self._ultimo_id = 0
+            self._indices_colaborador = None
+            self.tabela = pd.DataFrame(columns=COLUNAS_REGISTROS)
+        if versao != self._versao_sqlite:
+            novas = consultar_sqlite("registros", ["id > ?"], [self._ultimo_id], ordem="id", manter_id=True)
+            if not novas.empty:
+                self._ultimo_id = int(novas['id'].max())
+            self._versao_sqlite = versao
+            self._aplicar(novas[COLUNAS_REGISTROS])
+
+    def _sincronizar(self):
+        if usando_sqlite():
+            self._sincronizar_sqlite()
+            return
+        estado_log = os.stat(CSV_FILE)
+        if estado_log.st_ino != self._log or estado_log.st_size < self._offset_log:
+            # Compactação (ou log apagado): recomeça do parquet + trecho do log que ele não tem
+            self._reconstruir()
+        elif estado_log.st_size > self._offset_log:
+            novas = self._ler_novas_linhas()
+            if novas is None: # O log foi trocado entre o stat e a leitura
+                self._reconstruir()
+            else:
+                self._aplicar(novas)
+
+    def obter(self):
+        """Tabela de estado atual (somente leitura: ela é compartilhada entre as sessões)."""
+        with self._lock:
+            self._sincronizar()
+            return self.tabela
+
+    def do_colaborador(self, nome):
+        """Projetos atuais de um estagiário, por busca no índice de Colaborador."""
+        with self._lock:
+            self._sincronizar()
+            if self._indices_colaborador is None:
+                self._indices_colaborador = self.tabela.groupby('Colaborador').indices
+            return self.tabela.iloc[self._indices_colaborador.get(nome, [])]
+
+@st.cache_resource(show_spinner=False)
+def _visao_projetos_atuais():
+    return VisaoProjetosAtuais()
+
+def estado_atual_registros():
+    """Estado atual dos projetos: o último snapshot de cada (Colaborador, Nome_Projeto)."""
+    if not usando_sqlite() and not os.path.exists(CSV_FILE):
+        initialize_data() # Cria o log vazio
+    return _visao_projetos_atuais().obter()
+
+def versao_registros():
+    """Identifica a versão atual dos registros de atividades (log + compactação)."""
+    if usando_sqlite():
+        return versao_sqlite("registros")
+    return (assinatura_arquivo(CSV_FILE), assinatura_arquivo(REGISTROS_ATUAL))
+
+def projetos_do_estagiario(nome):
+    """Estado atual dos projetos de um estagiário."""
+    if not usando_sqlite() and not os.path.exists(CSV_FILE):
+        initialize_data()
+    return _visao_projetos_atuais().do_colaborador(nome)
+
+def map_status_to_percent(status):
+    if status == "Iniciado": return 0
+    elif status == "Pendente": return 50
+    elif status == "Concluído": return 100
+    return 0
+
+def _datas_registros_em_texto(df):
+    for col in DATE_COLS_REGISTROS:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.strftime('%d/%m/%Y').fillna('')
+    return df
+
+def anexar_registros(novas_linhas):
+    """Acrescenta eventos ao final do log; o custo não depende do tamanho do histórico."""
+    novas_linhas = novas_linhas[COLUNAS_REGISTROS].copy()
+    if usando_sqlite():
+        gravar_sqlite("registros", novas_linhas)
+        return
+    acrescentar_csv(_datas_registros_em_texto(novas_linhas), CSV_FILE, COLUNAS_REGISTROS)
+    invalidar_cache(CSV_FILE)
+    
+    if os.path.getsize(CSV_FILE) > LIMITE_LOG_REGISTROS:
+        compactacao_registros().agendar() # Fora da requisição: quem salvou não espera
+
+def atualizar_projetos(nome, original, alteracoes):
+    """Grava um novo snapshot só dos projetos editados (delta de alteracoes_do_editor).
+
+    Com a trava do log presa, confere se cada projeto ainda está como estava quando a
+    edição começou; se outra sessão o atualizou, levanta ConflitoDeEdicao sem gravar nada.
+    """
+    if not alteracoes['alteradas']:
+        return
+    with trava_arquivo(CSV_FILE):
+        atuais = projetos_do_estagiario(nome).set_index('Nome_Projeto')
+        projetos = original['Nome_Projeto']
+        versoes = {projetos[id_linha]: versao for id_linha, versao in alteracoes['versoes'].items()}
+        _verificar_versoes(atuais, versoes, alteracoes['colunas'])
+        
+        eventos = atuais.loc[list(versoes)].reset_index()[COLUNAS_REGISTROS].astype(object)
+        for posicao, (id_linha, mudancas) in enumerate(alteracoes['alteradas'].items()):
+            for coluna, valor in mudancas.items():
+                eventos.at[posicao, coluna] = valor
+        for col in DATE_COLS_REGISTROS:
+            eventos[col] = pd.to_datetime(eventos[col], errors='coerce')
+        # O novo snapshot precisa ordenar depois do anterior (que pode ter data futura)
+        hoje_registro = pd.Timestamp.now().normalize()
+        eventos['Data_Registro'] = eventos['Data_Registro'].clip(lower=hoje_registro).fillna(hoje_registro)
+        eventos['Percentual_Concluido'] = eventos['Status'].map(map_status_to_percent)
+        anexar_registros(eventos)
+
+def _preparar_compactacao(historico):
+    """Grava em temporários um log novo (só o cabeçalho) e os dois parquets apontando para ele."""
+    historico = historico[COLUNAS_REGISTROS].copy()
+    for col in DATE_COLS_REGISTROS:
+        historico[col] = pd.to_datetime(historico[col], errors='coerce')
+    
+    sufixo = f"{os.getpid()}.{threading.get_ident()}.tmp"
+    temporarios = {destino: f"{destino}.{sufixo}" for destino in (REGISTROS_COMPACTADOS, REGISTROS_ATUAL, CSV_FILE)}
+    try:
+        pd.DataFrame(columns=COLUNAS_REGISTROS).to_csv(temporarios[CSV_FILE], index=False, encoding='utf-8')
+        log_novo = os.stat(temporarios[CSV_FILE])
+        metadados = {b'log_id': str(log_novo.st_ino).encode(), b'log_offset': str(log_novo.st_size).encode()}
+        for destino, df in ((REGISTROS_COMPACTADOS, historico), (REGISTROS_ATUAL, _ultimo_snapshot(historico))):
+            tabela = pa.Table.from_pandas(df, preserve_index=False)
+            tabela = tabela.replace_schema_metadata({**(tabela.schema.metadata or {}), **metadados})
+            pq.write_table(tabela, temporarios[destino])
+            with open(temporarios[destino], 'rb+') as f:
+                os.fsync(f.fileno())
+    except BaseException:
+        _descartar_temporarios(temporarios)
+        raise
+    return temporarios
+
+def _descartar_temporarios(temporarios):
+    for temporario in temporarios.values():
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+def _instalar_compactacao(temporarios):
+    """Troca os arquivos (com a trava do log presa). O log vai por último: até ele ser
+    trocado, os parquets novos não batem com o log e quem lê espera pela trava."""
+    with open(temporarios[CSV_FILE], 'rb+') as f:
+        os.fsync(f.fileno())
+    for destino in (REGISTROS_COMPACTADOS, REGISTROS_ATUAL, CSV_FILE):
+        os.replace(temporarios[destino], destino)
+    _fsync_diretorio(CSV_FILE)
+
+def _copiar_final_do_log(leitura, log_novo):
+    """Passa para o log novo os eventos acrescentados depois da leitura do histórico."""
+    with open(CSV_FILE, 'rb') as f:
+        f.seek(leitura['fim'])
+        dados = f.read()
+    if not dados.strip():
+        return
+    if leitura['colunas_log'] != COLUNAS_REGISTROS: # Log com cabeçalho antigo: regrava no formato atual
+        trecho = _ler_log_registros(io.BytesIO(dados), colunas=leitura['colunas_log'], levantar=True)
+        trecho = _datas_registros_em_texto(trecho)
+        dados = trecho.to_csv(index=False, header=False, lineterminator='\n').encode('utf-8')
+    elif not dados.endswith(b'\n'):
+        dados += b'\n'
+    with open(log_novo, 'ab') as f:
+        f.write(dados)
+
+def compactar_registros(historico=None):
+    """Grava o histórico nos arquivos colunares e começa um log novo.
+
+    Sem argumento compacta o histórico atual: ler e gravar o parquet roda sem a trava do
+    log, que só é presa no fim para copiar os eventos que chegaram nesse meio tempo e
+    trocar os arquivos. Com um DataFrame, ele passa a ser o histórico completo (a
+    Administração usa isso para corrigir ou apagar registros, já com a trava presa).
+    """
+    if usando_sqlite():
+        if historico is not None: # No SQLite não há log a compactar
+            gravar_sqlite("registros", historico[COLUNAS_REGISTROS], substituir=True)
+        return
+    if historico is not None:
+        with trava_arquivo(CSV_FILE):
+            temporarios = _preparar_compactacao(historico)
+            try:
+                _instalar_compactacao(temporarios)
+            finally:
+                _descartar_temporarios(temporarios)
+        invalidar_cache(CSV_FILE)
+        return
+    
+    # Leitura direta, sem cache; se o log não puder ser lido, a compactação para aqui e o log fica intacto
+    leitura = _ler_instantaneo_registros(REGISTROS_COMPACTADOS, levantar=True)
+    temporarios = _preparar_compactacao(_historico_da_leitura(leitura))
+    try:
+        with trava_arquivo(CSV_FILE):
+            if not os.path.exists(CSV_FILE) or os.stat(CSV_FILE).st_ino != leitura['log']:
+                return # Outra compactação (ou a Administração) trocou o log enquanto isso
+            metadados = None
+            if os.path.exists(REGISTROS_COMPACTADOS):
+                metadados = _metadados_compactacao(pq.read_schema(REGISTROS_COMPACTADOS).metadata)
+            if metadados != leitura['metadados']:
+                return
+            _copiar_final_do_log(leitura, temporarios[CSV_FILE])
+            _instalar_compactacao(temporarios)
+    finally:
+        _descartar_temporarios(temporarios)
+    invalidar_cache(CSV_FILE)
+
+class CompactacaoEmSegundoPlano:
+    """Roda compactar_registros() numa thread própria, uma de cada vez no processo."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def agendar(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._compactar, name="compactacao-registros", daemon=True)
+            self._thread.start()
+
+    @staticmethod
+    def _compactar():
+        # Sem contexto de página nesta thread: st.* não chegaria a ninguém, então o erro vai para o log do servidor
+        try:
+            compactar_registros()
+        except Exception:
+            logging.getLogger(__name__).exception(
+                "Falha ao compactar %s; o log ficou como estava e a próxima compactação tenta de novo.", CSV_FILE)
+
+    def aguardar(self):
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+@st.cache_resource(show_spinner=False)
+def compactacao_registros():
+    return CompactacaoEmSegundoPlano()
+
+def initialize_trilha(base_df): # Trilha de Desenvolvimento
+    if usando_sqlite():
+        df_trilha = _ler_tabela_sqlite("trilha", versao_sqlite("trilha"))
+        if df_trilha.empty and "MATRICULA" in base_df.columns:
+            df_trilha = pd.DataFrame({'Matricula': base_df["MATRICULA"].dropna().unique()})
+            df_trilha[COLUNAS_TRILHA[1:]] = False
+            gravar_sqlite("trilha", df_trilha)
+        return df_trilha
+    if not os.path.exists(TRILHA_BITS) and not _criar_progresso_trilha(base_df):
+        return pd.DataFrame(columns=COLUNAS_TRILHA)
+    return _ler_trilha(assinatura_arquivo(TRILHA_BITS))
+
+def _criar_progresso_trilha(base_df):
+    """Cria o arquivo de progresso: importa o CSV antigo ou começa com tudo pendente. False se não der."""
+    try:
+        with trava_arquivo(TRILHA_BITS):
+            if os.path.exists(TRILHA_BITS):
+                return True
+            if os.path.exists(TRILHA_FILE):
+                progresso = ProgressoTrilha.de_tabela(pd.read_csv(TRILHA_FILE, dtype={'Matricula': str}))
+            elif "MATRICULA" in base_df.columns:
+                progresso = ProgressoTrilha.vazio(base_df["MATRICULA"].dropna().unique())
+            else:
+                st.error("Arquivo 'Base.xlsx' não contém a coluna 'MATRICULA'.")
+                return False
+            progresso.gravar(TRILHA_BITS)
+        invalidar_cache(TRILHA_BITS)
+        return True
+    except Exception as e:
+        st.error(f"Erro ao inicializar {TRILHA_BITS}: {e}")
+        return False
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _progresso_trilha_sqlite(versao):
+    return ProgressoTrilha.de_tabela(_ler_tabela_sqlite("trilha", versao))
+
+def progresso_trilha(base_df):
+    """Progresso das trilhas como máscara de bits (ProgressoTrilha), com qualquer backend."""
+    if usando_sqlite():
+        initialize_trilha(base_df) # Garante as linhas na primeira execução
+        return _progresso_trilha_sqlite(versao_sqlite("trilha"))
+    if not os.path.exists(TRILHA_BITS) and not _criar_progresso_trilha(base_df):
+        return ProgressoTrilha.vazio()
+    return _ler_progresso_trilha(assinatura_arquivo(TRILHA_BITS))
+
+def exportar_trilha_csv():
+    """Progresso das trilhas em CSV (mesmo formato do antigo progresso_trilha.csv)."""
+    return initialize_trilha(initialize_base()).to_csv(index=False).encode('utf-8')
+
+def initialize_somar(): # Somar Ideias
+    if not os.path.exists(SOMAR_FILE):
+        # st.warning(f"O arquivo '{SOMAR_FILE}' não foi encontrado. O indicador do Somar Ideias está desabilitado.")
+        # st.warning("Por favor, adicione o arquivo ao repositório do app.")
+        return pd.DataFrame()
+    return _ler_somar(assinatura_arquivo(SOMAR_FILE))
+
+# --- ATUALIZADO: Função de Treinamentos ---
+def initialize_treinamentos():
+    if usando_sqlite():
+        return _ler_tabela_sqlite("treinamentos", versao_sqlite("treinamentos"))
+    if not os.path.exists(TREINAMENTOS_FILE):
+        df = pd.DataFrame(columns=COLUNAS_TREINAMENTOS)
+        with trava_arquivo(TREINAMENTOS_FILE):
+            if not os.path.exists(TREINAMENTOS_FILE):
+                salvar_csv_atomico(df, TREINAMENTOS_FILE)
+        invalidar_cache(TREINAMENTOS_FILE)
+        return df
+    return _ler_treinamentos(assinatura_arquivo(TREINAMENTOS_FILE))
+
+def initialize_feedback(): # Feedbacks dos Gestores
+    if usando_sqlite():
+        df = _ler_tabela_sqlite("feedback", versao_sqlite("feedback"))
+        return df if not df.empty else pd.DataFrame()
+    if not os.path.exists(CSV_FEEDBACK):
+        return pd.DataFrame()
+    return _ler_feedback(assinatura_arquivo(CSV_FEEDBACK))
+
+# --- CONSULTAS FILTRADAS ---
+# Com SQLite, os filtros vão para o WHERE (usando os índices); com arquivos, são
+# aplicados sobre o DataFrame já cacheado.
+def carregar_registros(data_inicio=None, data_fim=None, colaborador=None):
+    """Registros de atividades por período de Data_Registro e/ou colaborador."""
+    if usando_sqlite():
+        condicoes, parametros = [], []
+        if data_inicio is not None:
+            condicoes.append("Data_Registro >= ?"); parametros.append(data_inicio.strftime('%Y-%m-%d'))
+        if data_fim is not None:
+            condicoes.append("Data_Registro <= ?"); parametros.append(data_fim.strftime('%Y-%m-%d'))
+        if colaborador is not None:
+            condicoes.append("Colaborador = ?"); parametros.append(colaborador)
+        return consultar_sqlite("registros", condicoes, parametros)
+    
+    df = initialize_data()
+    if data_inicio is not None:
+        df = df[df['Data_Registro'].dt.date >= data_inicio]
+    if data_fim is not None:
+        df = df[df['Data_Registro'].dt.date <= data_fim]
+    if colaborador is not None:
+        df = df[df['Colaborador'] == colaborador]
+    return df
+
+def carregar_treinamentos(unidade=None, a_partir_de=None):
+    """Treinamentos de uma unidade e/ou a partir de uma data, ordenados por data."""
+    return calendario_treinamentos().consultar(unidade, a_partir_de)
+
+def carregar_feedback(estagiario=None):
+    """Feedbacks dos gestores, opcionalmente de um único estagiário."""
+    if usando_sqlite() and estagiario is not None:
+        df = consultar_sqlite("feedback", ["Estagiario = ?"], [estagiario])
+        return df if not df.empty else pd.DataFrame()
+    df = initialize_feedback()
+    if estagiario is not None and not df.empty:
+        df = df[df['Estagiario'] == estagiario]
+    return df
+
+# --- CALENDÁRIO DE TREINAMENTOS ---
+# O calendário é ordenado por data uma vez por versão de treinamentos.csv (ou da tabela),
+# com as posições de cada unidade guardadas à parte. "A partir de hoje", "da unidade" e
+# o agrupamento da agenda por dia viram buscas binárias e cortes, sem filtrar o ano inteiro.
+class CalendarioTreinamentos:
+    """Treinamentos com data, ordenados por data (empates na ordem do arquivo). Somente leitura."""
+    def __init__(self, df):
+        self.por_data = df[df['Data'].notna()].sort_values('Data', kind='stable').reset_index(drop=True)
+        self._dias = self.por_data['Data'].to_numpy(dtype='datetime64[D]')
+        # Posições (já em ordem de data) de cada unidade
+        self._unidades = {unidade: (posicoes, self._dias[posicoes])
+                          for unidade, posicoes in self.por_data.groupby('Unidade', sort=False).indices.items()}
+        self.recursos = AgendaDeRecursos(self.por_data) # Para conferir conflitos de horário
+    
+    def unidades(self):
+        return sorted(self._unidades)
+    
+    def consultar(self, unidade=None, a_partir_de=None):
+        if unidade is None:
+            posicoes, dias = None, self._dias
+        else:
+            posicoes, dias = self._unidades.get(unidade, (np.array([], dtype=np.intp), self._dias[:0]))
+        inicio = 0 if a_partir_de is None else np.searchsorted(dias, np.datetime64(a_partir_de, 'D'), side='left')
+        if posicoes is None:
+            return self.por_data.iloc[inicio:]
+        return self.por_data.iloc[posicoes[inicio:]]
+    
+    def agenda(self, unidade=None, a_partir_de=None):
+        """[(data, treinamentos do dia)] em ordem de data."""
+        treinamentos = self.consultar(unidade, a_partir_de)
+        if treinamentos.empty:
+            return []
+        dias = treinamentos['Data'].to_numpy(dtype='datetime64[D]')
+        cortes = np.flatnonzero(dias[1:] != dias[:-1]) + 1
+        inicios, fins = np.concatenate([[0], cortes]), np.concatenate([cortes, [len(dias)]])
+        return [(dias[i].item(), treinamentos.iloc[i:j]) for i, j in zip(inicios, fins)]
+
+def versao_treinamentos():
+    """Identifica a versão atual do calendário de treinamentos."""
+    if usando_sqlite():
+        return versao_sqlite("treinamentos")
+    return assinatura_arquivo(TREINAMENTOS_FILE)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _montar_calendario(versao):
+    return CalendarioTreinamentos(initialize_treinamentos())
+
+def calendario_treinamentos():
+    """Calendário da versão atual (compartilhado entre as sessões)."""
+    if not usando_sqlite() and not os.path.exists(TREINAMENTOS_FILE):
+        initialize_treinamentos() # Cria o arquivo vazio
+    return _montar_calendario(versao_treinamentos())
+
+# --- CONFLITOS DE HORÁRIO DOS TREINAMENTOS ---
+# Cada treinamento ocupa a sua unidade e, se for presencial, o local. As ocupações de
+# cada recurso ficam ordenadas pelo início (em minutos); como nenhuma dura mais que a
+# maior delas, as que podem se sobrepor a [início, fim) estão numa faixa achada por busca
+# binária. Um treinamento novo é conferido contra a agenda em cache, e o calendário
+# editado inteiro é conferido numa passada por recurso, sem comparar todos os pares.
+MAX_CONFLITOS_EXIBIDOS = 10
+
+def _datas_treinamentos(datas):
+    if pd.api.types.is_datetime64_any_dtype(datas):
+        return datas
+    # Texto DD/MM/AAAA do formulário ou datas (date/Timestamp) devolvidas pelo editor
+    return converter_datas(datas.map(lambda v: v.isoformat() if hasattr(v, 'isoformat') else v))
+
+def _intervalos_treinamentos(df):
+    """(início, fim) de cada linha em minutos; NaN se faltar data ou horário."""
+    datas = _datas_treinamentos(df['Data'])
+    minutos = lambda col: (datas + pd.to_timedelta(df[col].map(_hora_texto), errors='coerce')).to_numpy(dtype='datetime64[m]')
+    inicio, fim = minutos('Inicio'), minutos('Termino')
+    validos = ~np.isnat(inicio) & ~np.isnat(fim)
+    return (pd.Series(np.where(validos, inicio.astype(np.int64), np.nan), index=df.index),
+            pd.Series(np.where(validos, fim.astype(np.int64), np.nan), index=df.index))
+
+def _ocupacoes(df):
+    """Uma linha por (treinamento, recurso): 'unidade:<nome>' e, se presencial, 'local:<local>'."""
+    inicio, fim = _intervalos_treinamentos(df)
+    validos = fim > inicio
+    local = df['Local_Link'].fillna('').astype(str).str.strip()
+    presencial = validos & df['Modalidade'].eq('Presencial') & local.ne('')
+    unidade = validos & df['Unidade'].notna()
+    partes = [
+        pd.DataFrame({'linha': df.index[unidade], 'recurso': 'unidade:' + df.loc[unidade, 'Unidade'].astype(str)}),
+        pd.DataFrame({'linha': df.index[presencial], 'recurso': 'local:' + local[presencial].str.casefold()}),
+    ]
+    ocupacoes = pd.concat(partes, ignore_index=True)
+    ocupacoes['inicio'] = inicio.loc[ocupacoes['linha']].to_numpy().astype(np.int64)
+    ocupacoes['fim'] = fim.loc[ocupacoes['linha']].to_numpy().astype(np.int64)
+    return ocupacoes
+
+def _sobrepostos(inicios, fins, duracao_max, consultas_inicio, consultas_fim):
+    """Pares (consulta, posição) com inicios[pos] < fim e fins[pos] > início; 'inicios' ordenado."""
+    de = np.searchsorted(inicios, consultas_inicio - duracao_max, side='right')
+    ate = np.searchsorted(inicios, consultas_fim, side='left')
+    contagem = np.maximum(ate - de, 0)
+    consulta = np.repeat(np.arange(len(consultas_inicio)), contagem)
+    posicao = np.repeat(de - np.cumsum(contagem) + contagem, contagem) + np.arange(contagem.sum())
+    sobrepoe = fins[posicao] > consultas_inicio[consulta]
+    return consulta[sobrepoe], posicao[sobrepoe]
+
+def _recursos_ordenados(ocupacoes):
+    for recurso, grupo in ocupacoes.groupby('recurso', sort=False):
+        grupo = grupo.sort_values('inicio', kind='stable')
+        inicios, fins = grupo['inicio'].to_numpy(), grupo['fim'].to_numpy()
+        yield recurso, (inicios, fins, (fins - inicios).max(), grupo['linha'].to_numpy())
+
+class AgendaDeRecursos:
+    """Ocupações de cada recurso ordenadas pelo início. Somente leitura."""
+    def __init__(self, df):
+        self._recursos = dict(_recursos_ordenados(_ocupacoes(df)))
+    
+    def conflitos(self, df):
+        """[(linha de df, recurso, linha da agenda)] das linhas de 'df' que se sobrepõem à agenda."""
+        pares = []
+        for recurso, grupo in _ocupacoes(df).groupby('recurso', sort=False):
+            if recurso not in self._recursos:
+                continue
+            inicios, fins, duracao_max, linhas = self._recursos[recurso]
+            consulta, posicao = _sobrepostos(inicios, fins, duracao_max, grupo['inicio'].to_numpy(), grupo['fim'].to_numpy())
+            pares += zip(grupo['linha'].to_numpy()[consulta], [recurso] * len(consulta), linhas[posicao])
+        return pares
+
+def conflitos_de_horario(df, linhas=None):
+    """[(linha, recurso, outra linha)] de treinamentos de 'df' no mesmo recurso ao mesmo tempo.
+
+    Com 'linhas', só os pares que envolvem alguma delas (conflitos antigos entre linhas
+    que ninguém mexeu não impedem a gravação).
+    """
+    pares = []
+    for recurso, (inicios, fins, duracao_max, rotulos) in _recursos_ordenados(_ocupacoes(df)):
+        consulta, posicao = _sobrepostos(inicios, fins, duracao_max, inicios, fins)
+        antes = posicao < consulta # Cada par uma vez (e sem o próprio treinamento)
+        pares += zip(rotulos[consulta[antes]], [recurso] * int(antes.sum()), rotulos[posicao[antes]])
+    if linhas is not None:
+        linhas = set(linhas)
+        pares = [par for par in pares if par[0] in linhas or par[2] in linhas]
+    return pares
+
+def _descrever_treinamento(linha):
+    inicio, fim = _hora_texto(linha['Inicio']) or '?', _hora_texto(linha['Termino']) or '?'
+    data = _datas_treinamentos(pd.Series([linha['Data']], dtype=object))[0]
+    data = data.strftime('%d/%m/%Y') if pd.notna(data) else '?'
+    return f"'{linha['Nome_Treinamento']}' ({data}, {inicio[:5]}–{fim[:5]}, {linha['Unidade']})"
+
+def _mensagens_de_conflito(df, pares, outros, tocadas):
+    """Textos para o admin: horários inválidos das linhas 'tocadas' e pares em conflito."""
+    inicio, fim = _intervalos_treinamentos(df.loc[tocadas])
+    mensagens = [f"{_descrever_treinamento(df.loc[i])}: o término precisa ser depois do início."
+                 for i in inicio.index[~(fim > inicio)]]
+    recursos_do_par = {}
+    for linha, recurso, outra in pares:
+        tipo, nome = recurso.split(':', 1)
+        recursos_do_par.setdefault((linha, outra), []).append(f"mesma unidade ({nome})" if tipo == 'unidade' else f"mesmo local ({nome})")
+    for (linha, outra), recursos in recursos_do_par.items():
+        mensagens.append(f"{_descrever_treinamento(df.loc[linha])} × {_descrever_treinamento(outros.loc[outra])}: {' e '.join(recursos)}")
+    if len(mensagens) > MAX_CONFLITOS_EXIBIDOS:
+        mensagens = mensagens[:MAX_CONFLITOS_EXIBIDOS] + [f"... e mais {len(mensagens) - MAX_CONFLITOS_EXIBIDOS} conflito(s)."]
+    return mensagens
+
+def conflitos_do_novo_treinamento(nova_linha):
+    """Problemas de horário de um treinamento ainda não gravado (consulta à agenda em cache)."""
+    calendario = calendario_treinamentos()
+    return _mensagens_de_conflito(nova_linha, calendario.recursos.conflitos(nova_linha), calendario.por_data, nova_linha.index)
+
+def conflitos_da_edicao_treinamentos(alteracoes):
+    """Problemas de horário do calendário como ficaria com o delta do editor (uma passada)."""
+    if usando_sqlite():
+        proposto = consultar_sqlite("treinamentos", manter_id=True).set_index('id')
+    else:
+        proposto = _tabela_admin("treinamentos", _versao_arquivo_admin("treinamentos"))
+    proposto = proposto.astype(object)
+    for id_linha, mudancas in alteracoes['alteradas'].items():
+        for coluna, valor in mudancas.items():
+            if id_linha in proposto.index:
+                proposto.at[id_linha, coluna] = valor
+    proposto = proposto.drop(index=[i for i in alteracoes['removidas'] if i in proposto.index])
+    novas = alteracoes['novas'].astype(object)
+    novas.index = [f"nova_{i}" for i in range(len(novas))]
+    proposto = pd.concat([proposto, novas])
+    tocadas = [i for i in alteracoes['alteradas'] if i in proposto.index] + list(novas.index)
+    return _mensagens_de_conflito(proposto, conflitos_de_horario(proposto, tocadas), proposto, tocadas)
+
+# --- AGENDA .ICS POR UNIDADE ---
+# Cada unidade tem um feed iCalendar com os seus treinamentos, para o estagiário assinar
+# no calendário do celular sem abrir o app. Os feeds ficam em memória e, com static
+# serving ligado, em STATIC_DIR/agenda/<unidade>.ics (servidos direto pelo Streamlit, sem
+# rodar script). A cada versão do calendário só as unidades cujas linhas mudaram
+# (comparadas por um hash das linhas) têm o feed gerado de novo.
+PASTA_AGENDA_ICS = "agenda" # Dentro de STATIC_DIR
+FUSO_TREINAMENTOS = "America/Sao_Paulo" # Horário de Brasília, sem horário de verão desde 2019
+
+def _slug_unidade(unidade):
+    """Nome de arquivo da unidade: 'Paraguaçu Paulista' -> 'paraguacu-paulista'."""
+    return '-'.join(dobrar_nomes([unidade])[0].lower().replace('-', ' ').split()) or 'sem-unidade'
+
+def _texto_ics(valor):
+    """Escapa um texto para o iCalendar (RFC 5545, seção 3.3.11)."""
+    texto = '' if pd.isna(valor) else str(valor).strip()
+    return (texto.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def _dobrar_linha_ics(linha):
+    """Quebra a linha em pedaços de até 75 bytes (continuação começa com espaço)."""
+    pedacos, atual = [], b''
+    for caractere in linha:
+        byte = caractere.encode('utf-8')
+        if len(atual) + len(byte) > (75 if not pedacos else 74):
+            pedacos.append(atual)
+            atual = b''
+        atual += byte
+    return b'\r\n '.join(pedacos + [atual])
+
+def _eventos_ics(linhas, carimbo):
+    """Linhas VEVENT dos treinamentos de uma unidade (em ordem de data)."""
+    eventos, vistos = [], {}
+    for linha in linhas.itertuples(index=False):
+        data, inicio, termino = linha.Data, linha.Inicio, linha.Termino
+        # UID estável: o mesmo treinamento mantém o UID quando outras linhas mudam
+        chave = '|'.join(str(v) for v in (linha.Unidade, linha.Nome_Treinamento, data.date(), inicio, linha.Local_Link))
+        vistos[chave] = vistos.get(chave, 0) + 1
+        uid = hashlib.sha1(f"{chave}|{vistos[chave]}".encode('utf-8')).hexdigest()
+        evento = ["BEGIN:VEVENT", f"UID:{uid}@estagiococal", f"DTSTAMP:{carimbo}"]
+        if isinstance(inicio, time):
+            evento.append(f"DTSTART;TZID={FUSO_TREINAMENTOS}:{datetime.combine(data.date(), inicio):%Y%m%dT%H%M%S}")
+            if isinstance(termino, time) and termino > inicio:
+                evento.append(f"DTEND;TZID={FUSO_TREINAMENTOS}:{datetime.combine(data.date(), termino):%Y%m%dT%H%M%S}")
+        else:
+            evento.append(f"DTSTART;VALUE=DATE:{data:%Y%m%d}") # Sem horário: evento de dia inteiro
+        evento.append(f"SUMMARY:{_texto_ics(linha.Nome_Treinamento)}")
+        local = '' if pd.isna(linha.Local_Link) else str(linha.Local_Link).strip()
+        if linha.Modalidade == "Presencial":
+            evento.append(f"LOCATION:{_texto_ics(local)}")
+        elif local.startswith('http'):
+            evento += [f"LOCATION:{_texto_ics(linha.Modalidade)}", f"URL:{local}"]
+        descricao = f"Modalidade: {linha.Modalidade}\nUnidade: {linha.Unidade}\nLocal/Link: {local}"
+        evento.append(f"DESCRIPTION:{_texto_ics(descricao)}")
+        evento.append("END:VEVENT")
+        eventos += evento
+    return eventos
+
+def gerar_ics(unidade, linhas):
+    """Feed iCalendar (bytes, CRLF) dos treinamentos 'linhas' da unidade."""
+    carimbo = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    nome_calendario = f"Treinamentos - {unidade}"
+    conteudo = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Cocal//Estagio Cocal//PT-BR", "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH", f"X-WR-CALNAME:{_texto_ics(nome_calendario)}",
+        f"X-WR-TIMEZONE:{FUSO_TREINAMENTOS}", "REFRESH-INTERVAL;VALUE=DURATION:PT6H", "X-PUBLISHED-TTL:PT6H",
+        "BEGIN:VTIMEZONE", f"TZID:{FUSO_TREINAMENTOS}", "BEGIN:STANDARD", "DTSTART:19700101T000000",
+        "TZOFFSETFROM:-0300", "TZOFFSETTO:-0300", "TZNAME:-03", "END:STANDARD", "END:VTIMEZONE",
+        *_eventos_ics(linhas, carimbo),
+        "END:VCALENDAR",
+    ]
+    return b'\r\n'.join(_dobrar_linha_ics(linha) for linha in conteudo) + b'\r\n'
+
+def _hash_das_linhas(linhas):
+    return hashlib.sha1(pd.util.hash_pandas_object(linhas[COLUNAS_TREINAMENTOS], index=False).to_numpy().tobytes()).hexdigest()
+
+class FeedsDeTreinamentos:
+    """Feeds .ics de todas as unidades, atualizados por unidade quando as linhas dela mudam."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versao = None
+        self._hashes = {}
+        self._feeds = {}
+
+    def _publicar(self, unidade, feed):
+        if not st.get_option("server.enableStaticServing"):
+            return
+        pasta = os.path.join(STATIC_DIR, PASTA_AGENDA_ICS)
+        os.makedirs(pasta, exist_ok=True)
+        caminho = os.path.join(pasta, f"{_slug_unidade(unidade)}.ics")
+        with trava_arquivo(caminho):
+            if feed is None:
+                if os.path.exists(caminho):
+                    os.remove(caminho)
+                return
+            def escrever(temporario):
+                with open(temporario, 'wb') as f:
+                    f.write(feed)
+            escrever_atomico(caminho, escrever) # Quem assina nunca baixa o arquivo pela metade
+
+    def _sincronizar(self):
+        versao = versao_treinamentos()
+        if versao == self._versao:
+            return
+        calendario = calendario_treinamentos()
+        hashes = {}
+        for unidade in calendario.unidades():
+            linhas = calendario.consultar(unidade)
+            hashes[unidade] = _hash_das_linhas(linhas)
+            if self._hashes.get(unidade) != hashes[unidade]:
+                self._feeds[unidade] = gerar_ics(unidade, linhas)
+                self._publicar(unidade, self._feeds[unidade])
+        for unidade in set(self._hashes) - set(hashes): # Unidade sem treinamentos: o feed sai
+            self._feeds.pop(unidade, None)
+            self._publicar(unidade, None)
+        self._hashes, self._versao = hashes, versao
+
+    def sincronizar(self):
+        with self._lock:
+            self._sincronizar()
+
+    def feed(self, unidade):
+        """Bytes do .ics da unidade (um calendário vazio se ela não tiver treinamentos)."""
+        with self._lock:
+            self._sincronizar()
+            if unidade not in self._feeds:
+                return gerar_ics(unidade, calendario_treinamentos().consultar(unidade))
+            return self._feeds[unidade]
+
+@st.cache_resource(show_spinner=False)
+def feeds_treinamentos():
+    return FeedsDeTreinamentos()
+
+def feed_ics_da_unidade(unidade):
+    return feeds_treinamentos().feed(unidade)
+
+def nome_arquivo_ics(unidade):
+    return f"treinamentos-{_slug_unidade(unidade)}.ics"
+
+def url_feed_ics(unidade):
+    """Endereço para assinar o feed da unidade (None sem static serving)."""
+    if not st.get_option("server.enableStaticServing"):
+        return None
+    feeds_treinamentos().sincronizar() # Garante o arquivo publicado
+    base = st.get_option("server.baseUrlPath").strip('/')
+    caminho = '/'.join(p for p in (base, "app/static", PASTA_AGENDA_ICS, f"{_slug_unidade(unidade)}.ics") if p)
+    endereco = urlsplit(st.context.url or '')
+    if not endereco.netloc:
+        return f"/{caminho}"
+    return f"{endereco.scheme}://{endereco.netloc}/{caminho}"
+
+def botoes_agenda_ics(unidade, key):
+    """Baixar o .ics da unidade e, com static serving, o endereço para assinar no celular."""
+    st.download_button(
+        f"📅 Baixar agenda de {unidade} (.ics)", data=lambda: feed_ics_da_unidade(unidade),
+        file_name=nome_arquivo_ics(unidade), mime="text/calendar", on_click="ignore", key=key,
+    )
+    url = url_feed_ics(unidade)
+    if url:
+        assinatura = url.replace("https://", "webcal://", 1).replace("http://", "webcal://", 1)
+        st.caption(f"Para receber as atualizações no celular, [assine a agenda]({assinatura}) ou adicione este endereço no seu calendário:")
+        st.code(url, language=None)
+
+# --- PONTUAÇÃO DOS FEEDBACKS ---
+# As respostas viram uma matriz int8 de notas (4=Excelente ... 1=Ruim, 0=sem resposta)
+# uma única vez por versão do arquivo; os agregados por estagiário ficam no cache e o
+# filtro da sidebar só escolhe linhas já somadas.
+COMPETENCIAS_FEEDBACK = ['Iniciativa', 'Aprendizagem', 'Qualidade', 'Relacoes']
+AVALIACOES_FEEDBACK = ['Ruim', 'Regular', 'Bom', 'Excelente'] # Posição + 1 = nota
+COLUNAS_NAO_COMPETENCIA = ['DATA', 'GESTOR', 'Data_Hora', 'Gestor', 'Estagiario', 'Feedback_Livre', 'sugestao_melhoria']
+
+def versao_feedback():
+    """Identifica a versão atual dos feedbacks (chave do cache da pontuação)."""
+    if usando_sqlite():
+        return versao_sqlite("feedback")
+    return assinatura_arquivo(CSV_FEEDBACK)
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _pontuar_feedbacks(versao):
+    df = initialize_feedback()
+    competencias = [col for col in df.columns if col not in COLUNAS_NAO_COMPETENCIA]
+    com_nota = [col for col in COMPETENCIAS_FEEDBACK if col in competencias]
+    estagiarios = df['Estagiario'].fillna('') if 'Estagiario' in df.columns else pd.Series('', index=df.index)
+    codigo_estagiario, nomes = pd.factorize(estagiarios)
+    n_estagiarios = len(nomes)
+    
+    # Distribuição: contagem de cada resposta (de todas as competências) por estagiário
+    valores = df[competencias].to_numpy(dtype=object).ravel()
+    codigo_valor, avaliacoes = pd.factorize(valores)
+    linha_valor = np.repeat(codigo_estagiario, len(competencias))
+    validos = codigo_valor >= 0
+    contagens = np.bincount(linha_valor[validos] * len(avaliacoes) + codigo_valor[validos],
+                            minlength=n_estagiarios * len(avaliacoes)).reshape(n_estagiarios, len(avaliacoes))
+    
+    # Notas: matriz linhas x competências, somada por estagiário
+    notas = np.column_stack([
+        pd.Categorical(df[col], categories=AVALIACOES_FEEDBACK).codes + 1 for col in com_nota
+    ]).astype(np.int8) if com_nota else np.zeros((len(df), 0), dtype=np.int8)
+    somas = np.zeros((n_estagiarios, len(com_nota)), dtype=np.int64)
+    np.add.at(somas, codigo_estagiario, notas)
+    
+    return {
+        'competencias': competencias,
+        'com_nota': com_nota,
+        'contagens': pd.DataFrame(contagens, index=nomes, columns=avaliacoes.astype(str)),
+        'somas': pd.DataFrame(somas, index=nomes, columns=com_nota),
+        'linhas': pd.Series(np.bincount(codigo_estagiario, minlength=n_estagiarios), index=nomes),
+    }
+
+def pontuacao_feedbacks():
+    """Agregados (cacheados) das avaliações dos gestores."""
+    return _pontuar_feedbacks(versao_feedback())
+
+def _linhas_do_filtro(tabela, estagiario):
+    if estagiario is None:
+        return tabela
+    return tabela.loc[tabela.index == estagiario]
+
+def feedbacks_avaliados(pontuacao, estagiario=None):
+    """Quantidade de feedbacks (linhas) de um estagiário, ou de todos."""
+    return int(_linhas_do_filtro(pontuacao['linhas'], estagiario).sum())
+
+def distribuicao_avaliacoes(pontuacao, estagiario=None):
+    """Contagem de cada resposta (Excelente, Bom, ...) somando todas as competências."""
+    contagem = _linhas_do_filtro(pontuacao['contagens'], estagiario).sum()
+    contagem = contagem[contagem > 0].sort_values(ascending=False)
+    return pd.DataFrame({'Avaliação': contagem.index, 'Contagem': contagem.to_numpy()})
+
+def medias_por_competencia(pontuacao, estagiario=None):
+    """Nota média de cada competência (respostas em branco contam como 0)."""
+    linhas = feedbacks_avaliados(pontuacao, estagiario)
+    somas = _linhas_do_filtro(pontuacao['somas'], estagiario).sum()
+    return pd.DataFrame({'Competência': somas.index, 'Média': (somas / linhas).to_numpy() if linhas else np.nan})
+
+# --- CUBO DO SOMAR IDEIAS ---
+# A exportação do Somar traz todos os colaboradores da empresa. Ela é agregada uma vez
+# por versão do arquivo num cubo responsável x status; a tabela dos estagiários e o
+# recorte de um estagiário só consultam esse cubo.
+@st.cache_data(max_entries=2, show_spinner=False)
+def _montar_cubo_somar(assinatura):
+    df = _ler_somar(assinatura)
+    if df.empty:
+        return pd.DataFrame()
+    cubo = df.groupby(['NOME RESPONSAVEL', 'STATUS IDEIA'])['IDEIAS ENVIADAS'].sum().unstack(fill_value=0)
+    cubo.columns.name = None
+    cubo['Total Ideias'] = cubo.sum(axis=1)
+    return cubo
+
+def cubo_somar():
+    """Ideias enviadas por responsável (linhas) e status (colunas), com o total."""
+    if not os.path.exists(SOMAR_FILE):
+        return pd.DataFrame()
+    return _montar_cubo_somar(assinatura_arquivo(SOMAR_FILE))
+
+def versao_somar():
+    """Versão do Somar Ideias e da Base (quem é estagiário), como no recorte por estagiário."""
+    return (assinatura_arquivo(SOMAR_FILE), assinatura_arquivo(BASE_FILE))
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _somar_dos_estagiarios(assinatura, assinatura_base):
+    # Responsáveis ligados ao estagiário pelo índice de nomes (acentos, nomes truncados);
+    # estagiários sem ideias entram com zero
+    cubo = _montar_cubo_somar(assinatura)
+    indice = indice_de_nomes()
+    codigos = indice.codigos(cubo.index)
+    tabela = cubo[codigos >= 0].groupby(codigos[codigos >= 0]).sum()
+    tabela = tabela.reindex(range(len(indice.estagiarios)), fill_value=0)
+    tabela.index = pd.Index(indice.estagiarios['COLABORADOR'], name='Estagiário')
+    return tabela
+
+def somar_por_estagiario(estagiario=None):
+    """Linhas do cubo para os estagiários da Base (ou só para 'estagiario')."""
+    tabela = _somar_dos_estagiarios(assinatura_arquivo(SOMAR_FILE), assinatura_arquivo(BASE_FILE))
+    if estagiario is not None:
+        tabela = tabela.loc[tabela.index == estagiario]
+    return tabela
+
+def somar_formato_longo(tabela):
+    """Converte linhas do cubo em (responsável, status, quantidade) para o gráfico empilhado."""
+    longo = tabela.drop(columns=['Total Ideias']).stack().rename('IDEIAS ENVIADAS')
+    longo = longo[longo > 0].reset_index()
+    longo.columns = ['NOME RESPONSAVEL', 'STATUS IDEIA', 'IDEIAS ENVIADAS']
+    return longo
+
+# --- TRILHA: PRAZOS E SITUAÇÃO DAS ETAPAS ---
+# Prazos (admissão + i meses), dias até o fim do contrato e situação de cada etapa são
+# calculados para todos os estagiários de uma vez, em arrays, e ficam no cache por dia
+# e por versão da Base e do progresso. A página do estagiário e o relatório da
+# Administração só consultam o resultado.
+SITUACOES_ETAPA = ['Concluída', 'Atrasada', 'Atual', 'Futura']
+
+def versao_trilha():
+    """Identifica a versão atual do progresso das trilhas."""
+    if usando_sqlite():
+        return versao_sqlite("trilha")
+    return assinatura_arquivo(TRILHA_BITS)
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _calcular_trilha(assinatura_base, versao, hoje):
+    base = initialize_base()
+    if "MATRICULA" not in base.columns:
+        return {'estagiarios': pd.DataFrame(), 'etapas': pd.DataFrame()}
+    meses = ETAPAS_TRILHA
+    progresso = progresso_trilha(base)
+    
+    estagiarios = base.dropna(subset=['MATRICULA']).drop_duplicates('MATRICULA').set_index('MATRICULA')
+    estagiarios = estagiarios[['COLABORADOR', 'UNIDADE', 'ADMISSAO', 'TERMINO CONTRATO']].rename_axis('Matricula')
+    estagiarios['ADMISSAO'] = converter_datas(estagiarios['ADMISSAO'])
+    estagiarios['TERMINO CONTRATO'] = converter_datas(estagiarios['TERMINO CONTRATO'])
+    estagiarios['Tem_Progresso'] = progresso.tem_progresso(estagiarios.index)
+    
+    # Matrizes estagiários x etapas
+    concluidas = progresso.concluidas(estagiarios.index)
+    prazos = np.column_stack([(estagiarios['ADMISSAO'] + pd.DateOffset(months=i)).to_numpy()
+                              for i in range(1, len(meses) + 1)])
+    pendentes = ~concluidas
+    primeira_pendente = pendentes & (np.cumsum(pendentes, axis=1) == 1)
+    vencidas = pendentes & (prazos <= np.datetime64(hoje)) # NaT nunca vence
+    situacao = np.select([concluidas, primeira_pendente & vencidas, primeira_pendente],
+                         SITUACOES_ETAPA[:3], default=SITUACOES_ETAPA[3])
+    
+    estagiarios['Meses_Concluidos'] = concluidas.sum(axis=1)
+    estagiarios['Percentual'] = (estagiarios['Meses_Concluidos'] * 100) // len(meses)
+    estagiarios['Etapas_Vencidas'] = vencidas.sum(axis=1)
+    estagiarios['Dias_Restantes'] = (estagiarios['TERMINO CONTRATO'] - pd.Timestamp(hoje)).dt.days
+    
+    etapas = pd.DataFrame({
+        'Matricula': np.repeat(estagiarios.index.to_numpy(), len(meses)),
+        'Etapa': np.tile(np.arange(1, len(meses) + 1), len(estagiarios)),
+        'Mes': np.tile(meses, len(estagiarios)),
+        'Prazo': prazos.ravel(),
+        'Concluida': concluidas.ravel(),
+        'Vencida': vencidas.ravel(),
+        'Situacao': situacao.ravel(),
+    }).set_index('Matricula')
+    return {'estagiarios': estagiarios, 'etapas': etapas}
+
+def trilha_calculada():
+    """{'estagiarios': resumo por Matricula, 'etapas': uma linha por (Matricula, etapa)}."""
+    return _calcular_trilha(repr(assinatura_arquivo(BASE_FILE)), versao_trilha(), datetime.now().date())
+
+def trilha_do_estagiario(calculo, matricula):
+    """(resumo, etapas) de um estagiário, ou (None, None) se ele não estiver na Base."""
+    estagiarios = calculo['estagiarios']
+    if matricula not in estagiarios.index:
+        return None, None
+    # As etapas de cada estagiário ocupam um bloco contíguo, na mesma ordem do resumo
+    posicao, etapas = estagiarios.index.get_loc(matricula), len(ETAPAS_TRILHA)
+    return estagiarios.iloc[posicao], calculo['etapas'].iloc[posicao * etapas:(posicao + 1) * etapas]
+
+class FilaDePrazos:
+    """Etapas não concluídas de todos os estagiários, em arrays ordenados pelo prazo.
+
+    Vencidas e a vencer nos próximos N dias saem por busca binária (searchsorted), sem
+    percorrer a trilha. Quando a própria aplicação grava o progresso (ações em lote e
+    editor da Administração), a fila recebe só as etapas que mudaram; qualquer outra
+    mudança (Base, arquivo alterado por outro processo) é percebida pela versão e a
+    fila é remontada a partir do cálculo da trilha.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versao = None
+        self._prazo_de = pd.Series(dtype='datetime64[ns]')
+        self.prazos = np.array([], dtype='datetime64[ns]')
+        self.matriculas = np.array([], dtype=object)
+        self.etapas = np.array([], dtype=np.int64)
+
+    def _versao_atual(self, versao_da_trilha):
+        return (repr(assinatura_arquivo(BASE_FILE)), versao_da_trilha)
+
+    def _remontar(self, versao):
+        etapas = trilha_calculada()['etapas']
+        self._prazo_de = etapas.set_index('Etapa', append=True)['Prazo'].dropna()
+        pendentes = etapas[~etapas['Concluida'] & etapas['Prazo'].notna()].sort_values('Prazo', kind='stable')
+        self.prazos = pendentes['Prazo'].to_numpy()
+        self.matriculas = pendentes.index.to_numpy(dtype=object)
+        self.etapas = pendentes['Etapa'].to_numpy()
+        self._versao = versao
+
+    def _sincronizar(self):
+        versao = self._versao_atual(versao_trilha())
+        if versao != self._versao:
+            self._remontar(versao)
+
+    def aplicar(self, mudancas, versao_antes, versao_depois):
+        """Aplica [(matrículas ou None para todos, etapa, concluída)] gravados entre as duas versões."""
+        with self._lock:
+            if self._versao != self._versao_atual(versao_antes):
+                self._versao = None # Perdeu alguma gravação: remonta na próxima consulta
+                return
+            for matriculas, etapa, concluida in mudancas:
+                sai = self.etapas == etapa
+                if matriculas is not None:
+                    sai &= np.isin(self.matriculas, list(matriculas))
+                self.prazos, self.matriculas, self.etapas = self.prazos[~sai], self.matriculas[~sai], self.etapas[~sai]
+                if concluida:
+                    continue
+                entram = self._prazo_de.xs(etapa, level='Etapa')
+                if matriculas is not None:
+                    entram = entram[entram.index.isin(list(matriculas))]
+                entram = entram.sort_values(kind='stable')
+                novos_prazos = entram.to_numpy().astype(self.prazos.dtype)
+                posicoes = np.searchsorted(self.prazos, novos_prazos, side='right')
+                self.prazos = np.insert(self.prazos, posicoes, novos_prazos)
+                self.matriculas = np.insert(self.matriculas, posicoes, entram.index.to_numpy(dtype=object))
+                self.etapas = np.insert(self.etapas, posicoes, etapa)
+            self._versao = self._versao_atual(versao_depois)
+
+    def consultar(self, hoje, dias=0):
+        """(vencidas até hoje, a vencer nos próximos 'dias'), cada uma com Matricula, Etapa e Prazo."""
+        with self._lock:
+            self._sincronizar()
+            limites = np.array([hoje, hoje + pd.Timedelta(days=dias)], dtype='datetime64[D]').astype(self.prazos.dtype)
+            fim_vencidas, fim_a_vencer = np.searchsorted(self.prazos, limites, side='right')
+            fatias = (slice(0, fim_vencidas), slice(fim_vencidas, fim_a_vencer))
+            return tuple(pd.DataFrame({'Matricula': self.matriculas[fatia], 'Etapa': self.etapas[fatia],
+                                       'Prazo': self.prazos[fatia]}) for fatia in fatias)
+
+@st.cache_resource(show_spinner=False)
+def fila_de_prazos():
+    return FilaDePrazos()
+
+def _gravar_trilha(mudancas, gravar):
+    """Executa a gravação do progresso e repassa à fila de prazos só as etapas alteradas."""
+    with trava_arquivo(TRILHA_BITS): # Ninguém grava entre a leitura das duas versões
+        antes = versao_trilha()
+        gravar()
+        fila_de_prazos().aplicar(mudancas, antes, versao_trilha())
+
+def prazos_da_trilha(dias):
+    """(vencidas, a vencer em até 'dias' dias): etapas pendentes de todos os estagiários, por prazo."""
+    vencidas, a_vencer = fila_de_prazos().consultar(datetime.now().date(), dias)
+    nomes = trilha_calculada()['estagiarios'][['COLABORADOR', 'UNIDADE']]
+    return tuple(df.join(nomes, on='Matricula').assign(Mes=lambda d: [COLUNAS_TRILHA[i] for i in d['Etapa']])
+                 for df in (vencidas, a_vencer))
+
+# --- GRAVAÇÃO DOS DADOS ---
+def salvar_trilha(df_trilha):
+    """Substitui o progresso das trilhas inteiro."""
+    if usando_sqlite():
+        gravar_sqlite("trilha", df_trilha[COLUNAS_TRILHA], substituir=True)
+        return
+    ProgressoTrilha.de_tabela(df_trilha).gravar(TRILHA_BITS)
+    invalidar_cache(TRILHA_BITS)
+
+def marcar_etapa_trilha(mes_key, concluido):
+    """Marca (ou desmarca) uma etapa da trilha para todos os estagiários."""
+    _gravar_trilha([(None, COLUNAS_TRILHA.index(mes_key), bool(concluido))],
+                   lambda: _marcar_etapa_trilha(mes_key, concluido))
+
+def _marcar_etapa_trilha(mes_key, concluido):
+    matriculas = initialize_base().get("MATRICULA", pd.Series(dtype=str)).dropna().unique()
+    if usando_sqlite():
+        initialize_trilha(initialize_base()) # Garante as linhas na primeira execução
+        with transacao_sqlite() as con:
+            con.executemany("INSERT OR IGNORE INTO trilha (Matricula) VALUES (?)", [(str(m),) for m in matriculas])
+            con.execute(f"UPDATE trilha SET {_q(mes_key)} = ?", (int(concluido),))
+            _registrar_escrita(con, "trilha")
+        _ler_tabela_sqlite.clear()
+        return
+    # Ler-alterar-gravar com a trava presa: outra sessão não consegue gravar no meio
+    with trava_arquivo(TRILHA_BITS):
+        progresso = progresso_trilha(initialize_base()).incluir(matriculas)
+        progresso.marcar(COLUNAS_TRILHA.index(mes_key), concluido).gravar(TRILHA_BITS)
+        invalidar_cache(TRILHA_BITS)
+
+def anexar_treinamento(nova_linha):
+    """Acrescenta um treinamento (datas/horas já em texto, como no CSV)."""
+    if usando_sqlite():
+        gravar_sqlite("treinamentos", nova_linha[COLUNAS_TREINAMENTOS])
+    else:
+        acrescentar_csv(nova_linha, TREINAMENTOS_FILE, COLUNAS_TREINAMENTOS)
+        invalidar_cache(TREINAMENTOS_FILE)
+    feeds_treinamentos().sincronizar() # Republica só o .ics da unidade do treinamento
+
+def salvar_treinamentos(df_treinamentos):
+    """Substitui o calendário de treinamentos inteiro."""
+    if usando_sqlite():
+        gravar_sqlite("treinamentos", df_treinamentos, substituir=True)
+    else:
+        salvar_csv_atomico(df_treinamentos, TREINAMENTOS_FILE)
+        invalidar_cache(TREINAMENTOS_FILE)
+    feeds_treinamentos().sincronizar()
+
+def anexar_feedback(linha):
+    """Acrescenta um feedback (dict com as COLUNAS_FEEDBACK)."""
+    if usando_sqlite():
+        gravar_sqlite("feedback", pd.DataFrame([linha], columns=COLUNAS_FEEDBACK))
+        return
+    acrescentar_csv(pd.DataFrame([linha], columns=COLUNAS_FEEDBACK).fillna(''), CSV_FEEDBACK, COLUNAS_FEEDBACK)
+    invalidar_cache(CSV_FEEDBACK)
+
+def salvar_feedbacks(df_feedback):
+    """Substitui o arquivo/tabela de feedbacks inteiro."""
+    if usando_sqlite():
+        gravar_sqlite("feedback", df_feedback, substituir=True)
+        return
+    salvar_csv_atomico(df_feedback, CSV_FEEDBACK)
+    invalidar_cache(CSV_FEEDBACK)
+
+
+# --- EDIÇÃO PAGINADA (ADMINISTRAÇÃO) ---
+# Os editores da Administração mostram uma página por vez. Filtros e paginação rodam
+# aqui (no SQL com o backend SQLite, sobre o DataFrame já cacheado com arquivos) e só
+# as linhas da página vão para o navegador. O índice de cada página é o id da linha
+# (hash do conteúdo nos arquivos, id do SQLite; a Matricula na trilha): a gravação usa esse id
+# para aplicar só as linhas alteradas, removidas ou novas.
+LINHAS_POR_PAGINA_ADMIN = 50
+FILTROS_ADMIN = { # Filtros disponíveis por tabela -> coluna filtrada
+    "registros": {"estagiario": "Colaborador", "data": "Data_Registro", "status": "Status"},
+    "feedback": {"estagiario": "Estagiario", "data": "Data_Hora"},
+    "treinamentos": {"unidade": "Unidade", "data": "Data"},
+    "trilha": {"estagiario": "COLABORADOR", "unidade": "UNIDADE"},
+}
+ARQUIVOS_ADMIN = {"registros": CSV_FILE, "feedback": CSV_FEEDBACK, "treinamentos": TREINAMENTOS_FILE, "trilha": TRILHA_BITS}
+
+def _termos_filtro_admin(tabela, filtros):
+    """Traduz os filtros da tela em (coluna, operador, valor)."""
+    colunas = FILTROS_ADMIN[tabela]
+    termos = []
+    if filtros.get("estagiario") and "estagiario" in colunas:
+        termos.append((colunas["estagiario"], "=", filtros["estagiario"]))
+    if filtros.get("unidade"):
+        if "unidade" in colunas:
+            termos.append((colunas["unidade"], "=", filtros["unidade"]))
+        elif "estagiario" in colunas: # Tabela sem unidade: estagiários da unidade, pela Base
+            base = initialize_base()
+            nomes = base.loc[base['UNIDADE'] == filtros["unidade"], 'COLABORADOR'].dropna().unique().tolist()
+            termos.append((colunas["estagiario"], "in", nomes))
+    if filtros.get("status") and "status" in colunas:
+        termos.append((colunas["status"], "=", filtros["status"]))
+    if "data" in colunas:
+        if filtros.get("data_inicio"):
+            termos.append((colunas["data"], ">=", pd.Timestamp(filtros["data_inicio"])))
+        if filtros.get("data_fim"): # Até o fim do dia (Data_Hora tem horário)
+            termos.append((colunas["data"], "<", pd.Timestamp(filtros["data_fim"]) + pd.Timedelta(days=1)))
+    return termos
+
+def _trilha_admin():
+    """Estagiários da Base com o progresso da trilha (linhas sem progresso ficam pendentes)."""
+    base = initialize_base()
+    df = base[['MATRICULA', 'COLABORADOR', 'UNIDADE']].set_index('MATRICULA')
+    df[ETAPAS_TRILHA] = progresso_trilha(base).concluidas(df.index)
+    return df
+
+def _conteudo_normalizado(df):
+    """Colunas num tipo único por natureza (números em float, datas em ns, texto com vazio = ''),
+    para que a mesma linha tenha o mesmo hash venha ela do log ou do parquet."""
+    colunas = {}
+    for col in df.columns:
+        serie = df[col]
+        if pd.api.types.is_bool_dtype(serie) or pd.api.types.is_numeric_dtype(serie):
+            colunas[col] = serie.astype('float64')
+        elif pd.api.types.is_datetime64_any_dtype(serie):
+            colunas[col] = serie.astype('datetime64[ns]')
+        else:
+            colunas[col] = serie.astype(object).where(serie.notna(), '')
+    return pd.DataFrame(colunas, index=df.index)
+
+def _ids_pelo_conteudo(df):
+    """Id estável de cada linha de um arquivo: hash do conteúdo + ordem entre linhas idênticas.
+
+    Apagar ou acrescentar outras linhas não muda o id (ao contrário da posição); alterar
+    a linha muda, e uma edição feita sobre a versão antiga vira conflito em vez de cair
+    em outra linha. Linhas idênticas sempre passam ou não juntas nos filtros, então a
+    ordem entre elas é a mesma na página filtrada e no arquivo inteiro.
+    """
+    if df.empty:
+        return pd.Index([], dtype=object)
+    hashes = pd.util.hash_pandas_object(_conteudo_normalizado(df), index=False).to_numpy()
+    ordem = np.zeros(len(hashes), dtype=np.int64)
+    repetidas = pd.Series(hashes).duplicated(keep=False).to_numpy()
+    if repetidas.any():
+        ordem[repetidas] = pd.Series(hashes[repetidas]).groupby(hashes[repetidas]).cumcount().to_numpy()
+    return pd.Index([f"{h:016x}-{o}" for h, o in zip(hashes, ordem)], dtype=object)
+
+def _ids_da_tabela(tabela, df):
+    """Ids pelo conteúdo; nos registros, o último snapshot de cada projeto leva o sufixo '-atual'.
+
+    Assim, quando chega um snapshot novo do projeto (edição do estado atual), o id da
+    linha que era o estado atual muda, e quem a editou antes recebe um conflito em vez
+    de a edição virar uma correção do histórico.
+    """
+    ids = _ids_pelo_conteudo(df)
+    if tabela == "registros" and not df.empty:
+        atuais = np.zeros(len(df), dtype=bool)
+        atuais[df.index.get_indexer(_ultimo_snapshot(df).index)] = True
+        ids = pd.Index(np.where(atuais, ids + "-atual", ids), dtype=object)
+    return ids
+
+def _versao_arquivo_admin(tabela):
+    if tabela == "registros":
+        return (assinatura_arquivo(CSV_FILE), assinatura_arquivo(REGISTROS_COMPACTADOS))
+    return assinatura_arquivo(ARQUIVOS_ADMIN[tabela])
+
+@st.cache_resource(max_entries=6, show_spinner=False) # Até duas versões de cada tabela
+def _tabela_admin(tabela, versao):
+    """Tabela do arquivo indexada pelos ids estáveis (compartilhada, somente leitura)."""
+    df = {"registros": initialize_data, "feedback": initialize_feedback,
+          "treinamentos": initialize_treinamentos}[tabela]()
+    return df.set_axis(_ids_da_tabela(tabela, df))
+
+def consultar_pagina_admin(tabela, filtros, pagina=1, por_pagina=LINHAS_POR_PAGINA_ADMIN):
+    """(linhas da página, total de linhas que passam nos filtros), indexadas pelo id da linha.
+
+    O id é o 'id' da tabela no SQLite e, nos arquivos, o id pelo conteúdo (_ids_da_tabela).
+    """
+    termos = _termos_filtro_admin(tabela, filtros)
+    deslocamento = (pagina - 1) * por_pagina
+    if usando_sqlite() and tabela != "trilha":
+        condicoes, parametros = [], []
+        for coluna, operador, valor in termos:
+            if operador == "in":
+                condicoes.append(f"{_q(coluna)} IN ({', '.join('?' * len(valor))})" if valor else "0")
+                parametros.extend(valor)
+            else:
+                condicoes.append(f"{_q(coluna)} {operador} ?")
+                parametros.append(valor.strftime('%Y-%m-%d') if isinstance(valor, pd.Timestamp) else valor)
+        total = contar_sqlite(tabela, condicoes, parametros)
+        df = consultar_sqlite(tabela, condicoes, parametros, ordem="id", manter_id=True,
+                              limite=por_pagina, deslocamento=deslocamento)
+        return df.set_index('id'), total
+    
+    if tabela == "trilha": # Uma linha por estagiário: a junção com a Base é feita em memória
+        df = _trilha_admin()
+    else:
+        df = _tabela_admin(tabela, _versao_arquivo_admin(tabela))
+    mascara = pd.Series(True, index=df.index)
+    for coluna, operador, valor in termos:
+        if coluna not in df.columns:
+            continue
+        if operador == "in":
+            mascara &= df[coluna].isin(valor)
+        elif operador == "=":
+            mascara &= df[coluna] == valor
+        else:
+            datas = pd.to_datetime(df[coluna], errors='coerce')
+            mascara &= (datas >= valor) if operador == ">=" else (datas < valor)
+    filtrado = df[mascara]
+    return filtrado.iloc[deslocamento:deslocamento + por_pagina], len(filtrado)
+
+# --- EDIÇÕES DOS st.data_editor: SÓ O DELTA ---
+# O st.data_editor guarda em st.session_state[key] apenas o que mudou: edited_rows
+# ({posição: {coluna: valor}}), added_rows e deleted_rows. As gravações usam esse delta,
+# então o custo acompanha o tamanho da edição e não o do arquivo. Cada linha editada leva
+# a versão (hash do conteúdo) que tinha quando a edição começou; se outra sessão mudou a
+# linha nesse meio tempo, a gravação é recusada em vez de sobrescrever a outra edição.
+class ConflitoDeEdicao(Exception):
+    """Linhas alteradas ou removidas por outra sessão desde que a edição começou."""
+
+    def __init__(self, ids):
+        self.ids = list(ids)
+        super().__init__(f"{len(self.ids)} linha(s) foram alteradas ou apagadas por outra pessoa desde que você começou a editar.")
+
+def _texto_versao(valor):
+    if valor is None or (not isinstance(valor, (str, bool)) and pd.isna(valor)):
+        return ''
+    if isinstance(valor, float) and valor.is_integer(): # 50 e 50.0 (coluna com vazios) são a mesma versão
+        return str(int(valor))
+    return str(valor)
+
+def versoes_das_linhas(df, colunas):
+    """Versão de cada linha (hash do conteúdo das colunas informadas), indexada pelo id."""
+    return pd.util.hash_pandas_object(df[colunas].map(_texto_versao), index=False)
+
+def chave_do_editor(chave):
+    """'key' do st.data_editor; muda em descartar_edicoes() para o editor voltar sem edições."""
+    return f"{chave}_{st.session_state.get(f'_geracao_{chave}', 0)}"
+
+def _tem_edicoes(chave):
+    estado = st.session_state.get(chave_do_editor(chave)) or {}
+    return any(estado.get(parte) for parte in ('edited_rows', 'added_rows', 'deleted_rows'))
+
+def pagina_do_editor(chave, identidade, consultar):
+    """Resultado de consultar() para o editor 'chave', fixo enquanto houver edições pendentes.
+
+    O delta do editor é posicional: se os dados mudassem por baixo dele (outra sessão
+    gravou), as edições cairiam em outras linhas. Por isso a consulta só é refeita sem
+    edições pendentes ou quando 'identidade' (filtros, página) muda.
+    """
+    fixada = st.session_state.get(f'_pagina_{chave}')
+    if fixada is not None and fixada[0] == identidade and _tem_edicoes(chave):
+        return fixada[1]
+    resultado = consultar()
+    st.session_state[f'_pagina_{chave}'] = (identidade, resultado)
+    return resultado
+
+def descartar_edicoes(chave):
+    """Limpa o editor (depois de gravar ou de um conflito); a próxima execução relê os dados."""
+    st.session_state[f'_geracao_{chave}'] = st.session_state.get(f'_geracao_{chave}', 0) + 1
+    st.session_state.pop(f'_pagina_{chave}', None)
+
+def alteracoes_do_editor(chave, original, editada, colunas):
+    """Delta do editor 'chave' em termos de ids de linha.
+
+    'original' são os dados mostrados no editor (índice = id da linha) e 'editada' o que
+    ele devolveu (de onde saem os valores já convertidos). O editor pode ter recebido uma
+    cópia com índice 0..n-1 (com num_rows="dynamic" é o único jeito de esconder o índice):
+    as linhas de 'editada' são lidas pela ordem, não pelo índice. Linhas com 'Deletar'
+    marcado contam como removidas. Devolve um dict com 'alteradas' ({id: {coluna: valor}}),
+    'removidas' (ids), 'novas' (DataFrame), 'versoes' ({id: versão lida}) e 'colunas'.
+    """
+    estado = st.session_state.get(chave_do_editor(chave)) or {}
+    apagadas = {int(pos) for pos in estado.get('deleted_rows', [])}
+    removidas = [original.index[pos] for pos in sorted(apagadas)]
+    # 'editada' = linhas não apagadas de 'original', na mesma ordem, seguidas das novas
+    linha_editada = {pos: linha for linha, pos in enumerate(p for p in range(len(original)) if p not in apagadas)}
+    alteradas = {}
+    for pos, mudancas in estado.get('edited_rows', {}).items():
+        id_linha, linha = original.index[int(pos)], linha_editada[int(pos)]
+        valor = lambda coluna: editada.iat[linha, editada.columns.get_loc(coluna)]
+        if 'Deletar' in mudancas and valor('Deletar'):
+            removidas.append(id_linha)
+            continue
+        mudancas = [coluna for coluna in mudancas if coluna in colunas]
+        if mudancas:
+            alteradas[id_linha] = {coluna: valor(coluna) for coluna in mudancas}
+    
+    incluidas = len(estado.get('added_rows', []))
+    novas = editada.iloc[len(editada) - incluidas:] if incluidas else editada.iloc[0:0]
+    if 'Deletar' in novas.columns:
+        novas = novas[~novas['Deletar'].fillna(False).astype(bool)]
+    novas = novas.reindex(columns=colunas).reset_index(drop=True)
+    
+    tocadas = list(alteradas) + removidas
+    versoes = versoes_das_linhas(original.loc[tocadas], colunas).to_dict() if tocadas else {}
+    return {'alteradas': alteradas, 'removidas': removidas, 'novas': novas, 'versoes': versoes, 'colunas': colunas}
+
+def _treinamentos_em_texto(df):
+    """Datas e horas dos treinamentos no formato do CSV (DD/MM/AAAA e HH:MM:SS)."""
+    df = df.copy()
+    for col in DATE_COLS_TREINAMENTOS:
+        df[col] = pd.to_datetime(df[col], errors='coerce').dt.strftime('%d/%m/%Y').fillna('')
+    for col in TIME_COLS_TREINAMENTOS:
+        df[col] = df[col].apply(_hora_texto).fillna('')
+    return df
+
+def _ler_para_edicao(tabela):
+    """Conteúdo atual do arquivo, indexado pelo id da linha (chame com a trava dele presa).
+
+    A versão do arquivo é conferida com a trava presa, então a tabela já cacheada para a
+    página (mesma versão) é o conteúdo do disco, sem ler e calcular os ids de novo.
+    """
+    if tabela != "trilha":
+        return _tabela_admin(tabela, _versao_arquivo_admin(tabela)).copy()
+    if os.path.exists(TRILHA_BITS):
+        return ProgressoTrilha.ler(TRILHA_BITS).como_tabela().set_index('Matricula')
+    return pd.DataFrame(columns=COLUNAS_TRILHA).set_index('Matricula')
+
+def _gravar_edicao(tabela, df):
+    """Reescreve o arquivo inteiro (remoções e correções do histórico)."""
+    if tabela == "registros":
+        compactar_registros(df) # Correções da Administração viram o novo histórico compactado
+    elif tabela == "feedback":
+        salvar_feedbacks(df)
+    elif tabela == "treinamentos":
+        salvar_treinamentos(_treinamentos_em_texto(df))
+    else:
+        salvar_trilha(df.rename_axis('Matricula').reset_index())
+
+def _acrescentar_linhas_admin(tabela, novas):
+    """Linhas novas vão para o fim do arquivo, sem reescrevê-lo."""
+    if novas.empty:
+        return
+    if tabela == "registros":
+        novas = novas.copy()
+        for col in DATE_COLS_REGISTROS:
+            novas[col] = pd.to_datetime(novas[col], errors='coerce')
+        anexar_registros(novas)
+    elif tabela == "feedback":
+        with trava_arquivo(CSV_FEEDBACK): # Cabeçalho do arquivo (pode ter colunas de formulários antigos)
+            vazio = not os.path.exists(CSV_FEEDBACK) or os.path.getsize(CSV_FEEDBACK) == 0
+            colunas = COLUNAS_FEEDBACK if vazio else pd.read_csv(CSV_FEEDBACK, nrows=0).columns.tolist()
+            acrescentar_csv(novas.reindex(columns=colunas).fillna(''), CSV_FEEDBACK, colunas)
+        invalidar_cache(CSV_FEEDBACK)
+    else:
+        anexar_treinamento(_treinamentos_em_texto(novas.reindex(columns=COLUNAS_TREINAMENTOS)))
+
+def _snapshots_da_edicao(atual, alteradas):
+    """Edições de registros como novos snapshots, se todas forem no estado atual do projeto.
+
+    Vale quando cada linha editada é o último snapshot do seu projeto (id com '-atual',
+    ver _ids_da_tabela) e a edição não muda o projeto (Colaborador, Nome_Projeto) nem a
+    Data_Registro: o resultado é o mesmo de o estagiário atualizar o projeto. Devolve
+    None se alguma edição corrigir o histórico.
+    """
+    if any(set(mudancas) & {'Data_Registro', *CHAVE_PROJETO} for mudancas in alteradas.values()):
+        return None
+    if not all(str(id_linha).endswith("-atual") for id_linha in alteradas):
+        return None
+    
+    eventos = atual.loc[list(alteradas), COLUNAS_REGISTROS].astype(object)
+    for id_linha, mudancas in alteradas.items():
+        for coluna, valor in mudancas.items():
+            eventos.at[id_linha, coluna] = valor
+    for col in DATE_COLS_REGISTROS:
+        eventos[col] = pd.to_datetime(eventos[col], errors='coerce')
+    # O novo snapshot precisa ordenar depois do anterior (que pode ter data futura)
+    hoje_registro = pd.Timestamp.now().normalize()
+    eventos['Data_Registro'] = eventos['Data_Registro'].clip(lower=hoje_registro).fillna(hoje_registro)
+    return eventos.reset_index(drop=True)
+
+def _verificar_versoes(atual, versoes, colunas):
+    """Recusa a gravação se alguma linha editada não existe mais ou mudou desde a leitura."""
+    existentes = [id_linha for id_linha in versoes if id_linha in atual.index]
+    versoes_atuais = versoes_das_linhas(atual.loc[existentes], colunas) if existentes else {}
+    conflitos = [id_linha for id_linha, versao in versoes.items()
+                 if id_linha not in versoes_atuais or versoes_atuais[id_linha] != versao]
+    if conflitos:
+        raise ConflitoDeEdicao(conflitos)
+
+def salvar_alteracoes_admin(tabela, alteracoes):
+    """Aplica o delta de um editor da Administração (ver alteracoes_do_editor).
+
+    Com SQLite são UPDATE (só das células editadas), DELETE e INSERT por id, numa
+    transação que antes confere as versões das linhas. Com arquivos, o delta é aplicado
+    sobre o conteúdo atual do disco com a trava presa (CSV/Parquet não permitem alterar
+    uma linha no lugar), localizando cada linha pelo id do conteúdo, então edições de
+    outras sessões em outras linhas são preservadas e nunca caem na linha errada. Só
+    remoções e correções reescrevem o arquivo: linhas novas são acrescentadas ao fim e,
+    nos registros, editar o estado atual de um projeto grava um novo snapshot no log.
+    """
+    alteradas, removidas, novas = alteracoes['alteradas'], alteracoes['removidas'], alteracoes['novas']
+    versoes, colunas = alteracoes['versoes'], alteracoes['colunas']
+    if tabela == "registros": # O percentual sempre acompanha o status
+        for mudancas in alteradas.values():
+            if 'Status' in mudancas:
+                mudancas['Percentual_Concluido'] = map_status_to_percent(mudancas['Status'])
+        # Linha nova sem Data_Registro (a coluna é só leitura no editor) ficaria para sempre
+        # como o estado atual do projeto (NaT ordena por último em _ultimo_snapshot)
+        novas = novas.assign(Percentual_Concluido=novas['Status'].map(map_status_to_percent),
+                             Data_Registro=pd.to_datetime(novas['Data_Registro'], errors='coerce').fillna(pd.Timestamp.now().normalize()))
+    if not alteradas and not removidas and novas.empty:
+        return
+    if tabela == "trilha": # A fila de prazos recebe só as etapas alteradas
+        mudancas = [([matricula], COLUNAS_TRILHA.index(mes), bool(valor))
+                    for matricula, celulas in alteradas.items() for mes, valor in celulas.items()]
+        _gravar_trilha(mudancas, lambda: _aplicar_alteracoes_admin(tabela, alteradas, removidas, novas, versoes, colunas))
+    else:
+        _aplicar_alteracoes_admin(tabela, alteradas, removidas, novas, versoes, colunas)
+    if tabela == "treinamentos": # Os feeds .ics das unidades afetadas são gerados de novo
+        feeds_treinamentos().sincronizar()
+
+def _aplicar_alteracoes_admin(tabela, alteradas, removidas, novas, versoes, colunas):
+    if usando_sqlite():
+        chave = "Matricula" if tabela == "trilha" else "id"
+        with transacao_sqlite() as con: # BEGIN IMMEDIATE: ninguém grava entre a conferência e o UPDATE
+            if versoes:
+                atual = consultar_sqlite(tabela, [f"{chave} IN ({', '.join('?' * len(versoes))})"], list(versoes), manter_id=True).set_index(chave)
+                if tabela == "trilha": # Estagiário sem linha na trilha aparece como tudo pendente
+                    atual = atual.reindex(list(versoes), fill_value=False)
+                _verificar_versoes(atual, versoes, colunas)
+            for id_linha, mudancas in alteradas.items():
+                if tabela == "trilha":
+                    con.execute("INSERT OR IGNORE INTO trilha (Matricula) VALUES (?)", (str(id_linha),))
+                dados = _para_sqlite(tabela, pd.DataFrame([mudancas]))
+                atribuicoes = ', '.join(f"{_q(c)} = ?" for c in dados.columns)
+                con.execute(f"UPDATE {tabela} SET {atribuicoes} WHERE {chave} = ?",
+                            (*dados.iloc[0].tolist(), id_linha if tabela == "trilha" else int(id_linha)))
+            if removidas:
+                con.executemany(f"DELETE FROM {tabela} WHERE {chave} = ?", [(id_linha,) for id_linha in removidas])
+            _inserir_linhas(con, tabela, novas)
+            # Alterar/remover linhas antigas de registros invalida a visão incremental (só acréscimos)
+            _registrar_escrita(con, tabela, reescrita=(tabela == "registros" and bool(alteradas or removidas)))
+        _ler_tabela_sqlite.clear()
+        return
+    
+    if tabela != "trilha" and not alteradas and not removidas:
+        _acrescentar_linhas_admin(tabela, novas)
+        return
+    with trava_arquivo(ARQUIVOS_ADMIN[tabela]):
+        atual = _ler_para_edicao(tabela)
+        if tabela == "trilha":
+            faltando = [m for m in versoes if m not in atual.index]
+            atual = pd.concat([atual, pd.DataFrame(False, index=faltando, columns=COLUNAS_TRILHA[1:])])
+        _verificar_versoes(atual, versoes, colunas)
+        if tabela == "registros" and not removidas:
+            eventos = _snapshots_da_edicao(atual, alteradas)
+            if eventos is not None:
+                _acrescentar_linhas_admin(tabela, pd.concat([eventos, novas], ignore_index=True) if not novas.empty else eventos)
+                return
+        atual = atual.astype(object)
+        for id_linha, mudancas in alteradas.items():
+            for coluna, valor in mudancas.items():
+                atual.at[id_linha, coluna] = valor
+        atual = atual.drop(index=removidas)
+        if not novas.empty:
+            atual = pd.concat([atual, novas.astype(object)], ignore_index=True)
+        _gravar_edicao(tabela, atual)
+
+# --- DIRETÓRIO DE ESTAGIÁRIOS ---
+# A Base vira um dicionário {matrícula normalizada: registro} uma vez por versão da
+# planilha, compartilhado entre as sessões: o login e a página do estagiário fazem uma
+# consulta de hash, sem percorrer nem copiar a Base a cada execução.
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _indexar_estagiarios(assinatura):
+    base = initialize_base()
+    if "MATRICULA" not in base.columns:
+        return {'registros': {}, 'setores': []}
+    chaves = base["MATRICULA"].map(normalizar_matricula)
+    unicos = base[~chaves.duplicated() & (chaves != "")] # Mantém o primeiro registro, como o antigo .values[0]
+    setores = sorted(base["DESCRIÇÃO LOCAL"].dropna().unique().tolist()) if "DESCRIÇÃO LOCAL" in base.columns else []
+    return {'registros': dict(zip(chaves[unicos.index], unicos.to_dict("records"))), 'setores': setores}
+
+def diretorio_estagiarios():
+    """{'registros': {matrícula normalizada: registro da Base}, 'setores': setores da Base}. Somente leitura."""
+    return _indexar_estagiarios(assinatura_arquivo(BASE_FILE))
+
+def buscar_estagiario(matricula):
+    """Registro da Base (dict compartilhado: não altere) para a matrícula informada, ou None."""
+    return diretorio_estagiarios()['registros'].get(normalizar_matricula(matricula))
+
+# --- IDENTIDADE: NOME -> ESTAGIÁRIO ---
+# Registros, feedbacks e Somar identificam o estagiário pelo nome, digitado ou exportado
+# de outro sistema (com ou sem acento, às vezes truncado como os 40 caracteres da Base).
+# Cada variação de nome é resolvida uma única vez para o código inteiro do estagiário
+# (a posição dele no diretório da Base); ranking e Somar somam por esse código.
+TAMANHO_MINIMO_PREFIXO = 20 # Nome truncado só é ligado a outro a partir deste tamanho
+
+def dobrar_nomes(nomes):
+    """Nomes em maiúsculas, sem acentos e com espaços simples (array de texto)."""
+    return (pd.Series(nomes, dtype=object).fillna('').astype(str).str.normalize('NFKD')
+            .str.encode('ascii', 'ignore').str.decode('ascii').str.upper().str.split().str.join(' ')
+            .to_numpy(dtype=str))
+
+class IndiceDeNomes:
+    """Nome -> código do estagiário (posição em .estagiarios), ou -1 sem um candidato único."""
+    def __init__(self, registros):
+        registros = [r for r in registros.values() if isinstance(r.get('COLABORADOR'), str)]
+        self.estagiarios = pd.DataFrame({'Matricula': [r['MATRICULA'] for r in registros],
+                                         'COLABORADOR': [r['COLABORADOR'] for r in registros]})
+        dobrados = dobrar_nomes(self.estagiarios['COLABORADOR'])
+        self._ordem = np.argsort(dobrados, kind='stable')
+        self._nomes = dobrados[self._ordem] # Ordenados: igualdade e prefixo por busca binária
+        self._resolvidos = {}
+        self._lock = threading.Lock()
+    
+    def _resolver(self, nomes):
+        dobrados = dobrar_nomes(nomes)
+        longos = np.char.str_len(dobrados) >= TAMANHO_MINIMO_PREFIXO
+        inicio = np.searchsorted(self._nomes, dobrados, side='left')
+        fim_igual = np.searchsorted(self._nomes, dobrados, side='right')
+        fim_prefixo = np.searchsorted(self._nomes, np.char.add(dobrados, '\uffff'), side='left')
+        # Nome igual; senão, o nome informado é o começo de um único nome da Base
+        posicao = np.where(fim_igual - inicio == 1, inicio,
+                           np.where((fim_igual == inicio) & (fim_prefixo - inicio == 1) & longos, inicio, -1))
+        # Nome da Base truncado: ele é o começo do nome informado
+        candidatos, candidato = np.zeros(len(dobrados), dtype=int), np.full(len(dobrados), -1)
+        for tamanho in np.unique(np.char.str_len(self._nomes)):
+            if tamanho < TAMANHO_MINIMO_PREFIXO:
+                continue
+            cortados = dobrados.astype(f'<U{tamanho}')
+            i, j = np.searchsorted(self._nomes, cortados, side='left'), np.searchsorted(self._nomes, cortados, side='right')
+            achou = (j - i == 1) & (np.char.str_len(dobrados) > tamanho)
+            candidatos += achou
+            candidato = np.where(achou, i, candidato)
+        posicao = np.where((posicao < 0) & (fim_igual == inicio) & (candidatos == 1), candidato, posicao)
+        posicao = np.where(dobrados == '', -1, posicao)
+        return np.append(self._ordem, -1)[posicao] # -1 cai no -1 do final
+    
+    def codigos(self, nomes):
+        """Array com o código de cada nome (variações já vistas não são resolvidas de novo)."""
+        codigos_unicos, unicos = pd.factorize(pd.Series(nomes, dtype=object))
+        unicos = list(unicos)
+        with self._lock:
+            novos = [nome for nome in unicos if nome not in self._resolvidos]
+            if novos:
+                self._resolvidos.update(zip(novos, self._resolver(novos).tolist()))
+            mapa = np.array([self._resolvidos[nome] for nome in unicos] + [-1], dtype=np.int64)
+        return mapa[codigos_unicos] # Nome vazio (código -1 do factorize) fica -1
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _indexar_nomes(assinatura):
+    return IndiceDeNomes(diretorio_estagiarios()['registros'])
+
+def indice_de_nomes():
+    """Índice de nomes da versão atual da Base (compartilhado entre as sessões)."""
+    return _indexar_nomes(assinatura_arquivo(BASE_FILE))
+
+def ranking_desempenho(pontuacao=None, estagiario=None):
+    """Estagiários da Base com nota média dos feedbacks e projetos concluídos/atrasados, ordenados."""
+    indice = indice_de_nomes()
+    n = len(indice.estagiarios)
+    nota = np.zeros(n)
+    if pontuacao is not None and pontuacao['com_nota']:
+        somas = _linhas_do_filtro(pontuacao['somas'], estagiario).sum(axis=1)
+        linhas = _linhas_do_filtro(pontuacao['linhas'], estagiario)
+        codigos = indice.codigos(somas.index)
+        ok = codigos >= 0
+        total = np.bincount(codigos[ok], weights=somas.to_numpy()[ok], minlength=n)
+        respostas = np.bincount(codigos[ok], weights=linhas.to_numpy()[ok], minlength=n) * len(pontuacao['com_nota'])
+        nota = np.divide(total, respostas, out=np.zeros(n), where=respostas > 0)
+    
+    projetos = estado_atual_registros()
+    codigos = indice.codigos(projetos['Colaborador'])
+    hoje = pd.Timestamp(datetime.now().date())
+    concluidos = (codigos >= 0) & projetos['Status'].eq('Concluído').to_numpy()
+    atrasados = (codigos >= 0) & (projetos['Status'].isin(['Iniciado', 'Pendente'])
+                                  & (projetos['Previsao_Conclusao'] < hoje)).to_numpy()
+    ranking = pd.DataFrame({
+        'Estagiário': indice.estagiarios['COLABORADOR'],
+        'Nota Média (de 4.0)': nota,
+        'Projetos Concluídos': np.bincount(codigos[concluidos], minlength=n),
+        'Projetos Atrasados': np.bincount(codigos[atrasados], minlength=n),
+    })
+    return ranking.sort_values(by=["Nota Média (de 4.0)", "Projetos Concluídos", "Projetos Atrasados"], ascending=[False, False, True])
+
+# --- DIRETÓRIO DE GESTORES ---
+def normalizar_matricula(valor):
+    """Normaliza matrículas digitadas ou lidas das planilhas (' 01201', 1201, '1201.0' -> '1201')."""
+    if valor is None or (not isinstance(valor, str) and pd.isna(valor)):
+        return ""
+    texto = str(valor).strip()
+    if texto.endswith(".0"):
+        texto = texto[:-2]
+    if texto.isdigit():
+        texto = texto.lstrip("0") or "0"
+    return texto
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _indexar_gestores(assinatura):
+    base_gestor = ler_planilha(GESTOR_FILE)
+    chaves = base_gestor["MATRICULA"].map(normalizar_matricula)
+    base_gestor = base_gestor[~chaves.duplicated()] # Mantém o primeiro registro, como o antigo .iloc[0]
+    return dict(zip(chaves[base_gestor.index], base_gestor.to_dict("records")))
+
+def diretorio_gestores():
+    """Índice {matrícula normalizada: registro do gestor}, refeito apenas quando gestor.xlsx muda."""
+    return _indexar_gestores(assinatura_arquivo(GESTOR_FILE))
+
+def login_gestor(form_key):
+    """Formulário de login do gestor, usado no Painel de Indicadores e na Avaliação do Gestor."""
+    st.subheader("🔐 Acesso Restrito ao Gestor")
+    
+    with st.form(key=form_key):
+        matricula = st.text_input("Digite sua matrícula:")
+        senha = st.text_input("Digite a senha:", type="password")
+        entrar = st.form_submit_button("Entrar")
+
+    if entrar:
+        if matricula and senha == SENHA_GESTOR:
+            try:
+                gestores = diretorio_gestores()
+            except Exception as e:
+                st.error(f"Erro ao carregar planilha de gestores: {e}")
+                gestores = {}
+
+            gestor = gestores.get(normalizar_matricula(matricula))
+            if gestor is not None:
+                st.session_state.gestor_autenticado = True
+                st.session_state.dados_gestor = dict(gestor) # Cópia: o índice é compartilhado entre sessões
+                st.success(f"✅ Bem-vindo, {gestor['COLABORADOR']}!")
+                st.rerun()
+            else:
+                st.error("❌ Matrícula não encontrada.")
+        else:
+            st.error("❌ Matrícula ou senha incorreta.")
+
+def mudar_pagina(nova_pagina):
+    """Vai para outra página (chamar no corpo da página, não em on_click)."""
+    st.switch_page(PAGINAS[nova_pagina])
+
+def delete_all_data():
+    if usando_sqlite():
+        gravar_sqlite("registros", pd.DataFrame(columns=COLUNAS_REGISTROS), substituir=True)
+        gravar_sqlite("trilha", pd.DataFrame(columns=COLUNAS_TRILHA), substituir=True)
+        gravar_sqlite("treinamentos", pd.DataFrame(columns=COLUNAS_TREINAMENTOS), substituir=True)
+        feeds_treinamentos().sincronizar() # Retira os .ics publicados
+        st.success("✅ Registros de ATIVIDADES, progresso de TRILHAS e calendário de TREINAMENTOS foram apagados.")
+        st.rerun()
+
+    if os.path.exists(CSV_FILE):
+        with trava_arquivo(CSV_FILE): # Uma compactação em andamento desiste ao ver o log trocado
+            for arquivo in (REGISTROS_COMPACTADOS, REGISTROS_ATUAL, CSV_FILE):
+                if os.path.exists(arquivo):
+                    os.remove(arquivo)
+        st.success("✅ Registros de ATIVIDADES foram apagados.")
+    
+    if os.path.exists(TRILHA_BITS) or os.path.exists(TRILHA_FILE):
+        for arquivo in (TRILHA_BITS, TRILHA_FILE):
+            if os.path.exists(arquivo):
+                os.remove(arquivo)
+        st.success("✅ Progresso de TRILHAS foi apagado.")
+        
+    if os.path.exists(TREINAMENTOS_FILE):
+        os.remove(TREINAMENTOS_FILE)
+        st.success("✅ Calendário de TREINAMENTOS foi apagado.")
+    
+    invalidar_cache(CSV_FILE, TRILHA_BITS, TREINAMENTOS_FILE)
+    feeds_treinamentos().sincronizar()
+    st.rerun()
+
+# --- Funções de Apoio (CRUD) ---
+def get_base64_of_bin_file(bin_file):
+    file_path = os.path.abspath(bin_file)
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        return base64.b64encode(data).decode()
+    except Exception as e:
+        st.error(f"Erro ao carregar imagem: {bin_file}, {e}")
+        return ""
+
+# --- IMAGENS DE FUNDO DA HOME ---
+# As imagens originais têm mais de 1,5 MB juntas. Geramos (uma vez por versão do arquivo)
+# variantes menores em WebP e JPEG progressivo dentro de STATIC_DIR, que o Streamlit
+# serve em "app/static/..." quando server.enableStaticServing está ligado.
+STATIC_DIR = "static"
+LARGURAS_FUNDO = {
+    "fundo.jpg": (1280, 1920),        # Desktop: 1x e 2x / telas grandes
+    "fundocelular.jpg": (540, 1080),  # Celular: 1x e 2x
+}
+
+def gerar_variantes_imagem(imagem, larguras):
+    """Gera as variantes redimensionadas da imagem e retorna {largura: {"webp": caminho, "jpg": caminho}}."""
+    from PIL import Image # Pillow já é dependência do Streamlit; só a Home precisa dele
+
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    nome = os.path.splitext(os.path.basename(imagem))[0]
+    mtime_origem = os.path.getmtime(imagem)
+    variantes = {}
+
+    with Image.open(imagem) as arquivo_imagem:
+        original = arquivo_imagem.convert("RGB")
+        for largura in larguras:
+            largura = min(largura, original.width) # Nunca ampliar a imagem
+            arquivos = {
+                "webp": os.path.join(STATIC_DIR, f"{nome}-{largura}.webp"),
+                "jpg": os.path.join(STATIC_DIR, f"{nome}-{largura}.jpg"),
+            }
+            variantes[largura] = arquivos
+            if all(os.path.exists(c) and os.path.getmtime(c) >= mtime_origem for c in arquivos.values()):
+                continue
+
+            altura = round(original.height * largura / original.width)
+            reduzida = original.resize((largura, altura), Image.LANCZOS)
+            for formato, caminho in arquivos.items():
+                # Um temporário por thread: sessões que abrem a Home juntas rodam no mesmo processo
+                temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+                if formato == "webp":
+                    reduzida.save(temporario, "WEBP", quality=75, method=6)
+                else:
+                    reduzida.save(temporario, "JPEG", quality=78, optimize=True, progressive=True)
+                os.replace(temporario, caminho) # Outra sessão nunca vê o arquivo pela metade
+
+    return variantes
+
+def _css_fundo(variantes, servir_estatico):
+    """Monta as declarações background-image para um conjunto de variantes."""
+    larguras = sorted(variantes)
+    menor, maior = variantes[larguras[0]], variantes[larguras[-1]]
+    if not servir_estatico:
+        # Sem static serving, embutimos só a menor variante WebP (dezenas de KB, não MB)
+        return f'background-image: url("data:image/webp;base64,{get_base64_of_bin_file(menor["webp"])}");'
+
+    def url(caminho):
+        return f"app/static/{os.path.basename(caminho)}"
+
+    return (
+        f'background-image: url("{url(menor["jpg"])}");\n'
+        f'            background-image: image-set(url("{url(menor["webp"])}") 1x, url("{url(maior["webp"])}") 2x);'
+    )
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _montar_css_home(desktop_img, mobile_img, assinaturas, servir_estatico):
+    variantes_desktop = gerar_variantes_imagem(desktop_img, LARGURAS_FUNDO.get(desktop_img, (1280, 1920)))
+    variantes_mobile = gerar_variantes_imagem(mobile_img, LARGURAS_FUNDO.get(mobile_img, (540, 1080)))
+    fundo_desktop = _css_fundo(variantes_desktop, servir_estatico)
+    fundo_mobile = _css_fundo(variantes_mobile, servir_estatico)
+
+    if servir_estatico:
+        maior_desktop = variantes_desktop[max(variantes_desktop)]["webp"]
+        fundo_desktop_grande = f'background-image: url("app/static/{os.path.basename(maior_desktop)}");'
+    else:
+        fundo_desktop_grande = ""
+
+    # CSS Padrão (Mobile primeiro, Desktop na media query)
+    css = f'''
+    <style>
+        /* Esconder sidebar na Home */
+        [data-testid="stSidebar"] {{
+            display: none;
+        }}
+        
+        /* Fundo Padrão (MOBILE) */
+        [data-testid="stAppViewContainer"] {{
+            {fundo_mobile}
+            background-size: cover;
+            background-position: center;
+            background-repeat: no-repeat;
+            background-attachment: scroll;
+        }}
+        
+        [data-testid="stHeader"] {{
+            background-color: transparent;
+        }}
+        
+        h1, h2, h3, p {{
+            color: black !important;
+            text-shadow: none !important;
+        }}
+        
+        div[data-testid="stButton"] > button {{
+            background-color: #FFFFFF;
+            border: 1px solid #DDDDDD;
+            border-radius: 10px;
+            font-weight: bold;
+        }}
+        
+        div[data-testid="stButton"] > button > div > span {{
+            color: #000000 !important;
+            text-shadow: none !important;
+            filter: none !important;
+        }}
+        
+        div[data-testid="stButton"] > button:hover {{
+            background-color: #EEEEEE;
+            color: #000000 !important;
+            border: 1px solid #CCCCCC;
+        }}
+
+        /* --- AJUSTE DE POSIÇÃO DOS BOTÕES --- */
+        .button-container {{
+            /* Posição para Celular: 45% da altura (mais para cima) */
+            margin-top: 45vh;
+        }}
+        
+        /* Media Query para DESKTOP (Min-width) */
+        @media (min-width: 701px) {{
+            /* Fundo Desktop */
+            [data-testid="stAppViewContainer"] {{
+                {fundo_desktop}
+            }}
+
+            /* Posição para Desktop: 55% da altura da tela */
+            .button-container {{
+                margin-top: 55vh; 
+            }}
+        }}
+
+        /* Telas grandes: variante de maior resolução */
+        @media (min-width: 1400px) {{
+            [data-testid="stAppViewContainer"] {{
+                {fundo_desktop_grande}
+            }}
+        }}
+    </style>
+    '''
+    return css
+
+def get_home_page_css(desktop_img, mobile_img):
+    """Gera o CSS com Media Query para trocar APENAS o fundo (cacheado entre sessões)."""
+    servir_estatico = bool(st.get_option("server.enableStaticServing"))
+    assinaturas = (assinatura_arquivo(desktop_img), assinatura_arquivo(mobile_img))
+    return _montar_css_home(desktop_img, mobile_img, assinaturas, servir_estatico)
+
+# --- CACHE DE GRÁFICOS DO PAINEL DE INDICADORES ---
+# Qualquer widget reexecuta a página inteira. Os gráficos do painel ficam guardados já
+# serializados (JSON do Plotly), pela versão dos dados que usam e pelos filtros que os
+# afetam: sem mudança nos dados nem nesses filtros, nem a agregação nem o px.* rodam de
+# novo. O cache é compartilhado entre as sessões, descarta primeiro os gráficos usados há
+# mais tempo (LRU) e nunca passa de LIMITE_CACHE_GRAFICOS bytes.
+LIMITE_CACHE_GRAFICOS = 16 * 1024 * 1024
+
+class CacheDeGraficos:
+    """Especificações JSON das figuras, em ordem de uso (a mais recente no fim)."""
+    def __init__(self, limite):
+        self._lock = threading.Lock()
+        self._limite = limite
+        self._graficos = OrderedDict() # chave -> bytes do JSON (None: gráfico sem dados)
+        self.tamanho = 0
+        self.acertos = 0
+        self.faltas = 0
+
+    def _guardar(self, chave, spec):
+        tamanho = len(spec or b'')
+        if chave in self._graficos or tamanho > self._limite:
+            return
+        self._graficos[chave] = spec
+        self.tamanho += tamanho
+        while self.tamanho > self._limite:
+            _, antigo = self._graficos.popitem(last=False)
+            self.tamanho -= len(antigo or b'')
+
+    def obter(self, chave, construir):
+        """Figura (dict) da chave; 'construir()' -> figura ou None só roda se ela não estiver no cache."""
+        with self._lock:
+            if chave in self._graficos:
+                self._graficos.move_to_end(chave)
+                self.acertos += 1
+                spec = self._graficos[chave]
+                return None if spec is None else json.loads(spec)
+        import plotly.io as pio # Só o Painel de Indicadores precisa dele
+
+        figura = construir() # Fora da trava: as outras sessões não esperam o Plotly
+        spec = None if figura is None else pio.to_json(figura, validate=False).encode('utf-8')
+        with self._lock:
+            self.faltas += 1
+            self._guardar(chave, spec)
+        return None if spec is None else json.loads(spec)
+
+    def resumo(self):
+        with self._lock:
+            return {'graficos': len(self._graficos), 'tamanho': self.tamanho, 'limite': self._limite,
+                    'acertos': self.acertos, 'faltas': self.faltas}
+
+@st.cache_resource(show_spinner=False)
+def cache_de_graficos():
+    return CacheDeGraficos(LIMITE_CACHE_GRAFICOS)
+
+def grafico_em_cache(nome, versoes, filtros, construir):
+    """Figura do gráfico 'nome' para (versões dos dados, filtros), montada por 'construir' na primeira vez."""
+    return cache_de_graficos().obter((nome, versoes, filtros), construir)
+
+# --- ACESSO AOS DADOS POR PÁGINA (SOB DEMANDA) ---
+# Cada conjunto de dados só é carregado quando a página o usa pela primeira vez na
+# execução (a Home não lê nenhum). O tempo de cada carga é registrado por página.
+class DadosDaPagina:
+    """Conjuntos de dados da página atual: 'dados.base', 'dados.registros', etc."""
+
+    CARREGADORES = {
+        'base': initialize_base,
+        'registros': initialize_data,
+        'trilha': lambda dados: initialize_trilha(dados.base),
+        'treinamentos': initialize_treinamentos,
+        'calendario': calendario_treinamentos,
+        'feedback': initialize_feedback,
+        'somar': cubo_somar,
+        'prazos_trilha': trilha_calculada,
+    }
+    DEPENDENCIAS = {'trilha': ['base']}
+
+    def __init__(self, pagina):
+        self.pagina = pagina
+        self._carregados = {}
+
+    def __getattr__(self, nome):
+        if nome.startswith('_') or nome not in self.CARREGADORES:
+            raise AttributeError(nome)
+        if nome not in self._carregados:
+            for dependencia in self.DEPENDENCIAS.get(nome, []): # Fora da medição deste conjunto
+                getattr(self, dependencia)
+            carregador = self.CARREGADORES[nome]
+            inicio = perf_counter()
+            self._carregados[nome] = carregador(self) if nome in self.DEPENDENCIAS else carregador()
+            registrar_tempo_carga(self.pagina, nome, perf_counter() - inicio)
+        return self._carregados[nome]
+
+@st.cache_resource(show_spinner=False)
+def _tempos_de_carga():
+    return {'lock': threading.Lock(), 'medicoes': {}}
+
+def registrar_tempo_carga(pagina, conjunto, segundos):
+    tempos = _tempos_de_carga()
+    with tempos['lock']:
+        m = tempos['medicoes'].setdefault((pagina, conjunto), {'cargas': 0, 'total': 0.0, 'maximo': 0.0, 'ultimo': 0.0})
+        m['cargas'] += 1
+        m['total'] += segundos
+        m['maximo'] = max(m['maximo'], segundos)
+        m['ultimo'] = segundos
+
+def tempos_de_carga():
+    """Tabela com os tempos de carga (ms) por página e conjunto de dados, desde o início do processo."""
+    tempos = _tempos_de_carga()
+    with tempos['lock']:
+        linhas = [{
+            'Página': pagina, 'Dados': conjunto, 'Cargas': m['cargas'],
+            'Média (ms)': 1000 * m['total'] / m['cargas'], 'Máximo (ms)': 1000 * m['maximo'], 'Última (ms)': 1000 * m['ultimo']
+        } for (pagina, conjunto), m in tempos['medicoes'].items()]
+    return pd.DataFrame(linhas, columns=['Página', 'Dados', 'Cargas', 'Média (ms)', 'Máximo (ms)', 'Última (ms)'])